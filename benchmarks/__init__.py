@@ -0,0 +1,17 @@
+"""
+Benchmarks and load testing tools, which stand in for the display and the MLB API.
+
+See `python -m benchmarks --help` and `python -m benchmarks.server --help`.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+FIXTURES_DIRECTORY = Path(__file__).parent / "fixtures"
+
+
+def fixture(name: str) -> Any:
+    """A recorded API response from `benchmarks/fixtures/`"""
+    with open(FIXTURES_DIRECTORY / f"{name}.json") as f:
+        return json.load(f)
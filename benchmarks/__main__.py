@@ -0,0 +1,193 @@
+"""
+Benchmarks drawing every screen on every supported matrix size.
+
+Screens are drawn with the headless driver from recorded game, standings and news
+fixtures, so the results only measure our own rendering. For each layout and screen
+this reports how long a frame takes to draw, how many calls it makes to the driver,
+and how much memory it allocates. The results are JSON, to be compared between releases.
+
+Game screens are drawn into a FrameBuffer, which reaches the driver as a single SetImage
+a frame, so what they draw into it is counted too, as "FrameBuffer.DrawText" and so on.
+
+Usage:
+  python -m benchmarks                              # every screen on every layout, to stdout
+  python -m benchmarks --frames 500                 # draw more frames of each
+  python -m benchmarks --layouts w64h32 --screens live final
+  python -m benchmarks --output benchmarks.json
+"""
+
+import driver
+from driver.mode import DriverMode
+
+# The renderers pick up the driver's graphics when they are imported, so this has to come first
+driver.set_mode(DriverMode.HEADLESS)
+
+import argparse
+import functools
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Sequence
+
+from driver.null import instruments
+from renderers.framebuffer import FRAMEBUFFER_GRAPHICS, FrameBuffer
+
+from benchmarks.screens import SCREENS, Frame, load_config, setup, supported
+
+COORDINATES_DIRECTORY = Path(__file__).parent.parent / "coordinates"
+
+DEFAULT_FRAMES = 200
+# Frames drawn before measuring, so caches are warm as they would be on a running scoreboard
+WARMUP_FRAMES = 5
+
+# The drawing calls counted when they draw into a FrameBuffer
+FRAMEBUFFER_METHODS = ["Fill", "Clear", "SetPixel", "SetImage", "fill_rect"]
+FRAMEBUFFER_GRAPHICS_FUNCTIONS = ["DrawText", "DrawLine", "DrawCircle"]
+
+
+def layouts() -> list[str]:
+    """The sizes with a layout shipped in coordinates/, smallest first"""
+    names = [file.name.split(".")[0] for file in COORDINATES_DIRECTORY.glob("w*h*.example.json")]
+    return sorted(names, key=_dimensions)
+
+
+def _dimensions(layout: str) -> tuple[int, int]:
+    width, height = layout[1:].split("h")
+    return int(width), int(height)
+
+
+def count_framebuffer_calls() -> None:
+    """
+    Counts drawing into a FrameBuffer with the driver's calls. Only the outermost call is counted,
+    so a line drawn as a filled box counts as a DrawLine and not also as a fill_rect.
+    """
+    drawing = False
+
+    def counted(name, draw):
+        @functools.wraps(draw)
+        def wrapper(canvas, *args, **kwargs):
+            nonlocal drawing
+            if drawing or not isinstance(canvas, FrameBuffer):
+                return draw(canvas, *args, **kwargs)
+            instruments.count(f"FrameBuffer.{name}")
+            drawing = True
+            try:
+                return draw(canvas, *args, **kwargs)
+            finally:
+                drawing = False
+
+        return wrapper
+
+    for name in FRAMEBUFFER_METHODS:
+        setattr(FrameBuffer, name, counted(name, getattr(FrameBuffer, name)))
+    for name in FRAMEBUFFER_GRAPHICS_FUNCTIONS:
+        setattr(FRAMEBUFFER_GRAPHICS, name, counted(name, getattr(FRAMEBUFFER_GRAPHICS, name)))
+
+
+def measure(frame: Frame, frames: int) -> dict:
+    for _ in range(WARMUP_FRAMES):
+        frame()
+
+    latencies = []
+    instruments.reset()
+    instruments.counting = True
+    try:
+        for _ in range(frames):
+            start = time.perf_counter_ns()
+            frame()
+            latencies.append((time.perf_counter_ns() - start) / 1e6)
+    finally:
+        instruments.counting = False
+    calls = dict(instruments.calls)
+    instruments.reset()
+
+    # tracing allocations slows drawing down a lot, so they are measured separately from the timings
+    allocations = []
+    tracemalloc.start()
+    try:
+        for _ in range(frames):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            frame()
+            _, peak = tracemalloc.get_traced_memory()
+            allocations.append(peak - before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "frames": frames,
+        "latency_ms": _summary(latencies),
+        "draw_calls_per_frame": {name: count / frames for name, count in sorted(calls.items())},
+        "alloc_bytes_per_frame": _summary(allocations),
+    }
+
+
+def _summary(values: Sequence[float]) -> dict:
+    ordered = sorted(values)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": _percentile(ordered, 50),
+        "p90": _percentile(ordered, 90),
+        "p99": _percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+def _percentile(ordered: Sequence[float], percent: int) -> float:
+    # nearest rank
+    return ordered[max(round(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def run(layout_names: list[str], screens: list[str], frames: int) -> dict:
+    results = []
+    for layout in layout_names:
+        config = load_config(*_dimensions(layout))
+        for screen in screens:
+            if not supported(screen, config):
+                print(f"Skipping {screen}, which {layout} has no layout for", file=sys.stderr)
+                continue
+            print(f"Drawing {frames} frames of {screen} on {layout}", file=sys.stderr)
+            results.append({"layout": layout, "screen": screen} | measure(setup(screen, config), frames))
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "frames": frames,
+            "warmup_frames": WARMUP_FRAMES,
+        },
+        "results": results,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark drawing every screen on every supported matrix size.")
+    parser.add_argument(
+        "--frames", type=int, default=DEFAULT_FRAMES, help=f"frames to draw of each screen (default: {DEFAULT_FRAMES})"
+    )
+    parser.add_argument(
+        "--layouts", nargs="+", choices=layouts(), default=layouts(), metavar="LAYOUT", help="e.g. w64h32"
+    )
+    parser.add_argument("--screens", nargs="+", choices=SCREENS, default=list(SCREENS), metavar="SCREEN")
+    parser.add_argument("--output", type=Path, help="write the results here instead of to stdout")
+    args = parser.parse_args()
+
+    if args.frames < 1:
+        parser.error("--frames must be at least 1")
+
+    count_framebuffer_calls()
+
+    results = json.dumps(run(args.layouts, args.screens, args.frames), indent=2)
+    if args.output:
+        args.output.write_text(results + "\n")
+    else:
+        print(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
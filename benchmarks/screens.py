@@ -0,0 +1,156 @@
+"""
+The screens the benchmarks draw, set up from the recorded fixtures.
+
+Each screen is set up once per layout and then drawn a frame at a time, exactly as
+`MainRenderer` would draw it. Nothing here touches the network: every request the
+scoreboard would make to the Stats API is answered from `benchmarks/fixtures/`.
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
+from unittest.mock import patch
+
+import driver
+from benchmarks import fixture
+from data.config import Config
+from data.game import Game
+from data.uniforms import Uniforms
+from renderers.main import MainRenderer
+from mlb_led_scoreboard_news.config import Config as NewsConfig
+from mlb_led_scoreboard_news.data import NewsData
+from mlb_led_scoreboard_news.headlines import Headlines
+from mlb_led_scoreboard_news.renderer import Renderer as NewsRenderer
+from mlb_led_scoreboard_news.weather import Weather
+from mlb_led_scoreboard_standings.config import Config as StandingsConfig
+from mlb_led_scoreboard_standings.renderer import Renderer as StandingsRenderer
+from mlb_led_scoreboard_standings.standings import Standings
+
+BENCHMARKS_DIRECTORY = Path(__file__).parent
+
+GAME_ID = 745444
+
+# The game feed each game screen is drawn from
+GAME_SCREENS = {
+    "pregame": "game_pregame",
+    "live": "game_live",
+    "inning_break": "game_inning_break",
+    "final": "game_final",
+    "irregular": "game_irregular",
+}
+PLUGIN_SCREENS = ("news", "standings", "bracket")
+SCREENS = tuple(GAME_SCREENS) + PLUGIN_SCREENS
+
+# Draws one frame
+Frame = Callable[[], None]
+
+
+@contextmanager
+def recorded_api(game: str = GAME_SCREENS["live"]) -> Iterator[None]:
+    """Answers Stats API requests from the fixtures, with `game` as the game feed."""
+
+    def get(endpoint, params, **kwargs):
+        if endpoint == "game":
+            return fixture(game)
+        if endpoint == "standings":
+            return fixture("standings_" + params["standingsTypes"])
+        if endpoint in ("season", "schedule_postseason_series"):
+            return fixture(endpoint)
+        raise ValueError(f"No fixture recorded for the '{endpoint}' endpoint")
+
+    # final games are saved to the cache, which the benchmarks should leave alone
+    with patch("statsapi.get", side_effect=get), patch("data.game.game_cache.save"):
+        yield
+
+
+def load_config(width: int, height: int) -> Config:
+    """The scoreboard's config for a matrix of the given size, using `benchmarks/config.json`."""
+    argv = [
+        "benchmarks",
+        "--led-cols",
+        str(width),
+        "--led-rows",
+        str(height),
+        "--config",
+        str(BENCHMARKS_DIRECTORY / "config"),
+    ]
+    with patch.object(sys, "argv", argv), recorded_api():
+        return Config()
+
+
+def supported(screen: str, config: Config) -> bool:
+    """Whether the layout has a place for `screen`. Not every size has a postseason bracket."""
+    if screen == "bracket":
+        return "postseason" in config.layout.json.get("standings", {})
+    return True
+
+
+def setup(screen: str, config: Config) -> Frame:
+    """Prepares `screen` to be drawn, returning a function that draws the next frame of it."""
+    matrix = driver.RGBMatrix(options=config.matrix_options)
+    if screen in GAME_SCREENS:
+        return _game_screen(matrix, config, GAME_SCREENS[screen])
+    if screen == "news":
+        cfg, layout, colors = _plugin("news", NewsConfig, config)
+        return _plugin_screen(matrix, NewsRenderer(cfg, layout, colors), _news_data(cfg))
+    if screen == "standings":
+        cfg, layout, colors = _plugin("standings", StandingsConfig, config)
+        with recorded_api():
+            standings = Standings(cfg)
+        return _plugin_screen(matrix, StandingsRenderer(cfg, layout, colors), standings)
+    if screen == "bracket":
+        cfg, layout, colors = _plugin("standings", StandingsConfig, config, is_postseason=lambda: True)
+        with recorded_api():
+            standings = Standings(cfg)
+        return _plugin_screen(matrix, StandingsRenderer(cfg, layout, colors), standings)
+    raise ValueError(f"Unknown screen '{screen}'")
+
+
+def _game_screen(matrix, config: Config, feed: str) -> Frame:
+    game = Game(GAME_ID, "2024-06-14", [], "", config, uniforms=Uniforms.from_known(GAME_ID, None, None))
+    with recorded_api(feed):
+        game.update(force=True)
+    # all the renderer needs of the scoreboard's data
+    data: Any = SimpleNamespace(config=config, network_issues=False)
+    renderer = MainRenderer(matrix, data, {})
+
+    def frame():
+        # every frame is drawn in full, rather than skipped when nothing on it moved
+        renderer._frame_key = None
+        config.layout.state_for_game(game)
+        renderer._MainRenderer__draw_game(game)
+
+    return frame
+
+
+def _plugin_screen(matrix, renderer, data) -> Frame:
+    state = SimpleNamespace(canvas=matrix.CreateFrameCanvas(), pos=matrix.width)
+
+    def frame():
+        pos = renderer.render(data, state.canvas, driver.graphics, state.pos)
+        state.pos = state.pos - 1 if pos and state.pos + pos > 0 else matrix.width
+        state.canvas = matrix.SwapOnVSync(state.canvas)
+
+    return frame
+
+
+def _plugin(name: str, config_class, config: Config, **overrides):
+    plugin_config: Any = config.for_plugin(name)
+    plugin_config = plugin_config._replace(**overrides)
+    return (
+        config_class(plugin_config),
+        config.layout.for_plugin(name),
+        config.scoreboard_colors.for_plugin(name),
+    )
+
+
+def _news_data(config: NewsConfig) -> NewsData:
+    """The news plugin's data, filled in from the fixture instead of the weather API and news feeds"""
+    recorded = fixture("news")
+    with patch.object(Weather, "update"), patch.object(Headlines, "update"):
+        data = NewsData(config)
+    vars(data.weather).update(recorded["weather"])
+    data.headlines.ticker = recorded["headlines"]
+    return data
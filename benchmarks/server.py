@@ -0,0 +1,259 @@
+"""
+A stand-in for the parts of statsapi.mlb.com the scoreboard uses, for load and soak testing.
+
+It answers the `game`, `game_diff`, `schedule`, `game_uniforms`, `standings`, `season` and
+`schedule_postseason_series` endpoints, either from an archive made with `./main.py --record`
+or from a made-up day of games (see `benchmarks.synthetic`). Responses can be slowed down,
+turned into errors, or cut short, to see how the scoreboard copes.
+
+How often each endpoint has been polled, and what went wrong, can be seen at `/_stats`.
+
+Usage:
+  python -m benchmarks.server                                  # 4 made-up games, on port 8080
+  python -m benchmarks.server --games 15 --speed 10            # a busier day, played 10x faster
+  python -m benchmarks.server --replay gameday.jsonl.gz        # a recorded day
+  python -m benchmarks.server --latency 0.5 --jitter 0.25 --error-rate 0.05 --partial-rate 0.01
+
+Then point the scoreboard at it:
+  ./main.py --emulated --api-url http://localhost:8080
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, NamedTuple, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from bullpen.archive import Replayer
+from bullpen.http import STATSAPI_HOST
+from bullpen.logging import LOGGER
+
+from benchmarks import fixture
+from benchmarks.synthetic import Day
+
+DEFAULT_PORT = 8080
+DEFAULT_GAMES = 4
+
+# The endpoints we answer, by the paths `statsapi` requests them at
+ENDPOINTS = [
+    ("game_diff", re.compile(r"^/api/v1\.1/game/(?P<game_pk>\d+)/feed/live/diffPatch$")),
+    ("game", re.compile(r"^/api/v1\.1/game/(?P<game_pk>\d+)/feed/live$")),
+    ("schedule_postseason_series", re.compile(r"^/api/v1/schedule/postseason/series$")),
+    ("schedule", re.compile(r"^/api/v1/schedule$")),
+    ("game_uniforms", re.compile(r"^/api/v1/uniforms/game$")),
+    ("standings", re.compile(r"^/api/v1/standings$")),
+    ("season", re.compile(r"^/api/v1/seasons/(?P<season_id>\d+)$")),
+]
+
+# Status codes for injected errors
+ERROR_STATUSES = (500, 502, 503)
+
+
+class Faults(NamedTuple):
+    # seconds added to every response, plus up to `jitter` more at random
+    latency: float = 0.0
+    jitter: float = 0.0
+    # chance of a response being an error, or being cut off partway through
+    error_rate: float = 0.0
+    partial_rate: float = 0.0
+
+
+class Stats:
+    """How many requests each endpoint got, and what was done to them"""
+
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._counts: dict[str, Counter[str]] = defaultdict(Counter)
+
+    def count(self, endpoint: str, outcome: str) -> None:
+        with self._lock:
+            self._counts[endpoint]["requests"] += 1
+            self._counts[endpoint][outcome] += 1
+
+    def summary(self) -> dict[str, Any]:
+        uptime = time.time() - self.started
+        with self._lock:
+            endpoints = {
+                endpoint: dict(counts) | {"per_minute": counts["requests"] / max(uptime / 60, 1 / 60)}
+                for endpoint, counts in sorted(self._counts.items())
+            }
+        return {"uptime_seconds": uptime, "endpoints": endpoints}
+
+
+class Synthetic:
+    """Answers from a made-up day of games, played out in real time multiplied by `speed`"""
+
+    def __init__(self, day: date, games: int, speed: float = 1.0, seed: int = 0) -> None:
+        self.started = time.time()
+        self.speed = speed
+        self.day = Day(day, datetime.now().astimezone(), games, seed)
+
+    def now(self) -> float:
+        """Simulated seconds since the server started"""
+        return (time.time() - self.started) * self.speed
+
+    def respond(self, endpoint: str, params: dict[str, Any], query: dict[str, str]) -> tuple[int, Any]:
+        now = self.now()
+        if endpoint in ("game", "game_diff"):
+            game_pk = int(params["game_pk"])
+            if game_pk not in self.day.games:
+                return 404, {"message": f"Game {game_pk} not found"}
+            feed = self.day.game(game_pk, now)
+            if endpoint == "game":
+                return 200, feed
+            if query.get("startTimecode") == feed["metaData"]["timeStamp"]:
+                return 200, []
+            # everything we serve is replaced, rather than working out what actually changed
+            return 200, [{"diff": [{"op": "replace", "path": f"/{key}", "value": feed[key]} for key in feed]}]
+        if endpoint == "schedule":
+            return 200, self.day.schedule(now)
+        if endpoint == "game_uniforms":
+            return 200, {"uniforms": [{"home": {"uniformAssets": []}, "away": {"uniformAssets": []}}]}
+        if endpoint == "standings":
+            return 200, fixture("standings_" + query.get("standingsTypes", "regularSeason"))
+        if endpoint == "season":
+            return 200, _season(int(params["season_id"]))
+        return 200, fixture(endpoint)
+
+
+class Replay:
+    """Answers from an archive made with `--record`"""
+
+    def __init__(self, path: str) -> None:
+        self.replayer = Replayer(path)
+
+    def respond_raw(self, path: str) -> tuple[int, bytes]:
+        response = self.replayer.response(STATSAPI_HOST + path)
+        return response.status_code, response.content
+
+
+class StandIn:
+    def __init__(self, source: "Synthetic | Replay", faults: Faults, seed: int = 0) -> None:
+        self.source = source
+        self.faults = faults
+        self.stats = Stats()
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+    def handle(self, path_and_query: str) -> tuple[int, bytes]:
+        """The status and body of the response to a request for `path_and_query`"""
+        url = urlsplit(path_and_query)
+        if url.path == "/_stats":
+            return 200, json.dumps(self.stats.summary(), indent=2).encode()
+
+        endpoint, params = _route(url.path)
+        if endpoint is None:
+            self.stats.count("unknown", "not_found")
+            return 404, json.dumps({"message": f"Unknown endpoint {url.path}"}).encode()
+
+        with self._random_lock:
+            delay = self.faults.latency + self._random.uniform(0, self.faults.jitter)
+            error = self._random.random() < self.faults.error_rate
+            partial = self._random.random() < self.faults.partial_rate
+            cut = self._random.random()
+        time.sleep(delay)
+
+        if error:
+            status = ERROR_STATUSES[int(cut * len(ERROR_STATUSES))]
+            self.stats.count(endpoint, "injected_error")
+            return status, json.dumps({"message": "Injected error"}).encode()
+
+        if isinstance(self.source, Replay):
+            status, body = self.source.respond_raw(path_and_query)
+        else:
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            status, content = self.source.respond(endpoint, params, query)
+            body = json.dumps(content).encode()
+
+        if partial:
+            self.stats.count(endpoint, "injected_partial")
+            return status, body[: int(cut * len(body))]
+        self.stats.count(endpoint, str(status))
+        return status, body
+
+
+def _route(path: str) -> tuple[Optional[str], dict[str, Any]]:
+    for endpoint, pattern in ENDPOINTS:
+        if match := pattern.match(path):
+            return endpoint, match.groupdict()
+    return None, {}
+
+
+def _season(year: int) -> dict[str, Any]:
+    return {
+        "seasons": [
+            {
+                "seasonId": str(year),
+                "regularSeasonStartDate": f"{year}-03-27",
+                "lastDate1stHalf": f"{year}-07-13",
+                "allStarDate": f"{year}-07-15",
+                "regularSeasonEndDate": f"{year}-09-28",
+                "postSeasonStartDate": f"{year}-09-30",
+                "postSeasonEndDate": f"{year}-11-01",
+            }
+        ]
+    }
+
+
+def make_server(stand_in: StandIn, host: str, port: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            status, body = stand_in.handle(self.path)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            LOGGER.debug("%s - %s", self.address_string(), format % args)
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stand in for the MLB Stats API, for load and soak testing.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=0, help="makes the games and injected faults repeatable")
+
+    source = parser.add_argument_group("made-up games (the default)")
+    source.add_argument("--games", type=int, default=DEFAULT_GAMES, help=f"(default: {DEFAULT_GAMES})")
+    source.add_argument("--speed", type=float, default=1.0, help="how many times faster than real time to play")
+    source.add_argument("--date", type=date.fromisoformat, default=date.today(), help="YYYY-MM-DD (default: today)")
+    parser.add_argument("--replay", metavar="ARCHIVE", help="answer from an archive made with ./main.py --record")
+
+    faults = parser.add_argument_group("faults")
+    faults.add_argument("--latency", type=float, default=0.0, help="seconds to wait before every response")
+    faults.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds, at random")
+    faults.add_argument("--error-rate", type=float, default=0.0, help="fraction of responses that are errors")
+    faults.add_argument("--partial-rate", type=float, default=0.0, help="fraction of responses that are cut off")
+    args = parser.parse_args()
+
+    stand_in = StandIn(
+        Replay(args.replay) if args.replay else Synthetic(args.date, args.games, args.speed, args.seed),
+        Faults(args.latency, args.jitter, args.error_rate, args.partial_rate),
+        args.seed,
+    )
+    server = make_server(stand_in, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_port}, stats at /_stats", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    print(json.dumps(stand_in.stats.summary(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
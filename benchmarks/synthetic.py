@@ -0,0 +1,277 @@
+"""
+A made-up day of games, for the stand-in Stats API server.
+
+Each game is simulated pitch by pitch from a seed, so the same seed always gives the same
+day. Games start a while apart and are played out in (optionally sped up) real time, so a
+scoreboard polling the server sees them go from pregame, through every inning, to final.
+"""
+
+import copy
+import random
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, NamedTuple, Optional
+
+from benchmarks import fixture
+
+# Simulated seconds from the start of the day until the first game's first pitch
+FIRST_PITCH = 10 * 60
+# Simulated seconds between one game's first pitch and the next's
+STAGGER = 20 * 60
+# Simulated seconds per pitch, and between half innings
+PITCH_SECONDS = 20
+BREAK_SECONDS = 2 * 60
+# Games are only shown as pregame within this many seconds of the first pitch
+PREGAME_SECONDS = 60 * 60
+
+REGULATION_INNINGS = 9
+MAX_INNINGS = 15
+
+# id, abbreviation, name, with the home team second
+MATCHUPS = [
+    ((147, "NYY", "Yankees"), (111, "BOS", "Red Sox")),
+    ((112, "CHC", "Cubs"), (158, "MIL", "Brewers")),
+    ((119, "LAD", "Dodgers"), (135, "SD", "Padres")),
+    ((144, "ATL", "Braves"), (143, "PHI", "Phillies")),
+    ((117, "HOU", "Astros"), (140, "TEX", "Rangers")),
+    ((121, "NYM", "Mets"), (138, "STL", "Cardinals")),
+    ((114, "CLE", "Guardians"), (116, "DET", "Tigers")),
+    ((137, "SF", "Giants"), (109, "AZ", "D-backs")),
+]
+
+# batting orders and starting pitchers, from the players in the recorded game feed
+AWAY_LINEUP = [592450, 665742, 683011]
+HOME_LINEUP = [646240, 678882, 680776]
+AWAY_PITCHER = 543037
+HOME_PITCHER = 678394
+
+
+class Moment(NamedTuple):
+    """Everything about a game that can change, from one pitch to the next"""
+
+    inning: int
+    state: str
+    balls: int
+    strikes: int
+    outs: int
+    bases: tuple[bool, bool, bool]
+    runs: tuple[int, int]
+    hits: tuple[int, int]
+    # index into the batting team's lineup
+    batter: int
+    event: str
+    final: bool = False
+
+
+class Game:
+    def __init__(self, game_pk: int, index: int, seed: int) -> None:
+        self.game_pk = game_pk
+        self.away, self.home = MATCHUPS[index % len(MATCHUPS)]
+        self.first_pitch = FIRST_PITCH + index * STAGGER
+        self._times, self._moments = _play(random.Random(f"{seed}-{game_pk}"))
+
+    def moment(self, now: float) -> Optional[Moment]:
+        """Where the game is `now` simulated seconds into the day, or None if it hasn't started"""
+        if now < self.first_pitch:
+            return None
+        return self._moments[bisect_right(self._times, now - self.first_pitch) - 1]
+
+    def changed_at(self, now: float) -> float:
+        """When the game last changed, as of `now`"""
+        if now < self.first_pitch:
+            return 0.0
+        return self.first_pitch + self._times[bisect_right(self._times, now - self.first_pitch) - 1]
+
+
+class Day:
+    def __init__(self, day: date, start: datetime, games: int, seed: int = 0) -> None:
+        """`day` is the games' date on the schedule, and `start` is when the simulated day begins"""
+        self.date = day
+        self.start = start
+        self.games = {game.game_pk: game for game in (Game(800000 + i, i, seed) for i in range(games))}
+        self._pregame = fixture("game_pregame")
+        self._live = fixture("game_live")
+
+    def schedule(self, now: float) -> dict[str, Any]:
+        games = []
+        for game in self.games.values():
+            moment = game.moment(now)
+            entry: dict[str, Any] = {
+                "gamePk": game.game_pk,
+                "gameDate": self.__iso(game.first_pitch),
+                "status": self.__status(game, now),
+                "teams": {
+                    "away": {"team": {"id": game.away[0]}},
+                    "home": {"team": {"id": game.home[0]}},
+                },
+            }
+            if moment is not None:
+                entry["teams"]["away"]["score"], entry["teams"]["home"]["score"] = moment.runs
+                entry["linescore"] = {"currentInning": moment.inning, "inningState": moment.state}
+            games.append(entry)
+        return {"dates": [{"date": self.date.isoformat(), "games": games}]}
+
+    def game(self, game_pk: int, now: float) -> dict[str, Any]:
+        game = self.games[game_pk]
+        moment = game.moment(now)
+        feed: dict[str, Any] = copy.deepcopy(self._pregame if moment is None else self._live)
+        game_data, live_data = feed["gameData"], feed["liveData"]
+
+        game_data["game"] = {
+            "pk": game_pk,
+            "id": f"{self.date:%Y/%m/%d}/{game.away[1].lower()}mlb-{game.home[1].lower()}mlb-1",
+        }
+        game_data["datetime"] = {"dateTime": self.__iso(game.first_pitch), "officialDate": self.date.isoformat()}
+        game_data["status"] = self.__status(game, now)
+        for side, (team_id, abbreviation, name) in (("away", game.away), ("home", game.home)):
+            game_data["teams"][side].update(id=team_id, abbreviation=abbreviation, teamName=name)
+        feed["metaData"]["timeStamp"] = self.timestamp(game_pk, now)
+
+        if moment is None:
+            return feed
+
+        linescore = live_data["linescore"]
+        linescore.update(
+            currentInning=moment.inning,
+            currentInningOrdinal=_ordinal(moment.inning),
+            inningState=moment.state,
+            balls=moment.balls,
+            strikes=moment.strikes,
+            outs=moment.outs,
+        )
+        for side, runs, hits in (("away", moment.runs[0], moment.hits[0]), ("home", moment.runs[1], moment.hits[1])):
+            linescore["teams"][side] = {"runs": runs, "hits": hits, "errors": 0}
+
+        # between half innings, the offense is the team due up next
+        batting_home = moment.state in ("Bottom", "Middle")
+        lineup = HOME_LINEUP if batting_home else AWAY_LINEUP
+        offense: dict[str, Any] = {
+            "batter": {"id": lineup[moment.batter % 3]},
+            "onDeck": {"id": lineup[(moment.batter + 1) % 3]},
+            "inHole": {"id": lineup[(moment.batter + 2) % 3]},
+        }
+        for base, occupied, runner in zip(("first", "second", "third"), moment.bases, (1, 2, 0)):
+            if occupied:
+                offense[base] = {"id": lineup[(moment.batter + runner) % 3]}
+        linescore["offense"] = offense
+        linescore["defense"] = {"pitcher": {"id": AWAY_PITCHER if batting_home else HOME_PITCHER}}
+
+        live_data["plays"]["currentPlay"]["result"]["eventType"] = moment.event
+        if moment.final:
+            away_won = moment.runs[0] > moment.runs[1]
+            live_data["decisions"] = {
+                "winner": {"id": AWAY_PITCHER if away_won else HOME_PITCHER},
+                "loser": {"id": HOME_PITCHER if away_won else AWAY_PITCHER},
+            }
+        return feed
+
+    def timestamp(self, game_pk: int, now: float) -> str:
+        """The game feed's `timeStamp`, which changes whenever anything in the game does"""
+        changed = self.start + timedelta(seconds=self.games[game_pk].changed_at(now))
+        return changed.astimezone(timezone.utc).strftime("%Y%m%d_%H%M%S")
+
+    def __status(self, game: Game, now: float) -> dict[str, str]:
+        moment = game.moment(now)
+        if moment is None:
+            if game.first_pitch - now > PREGAME_SECONDS:
+                return {"abstractGameState": "Preview", "detailedState": "Scheduled"}
+            return {"abstractGameState": "Preview", "detailedState": "Pre-Game"}
+        if moment.final:
+            return {"abstractGameState": "Final", "detailedState": "Final"}
+        return {"abstractGameState": "Live", "detailedState": "In Progress"}
+
+    def __iso(self, seconds: float) -> str:
+        return (self.start + timedelta(seconds=seconds)).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _play(rng: random.Random) -> tuple[list[float], list[Moment]]:
+    """Simulates a whole game, returning each moment in it and when it happened, from the first pitch"""
+    times: list[float] = []
+    moments: list[Moment] = []
+    runs = [0, 0]
+    hits = [0, 0]
+    batters = [0, 0]
+    now = 0.0
+    inning = 1
+
+    def happen(state, balls, strikes, outs, bases, batter, event):
+        times.append(now)
+        moments.append(
+            Moment(inning, state, balls, strikes, outs, tuple(bases), tuple(runs), tuple(hits), batter, event)
+        )
+
+    while True:
+        for half, (state, side) in enumerate((("Top", 0), ("Bottom", 1))):
+            if half == 1 and inning >= REGULATION_INNINGS and runs[1] > runs[0]:
+                break  # the home team doesn't need to bat
+
+            outs = balls = strikes = 0
+            bases = [False, False, False]
+            event = ""
+            while outs < 3:
+                happen(state, balls, strikes, outs, bases, batters[side], event)
+                now += PITCH_SECONDS
+                event = ""
+                pitch = rng.random()
+                if pitch < 0.36:
+                    balls += 1
+                    if balls == 4:
+                        event = "walk"
+                        runs[side] += _advance(bases, forced=True)
+                elif pitch < 0.66 or (pitch < 0.8 and strikes < 2):
+                    strikes += 1
+                    if strikes == 3:
+                        event = "strikeout"
+                        outs += 1
+                elif pitch < 0.8:
+                    continue  # a foul with two strikes
+                elif pitch < 0.93:
+                    event = "field_out"
+                    outs += 1
+                else:
+                    event = "single" if pitch < 0.985 else "home_run"
+                    hits[side] += 1
+                    runs[side] += _advance(bases, forced=False, home_run=event == "home_run")
+
+                if event:
+                    balls = strikes = 0
+                    batters[side] += 1
+                if side == 1 and inning >= REGULATION_INNINGS and runs[1] > runs[0]:
+                    break  # walk-off
+
+            happen("Middle" if side == 0 else "End", 0, 0, 3, [False, False, False], batters[1 - side], event)
+            now += BREAK_SECONDS
+
+        if inning >= MAX_INNINGS or (inning >= REGULATION_INNINGS and runs[0] != runs[1]):
+            break
+        inning += 1
+
+    last = moments[-1]
+    moments[-1] = last._replace(final=True)
+    return times, moments
+
+
+def _advance(bases: list[bool], forced: bool, home_run: bool = False) -> int:
+    """Moves the runners along for a walk, single or home run, returning how many scored"""
+    if home_run:
+        scored = sum(bases) + 1
+        bases[:] = [False, False, False]
+        return scored
+    if forced:
+        # runners only move if the base behind them is taken
+        if bases[0] and bases[1] and bases[2]:
+            return 1
+        if bases[0] and bases[1]:
+            bases[2] = True
+        elif bases[0]:
+            bases[1] = True
+        bases[0] = True
+        return 0
+    scored = int(bases[2])
+    bases[:] = [True, bases[0], bases[1]]
+    return scored
+
+
+def _ordinal(n: int) -> str:
+    suffix = "th" if 11 <= n % 100 <= 13 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
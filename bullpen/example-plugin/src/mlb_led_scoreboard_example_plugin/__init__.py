@@ -32,6 +32,10 @@ class Renderer(api.PluginRenderer):
     def wait_time(self) -> float:
         return 0.5
 
+    def fingerprint(self, data: Data, scrolling_text_pos: int) -> int:
+        # the screen only changes when the counter does
+        return data.counter
+
     def render(self, data: Data, canvas: "Canvas", graphics: api.renderer.graphics, scrolling_text_pos: int) -> None:
         canvas.Fill(*self.bg)
         graphics.DrawText(
@@ -1,5 +1,5 @@
-from . import api, logging, util
+from . import api, archive, clip, clock, http, logging, text, util
 
 PLUGIN_GROUP = "bullpen.mlbled.plugin"
 
-__all__ = ["api", "logging", "util"]
+__all__ = ["api", "archive", "clip", "clock", "http", "logging", "text", "util"]
@@ -1,5 +1,5 @@
 import abc
-from typing import TYPE_CHECKING, Generic, Optional, Protocol, TypeVar
+from typing import TYPE_CHECKING, Generic, Hashable, Optional, Protocol, TypeVar
 
 from .data import PluginData
 from .config import PluginConfig, Layout, Color
@@ -39,3 +39,18 @@ class PluginRenderer(abc.ABC, Generic[_PluginData]):
 
     def can_render(self, data: _PluginData) -> bool:
         return True
+
+    def next_redraw(self, data: _PluginData) -> float:
+        """
+        Seconds until the screen needs to be drawn again, asked after every frame.
+        Defaults to `wait_time`. Screens with scrolling text should keep to `wait_time` while it scrolls.
+        """
+        return self.wait_time()
+
+    def fingerprint(self, data: _PluginData, scrolling_text_pos: int) -> Optional[Hashable]:
+        """
+        A value that changes whenever the next frame would look different from the last one.
+        While it stays the same, `render` isn't called and the display is left alone.
+        Returning None (the default) means every frame is drawn.
+        """
+        return None
@@ -0,0 +1,107 @@
+"""
+Archives of HTTP traffic, for running the scoreboard without the network.
+
+A `Recorder` saves every response it is given to a gzip-compressed archive of JSON lines,
+each with the time it was received. A `Replayer` reads such an archive back and answers
+requests from it, in the order they happened: a URL gets the response that had been
+recorded for it by the same point in the replay as in the recording.
+
+Recordings are flushed after every response, so an archive stays readable even if the
+scoreboard is stopped partway through a day.
+"""
+
+import gzip
+import json
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import Callable, Union
+
+import requests
+
+import bullpen.clock
+from bullpen.logging import LOGGER
+
+# Returned for requests that were never recorded
+NOT_RECORDED_STATUS = 404
+
+
+class Recorder:
+    def __init__(self, path: Union[str, Path], clock: Callable[[], float] = bullpen.clock.time) -> None:
+        self.path = Path(path)
+        self.clock = clock
+        self._lock = threading.Lock()
+        # appended to, so a scoreboard restarted partway through the day adds to the same recording
+        self._file = gzip.open(self.path, "at", encoding="utf-8")
+
+    def record(self, url: str, response: requests.Response) -> None:
+        entry = {"time": self.clock(), "url": url, "status": response.status_code, "body": response.text}
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class Replayer:
+    def __init__(self, path: Union[str, Path], clock: Callable[[], float] = bullpen.clock.time) -> None:
+        self.path = Path(path)
+        self.clock = clock
+        # each URL's recorded responses, as (times, responses) in the order they were recorded
+        self._index: dict[str, tuple[list[float], list[dict]]] = {}
+
+        entries = _read(self.path)
+        for entry in sorted(entries, key=lambda e: e["time"]):
+            times, responses = self._index.setdefault(entry["url"], ([], []))
+            times.append(entry["time"])
+            responses.append(entry)
+
+        # replaying starts from the first response recorded
+        self.start = min((e["time"] for e in entries), default=0.0)
+        self._began = clock()
+        LOGGER.info("Replaying %d responses for %d URLs from %s", len(entries), len(self._index), self.path)
+
+    def restart(self) -> None:
+        """Replays from the start of the recording again, as of now by `clock`."""
+        self._began = self.clock()
+
+    def recorded_time(self) -> float:
+        """The time in the recording that the replay has reached"""
+        return self.start + (self.clock() - self._began)
+
+    def response(self, url: str) -> requests.Response:
+        """
+        The last response recorded for `url` by this point in the replay,
+        or its first if the replay hasn't yet reached any of them.
+        """
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+
+        if url not in self._index:
+            LOGGER.warning("No response recorded for %s", url)
+            response.status_code = NOT_RECORDED_STATUS
+            response.reason = "Not Recorded"
+            response._content = b""
+            return response
+
+        times, responses = self._index[url]
+        entry = responses[max(bisect_right(times, self.recorded_time()) - 1, 0)]
+        response.status_code = entry["status"]
+        response._content = entry["body"].encode("utf-8")
+        response.headers["Content-Type"] = "application/json"
+        return response
+
+
+def _read(path: Path) -> list[dict]:
+    entries = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                entries.append(json.loads(line))
+        except (EOFError, json.JSONDecodeError):
+            # the recording was cut off partway through writing a response
+            LOGGER.warning("Archive %s ends with an incomplete response, which is skipped", path)
+    return entries
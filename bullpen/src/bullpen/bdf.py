@@ -0,0 +1,106 @@
+"""
+Glyphs read straight from BDF font files.
+
+Parsing a whole BDF file takes a long time on a Pi, but drawing only ever needs the few letters
+that are actually shown. A font's glyph index (where each glyph starts in the file) is found by
+a quick scan, or given with `register`, and each glyph is read on its own the first time it is drawn.
+"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+REPLACEMENT_CHARACTER = "\N{REPLACEMENT CHARACTER}"
+
+
+class GlyphIndex(NamedTuple):
+    # the width of the font's bounding box, which letters missing from it are drawn as
+    width: int
+    # where each glyph's STARTCHAR line begins in the file, by codepoint
+    offsets: dict[int, int]
+
+
+class Glyph(NamedTuple):
+    # how far the next letter is drawn along
+    advance: int
+    # the lit pixels, relative to where the letter is drawn (its left edge, on the baseline)
+    pixels: tuple[tuple[int, int], ...]
+
+
+_indexes: dict[str, GlyphIndex] = {}
+
+
+def register(path: str, index: GlyphIndex) -> None:
+    """Records the glyph index of the font at `path`, such as one kept from an earlier run, so it isn't scanned."""
+    _indexes[path] = index
+
+
+def glyph_index(path: str) -> GlyphIndex:
+    """The glyph index of the font at `path`, scanning the file for it if it wasn't registered."""
+    index = _indexes.get(path)
+    if index is None:
+        index = _indexes[path] = scan(path)
+    return index
+
+
+def scan(path: str) -> GlyphIndex:
+    """Finds where each glyph starts in the font at `path`, without parsing the glyphs themselves."""
+    width = 0
+    offsets = {}
+    start = offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b"STARTCHAR"):
+                start = offset
+            elif line.startswith(b"ENCODING"):
+                codepoint = int(line.split()[1])
+                if codepoint >= 0:
+                    offsets[codepoint] = start
+            elif line.startswith(b"FONTBOUNDINGBOX"):
+                width = int(line.split()[1])
+            offset += len(line)
+    return GlyphIndex(width, offsets)
+
+
+def glyph(path: str, letter: str) -> Glyph:
+    """
+    `letter` in the font at `path`. Like the matrix library, letters missing from the font are drawn
+    as its replacement character, or left blank if it doesn't have one.
+    """
+    return _glyph(path, letter) or _glyph(path, REPLACEMENT_CHARACTER) or Glyph(glyph_index(path).width, ())
+
+
+@lru_cache(maxsize=1024)
+def _glyph(path: str, letter: str) -> Optional[Glyph]:
+    offset = glyph_index(path).offsets.get(ord(letter))
+    if offset is None:
+        return None
+
+    advance = width = height = left = bottom = 0
+    rows: list[int] = []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        in_bitmap = False
+        for line in f:
+            if line.startswith(b"ENDCHAR"):
+                break
+            if in_bitmap:
+                rows.append(int(line, 16))
+            elif line.startswith(b"DWIDTH"):
+                advance = int(line.split()[1])
+            elif line.startswith(b"BBX"):
+                width, height, left, bottom = (int(value) for value in line.split()[1:5])
+            elif line.startswith(b"BITMAP"):
+                in_bitmap = True
+
+    # each row is padded to a whole number of bytes, with the first pixel in the highest bit
+    bits = (width + 7) // 8 * 8
+    top = -height - bottom
+    return Glyph(
+        advance,
+        tuple(
+            (left + col, top + row)
+            for row, value in enumerate(rows[:height])
+            for col in range(width)
+            if value >> (bits - 1 - col) & 1 and left + col < advance
+        ),
+    )
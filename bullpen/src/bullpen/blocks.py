@@ -0,0 +1,62 @@
+"""
+Copying only the drawn parts of an image onto a canvas.
+
+The matrix's `SetImage` overwrites every pixel of the image it is given, transparent or not.
+To draw something on top of what is already there, an image is split into the opaque
+rectangles it is made of, and each of those is copied instead.
+"""
+
+from typing import TYPE_CHECKING
+
+from PIL import Image
+
+if TYPE_CHECKING:
+    from RGBMatrixEmulator.emulation.canvas import Canvas
+
+# (left, top, right, bottom), like PIL's boxes
+Box = tuple[int, int, int, int]
+
+
+def opaque_boxes(image: Image.Image) -> list[Box]:
+    """The fewest opaque rectangles covering the drawn pixels of an RGBA `image`, found by scanning row by row."""
+    width, height = image.size
+    alpha = image.getchannel("A").tobytes()
+    boxes = []
+    # rectangles that are still growing downwards, by their (left, right) span
+    open_spans: dict[tuple[int, int], int] = {}
+    for y in range(height + 1):
+        spans = _spans(alpha[y * width : (y + 1) * width]) if y < height else []
+        for span in list(open_spans):
+            if span not in spans:
+                boxes.append((span[0], open_spans.pop(span), span[1], y))
+        for span in spans:
+            open_spans.setdefault(span, y)
+    return boxes
+
+
+def draw_boxes(canvas: "Canvas", image: Image.Image, boxes: list[Box], x: int, y: int, window: Box) -> None:
+    """
+    Copies the `boxes` of an RGB `image` onto `canvas` with the image's corner at `x, y`,
+    but only the parts inside `window`, in canvas coordinates.
+    """
+    left, top, right, bottom = window
+    for box_left, box_top, box_right, box_bottom in boxes:
+        box_left, box_right = max(box_left + x, left), min(box_right + x, right)
+        box_top, box_bottom = max(box_top + y, top), min(box_bottom + y, bottom)
+        if box_left < box_right and box_top < box_bottom:
+            canvas.SetImage(image.crop((box_left - x, box_top - y, box_right - x, box_bottom - y)), box_left, box_top)
+
+
+def _spans(row: bytes) -> list[tuple[int, int]]:
+    """The (start, end) of each run of opaque pixels in a row of alpha values"""
+    spans = []
+    start = None
+    for x, a in enumerate(row):
+        if a and start is None:
+            start = x
+        elif not a and start is not None:
+            spans.append((start, x))
+            start = None
+    if start is not None:
+        spans.append((start, len(row)))
+    return spans
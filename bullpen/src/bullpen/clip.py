@@ -0,0 +1,157 @@
+"""
+Drawing clipped to a rectangle.
+
+`ClippedGraphics` wraps the `graphics` module passed to renderers and only draws
+inside its rectangle, so text and shapes can't spill into their neighbors and nothing
+has to be painted over afterwards. It has the same functions as `graphics`, so it can
+be passed anywhere `graphics` is:
+
+    clipped = ClippedGraphics(graphics, x=0, y=20, width=32, height=8)
+    clipped.DrawText(canvas, font, x, y, color, "Some long text")
+
+Anything entirely inside the rectangle is drawn by `graphics` as usual; only the
+pixels of shapes and letters that cross its edge are drawn one by one.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from . import bdf
+
+if TYPE_CHECKING:
+    from RGBMatrixEmulator.emulation.canvas import Canvas
+    from RGBMatrixEmulator import Color as GraphicsColor, Font
+
+    from .api.renderer import graphics as Graphics
+
+# Paths of the BDF files fonts were loaded from, by font object, see `register_font`
+_font_paths: dict[int, tuple["Font", str]] = {}
+
+
+def register_font(font: "Font", path: str, glyphs: Optional[bdf.GlyphIndex] = None) -> None:
+    """
+    Records which BDF file `font` was loaded from, so letters crossing the edge of a clip
+    can be drawn partially. Letters of other fonts are only drawn if they fit entirely.
+    The font's `glyphs` index can be given if it is already known, so the file isn't scanned for it.
+    """
+    _font_paths[id(font)] = (font, path)
+    if glyphs is not None:
+        bdf.register(path, glyphs)
+
+
+class ClippedGraphics:
+    def __init__(self, graphics: "Graphics", x: int, y: int, width: int, height: int) -> None:
+        self.graphics = graphics
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def clip(self, x: int, y: int, width: int, height: int) -> "ClippedGraphics":
+        """A further clip, to where this one and the given rectangle overlap."""
+        left, top = max(x, self.x), max(y, self.y)
+        right, bottom = min(x + width, self.x + self.width), min(y + height, self.y + self.height)
+        return ClippedGraphics(self.graphics, left, top, max(right - left, 0), max(bottom - top, 0))
+
+    def contains(self, x: int, y: int) -> bool:
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def Color(self, r=0, g=0, b=0) -> "GraphicsColor":
+        return self.graphics.Color(r, g, b)
+
+    def DrawText(self, canvas: "Canvas", font: "Font", x: int, y: int, color: "GraphicsColor", text: str) -> int:
+        top = y - font.baseline
+        fits_vertically = self.y <= top and top + font.height <= self.y + self.height
+
+        total_width = 0
+        run_start, run_x = 0, x
+        for i, letter in enumerate(text):
+            width = max(font.CharacterWidth(ord(letter)), 0)
+            letter_x = x + total_width
+            total_width += width
+
+            if fits_vertically and self.x <= letter_x and letter_x + width <= self.x + self.width:
+                continue
+
+            # draw the run of letters before this one that fit entirely, then this one pixel by pixel
+            if run_start < i:
+                self.graphics.DrawText(canvas, font, run_x, y, color, text[run_start:i])
+            self.__draw_letter(canvas, font, letter_x, y, color, letter)
+            run_start, run_x = i + 1, letter_x + width
+
+        if run_start < len(text):
+            self.graphics.DrawText(canvas, font, run_x, y, color, text[run_start:])
+
+        return total_width
+
+    def DrawLine(self, canvas: "Canvas", x1: int, y1: int, x2: int, y2: int, color: "GraphicsColor") -> None:
+        if self.contains(x1, y1) and self.contains(x2, y2):
+            self.graphics.DrawLine(canvas, x1, y1, x2, y2, color)
+        elif x1 == x2 or y1 == y2:
+            # straight lines can simply be shortened
+            left, right = max(min(x1, x2), self.x), min(max(x1, x2), self.x + self.width - 1)
+            top, bottom = max(min(y1, y2), self.y), min(max(y1, y2), self.y + self.height - 1)
+            if left <= right and top <= bottom:
+                self.graphics.DrawLine(canvas, left, top, right, bottom, color)
+        else:
+            self.__set_pixels(canvas, line_points(x1, y1, x2, y2), color)
+
+    def DrawCircle(self, canvas: "Canvas", x: int, y: int, r: int, color: "GraphicsColor") -> None:
+        if self.contains(x - r, y - r) and self.contains(x + r, y + r):
+            self.graphics.DrawCircle(canvas, x, y, r, color)
+        else:
+            self.__set_pixels(canvas, circle_points(x, y, r), color)
+
+    def __draw_letter(self, canvas, font, x, y, color, letter):
+        self.__set_pixels(canvas, ((x + dx, y + dy) for dx, dy in glyph_pixels(font, letter) or ()), color)
+
+    def __set_pixels(self, canvas, points, color):
+        for px, py in points:
+            if self.contains(px, py):
+                canvas.SetPixel(px, py, color.red, color.green, color.blue)
+
+
+def glyph_pixels(font: "Font", letter: str) -> Optional[tuple[tuple[int, int], ...]]:
+    """
+    The lit pixels of `letter` in `font`, relative to where it is drawn (its left edge, on the baseline),
+    or None if the font wasn't registered with `register_font`.
+    """
+    entry = _font_paths.get(id(font))
+    if entry is None:
+        return None
+    return bdf.glyph(entry[1], letter).pixels
+
+
+def line_points(x1, y1, x2, y2):
+    """The points of a line, by Bresenham's algorithm."""
+    # like the drivers, coordinates are truncated to whole pixels
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    dx, dy = abs(x2 - x1), -abs(y2 - y1)
+    sx, sy = (1 if x1 < x2 else -1), (1 if y1 < y2 else -1)
+    error = dx + dy
+    while True:
+        yield x1, y1
+        if x1 == x2 and y1 == y2:
+            return
+        e2 = 2 * error
+        if e2 >= dy:
+            error += dy
+            x1 += sx
+        if e2 <= dx:
+            error += dx
+            y1 += sy
+
+
+def circle_points(x0, y0, r):
+    """The points of a circle's outline, by the midpoint algorithm."""
+    x0, y0, r = int(x0), int(y0), int(r)
+    x, y = r, 0
+    error = 1 - r
+    while x >= y:
+        for px, py in ((x, y), (y, x), (-y, x), (-x, y), (-x, -y), (-y, -x), (y, -x), (x, -y)):
+            yield x0 + px, y0 + py
+        y += 1
+        if error < 0:
+            error += 2 * y + 1
+        else:
+            x -= 1
+            error += 2 * (y - x) + 1
@@ -0,0 +1,114 @@
+"""
+The scoreboard's sense of time.
+
+Everything that decides when to fetch data, when to rotate screens, or which day it is asks
+this module for the time, rather than `time` or `datetime` directly. That is the system clock
+unless another is set with `set_clock()`, such as a `VirtualClock`, which lets a whole day of
+games be simulated in-process much faster than it would really take.
+
+Plugins should use `bullpen.clock.time()`, `now()` and `sleep()` the same way, so that they keep
+pace with the rest of the scoreboard.
+"""
+
+import datetime as _datetime
+import threading
+import time as _time
+from typing import Callable, Optional, Union
+
+
+class SystemClock:
+    """The real time"""
+
+    def time(self) -> float:
+        return _time.time()
+
+    def monotonic(self) -> float:
+        return _time.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        _time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    A clock that starts at `start` and runs `speed` times faster than real time.
+    Sleeping waits for a correspondingly shorter real time.
+
+    With a `speed` of 0, the clock only moves when it is `advance`d or slept on,
+    so every sleep returns immediately. This is useful for stepping through time in tests.
+    """
+
+    def __init__(
+        self,
+        start: Union[float, _datetime.datetime],
+        speed: float = 1.0,
+        real_time: Callable[[], float] = _time.monotonic,
+        real_sleep: Callable[[float], None] = _time.sleep,
+    ) -> None:
+        if isinstance(start, _datetime.datetime):
+            start = start.timestamp()
+        self.speed = speed
+        self._real_time = real_time
+        self._real_sleep = real_sleep
+        self._lock = threading.Lock()
+        # the virtual time at the real time `_began`
+        self._start = start
+        self._began = real_time()
+
+    def time(self) -> float:
+        with self._lock:
+            return self._start + (self._real_time() - self._began) * self.speed
+
+    def monotonic(self) -> float:
+        # a virtual clock is never set back, so its time is already monotonic
+        return self.time()
+
+    def sleep(self, seconds: float) -> None:
+        if self.speed > 0:
+            self._real_sleep(max(seconds, 0) / self.speed)
+        else:
+            self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Moves the clock forward by `seconds`, on top of how it runs by itself"""
+        with self._lock:
+            self._start += max(seconds, 0)
+
+
+Clock = Union[SystemClock, VirtualClock]
+
+_clock: Clock = SystemClock()
+
+
+def set_clock(clock: Optional[Clock]) -> None:
+    """Use `clock` for all timekeeping from now on, or the system clock again if `None`."""
+    global _clock
+    _clock = clock or SystemClock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def time() -> float:
+    """Seconds since the epoch, like `time.time()`"""
+    return _clock.time()
+
+
+def monotonic() -> float:
+    """Seconds from an arbitrary starting point, which never go backwards, like `time.monotonic()`"""
+    return _clock.monotonic()
+
+
+def sleep(seconds: float) -> None:
+    _clock.sleep(seconds)
+
+
+def now(tz: Optional[_datetime.tzinfo] = None) -> _datetime.datetime:
+    """The current date and time, like `datetime.now(tz)`"""
+    return _datetime.datetime.fromtimestamp(_clock.time(), tz)
+
+
+def today() -> _datetime.date:
+    """The current local date, like `date.today()`"""
+    return now().date()
@@ -0,0 +1,127 @@
+"""
+Shared HTTP client for all MLB Stats API traffic.
+
+`statsapi` sends every request through a bare `requests.get`, which opens (and
+tears down) a new TCP+TLS connection each time. After `install()` is called,
+those requests instead go through one keep-alive `requests.Session`, shared by
+the scoreboard and every plugin. Connection limits and timeouts live here.
+
+Everything fetched through `get` can also be saved to an archive with `record()`, or
+answered from one with `replay()` instead of the network (see `bullpen.archive`). Stats API
+requests can be sent to another server, such as a local stand-in, with `set_base_url()`.
+"""
+
+import threading
+from typing import Any, Optional
+
+import requests
+import statsapi
+from requests.adapters import HTTPAdapter
+
+from bullpen import clock
+from bullpen.archive import Recorder, Replayer
+from bullpen.clock import VirtualClock
+
+STATSAPI_HOST = "https://statsapi.mlb.com"
+
+# (connect, read) timeout in seconds, used by any request that doesn't specify its own
+TIMEOUT = (3.05, 10)
+
+# Maximum number of kept-alive connections for each host
+HOST_POOL_SIZES = {STATSAPI_HOST: 2}
+DEFAULT_POOL_SIZE = 1
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_recorder: Optional[Recorder] = None
+_replayer: Optional[Replayer] = None
+# Where Stats API requests are sent instead of STATSAPI_HOST, if anywhere
+_base_url: Optional[str] = None
+
+
+def session() -> requests.Session:
+    """Returns the process-wide session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _make_session()
+        return _session
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    if _replayer is not None:
+        return _replayer.response(_full_url(url, kwargs.get("params")))
+
+    kwargs.setdefault("timeout", TIMEOUT)
+    response = session().get(_redirected(url), **kwargs)
+    if _recorder is not None:
+        # archived under the real API's URL, wherever it was fetched from
+        _recorder.record(_full_url(url, kwargs.get("params")), response)
+    return response
+
+
+def install(headers: Optional[dict[str, str]] = None) -> None:
+    """
+    Route all `statsapi` requests through the shared session.
+    Any `headers` given are sent with every request.
+    """
+    if headers:
+        session().headers.update(headers)
+    statsapi.requests = _PooledRequests()
+
+
+def record(path: str) -> None:
+    """Save every response fetched from now on to the archive at `path`."""
+    global _recorder
+    _recorder = Recorder(path)
+
+
+def replay(path: str) -> None:
+    """
+    Answer every request from now on from the archive at `path`, without using the network.
+    The clock is set back to when the recording began, so the scoreboard asks for the day that was recorded.
+    """
+    global _replayer
+    _replayer = Replayer(path)
+    clock.set_clock(VirtualClock(_replayer.start))
+    # the replay is timed by the new clock from here
+    _replayer.restart()
+
+
+def set_base_url(url: Optional[str]) -> None:
+    """Send Stats API requests to the server at `url` instead, or to the real API again if None."""
+    global _base_url
+    _base_url = url.rstrip("/") if url else None
+
+
+def _redirected(url: str) -> str:
+    if _base_url is not None and url.startswith(STATSAPI_HOST):
+        return _base_url + url[len(STATSAPI_HOST) :]
+    return url
+
+
+def _full_url(url: str, params: Any) -> str:
+    # responses are archived by their URL including the query, however it was given
+    if not params:
+        return url
+    return requests.Request("GET", url, params=params).prepare().url or url
+
+
+def _make_session() -> requests.Session:
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_maxsize=DEFAULT_POOL_SIZE))
+    s.mount("http://", HTTPAdapter(pool_maxsize=DEFAULT_POOL_SIZE))
+    for host, size in HOST_POOL_SIZES.items():
+        s.mount(host, HTTPAdapter(pool_connections=1, pool_maxsize=size))
+    return s
+
+
+class _PooledRequests:
+    """Stands in for the `requests` module inside `statsapi`."""
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return get(url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
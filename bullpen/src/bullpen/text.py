@@ -0,0 +1,77 @@
+"""
+Scrolling text drawn from pre-rendered strips.
+
+Drawing scrolling text glyph by glyph every frame is wasteful, as the text itself rarely changes.
+Instead, each text is rendered once into an image strip (cached until the text, font, or colors
+change) and every frame only the part of the strip that is inside the text's box is copied onto
+the canvas. Nothing is drawn outside the box, so no masking is needed. Like `graphics.DrawText`,
+only the lit pixels of the letters are copied, so text can be drawn on top of other things.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from PIL import Image
+
+from . import bdf
+from .blocks import Box, draw_boxes, opaque_boxes
+
+if TYPE_CHECKING:
+    from RGBMatrixEmulator.emulation.canvas import Canvas
+    from RGBMatrixEmulator import Color
+
+# Number of strips kept. A screen has at most a handful of scrolling texts at once
+STRIP_CACHE_SIZE = 32
+
+
+class TextStrip(NamedTuple):
+    image: Image.Image
+    # the lit parts of the image
+    boxes: list[Box]
+    # where the image's top left corner is, relative to where the text is drawn (its left edge, on the baseline)
+    left: int
+    top: int
+
+
+def draw_text_window(
+    canvas: "Canvas",
+    font: dict[str, Any],
+    x: int,
+    y: int,
+    width: int,
+    text_color: "Color",
+    text: str,
+    scroll_pos: int,
+) -> None:
+    """
+    Draws `text` starting at `scroll_pos` with its baseline at `y`, like `graphics.DrawText`,
+    but only the part between `x` and `x + width`.
+    """
+    strip = text_strip(font["path"], text, _rgb(text_color))
+
+    window = (max(x, 0), 0, min(x + width, canvas.width), canvas.height)
+    draw_boxes(canvas, strip.image, strip.boxes, scroll_pos + strip.left, y + strip.top, window)
+
+
+@lru_cache(maxsize=STRIP_CACHE_SIZE)
+def text_strip(path: str, text: str, color: tuple[int, int, int]) -> TextStrip:
+    """The whole of `text` in the font at `path`, as an image just big enough to hold its lit pixels."""
+    points: list[tuple[int, int]] = []
+    advance = 0
+    for letter in text:
+        glyph = bdf.glyph(path, letter)
+        points.extend((advance + dx, dy) for dx, dy in glyph.pixels)
+        advance += glyph.advance
+    if not points:
+        return TextStrip(Image.new("RGB", (0, 0)), [], 0, 0)
+
+    left, top = min(x for x, _ in points), min(y for _, y in points)
+    right, bottom = max(x for x, _ in points) + 1, max(y for _, y in points) + 1
+    image = Image.new("RGBA", (right - left, bottom - top))
+    for x, y in points:
+        image.putpixel((x - left, y - top), color + (255,))
+    return TextStrip(image.convert("RGB"), opaque_boxes(image), left, top)
+
+
+def _rgb(color: "Color") -> tuple[int, int, int]:
+    return (color.red, color.green, color.blue)
@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING, Any
 from collections.abc import Mapping
 
+from .clip import ClippedGraphics
+from .text import draw_text_window
+
 if TYPE_CHECKING:
     from .api.renderer import graphics
     from RGBMatrixEmulator.emulation.canvas import Canvas
@@ -60,24 +63,22 @@ def scrolling_text(
             right = -((visible_width - width) // w)
 
         # Trim the text to only the visible part
-        text = text[left:right]
+        visible_text = text[left:right]
 
-        if len(text) == 0:
+        if len(visible_text) == 0:
             return 0
 
+        if "path" in font:
+            # copy the visible window from a pre-rendered strip, clipped to the text's box
+            draw_text_window(canvas, font, x, y, width, text_color, text, scroll_pos)
+            return total_width
+
         # if we trimmed to the left, we need to adjust the scroll position accordingly
         if left:
             scroll_pos += w * left
-        graphics.DrawText(canvas, font["font"], scroll_pos, y, text_color, text)
-
-        # draw one-letter boxes to left and right to hide previous and next letters
-        top = y + 1
-        bottom = top - font["size"]["height"]
-        for xi in range(0, w):
-            left = x - xi - 1
-            graphics.DrawLine(canvas, left, top, left, bottom, bg_color)
-            right = x + width + xi
-            graphics.DrawLine(canvas, right, top, right, bottom, bg_color)
+        top = y - font["font"].baseline
+        clipped = ClippedGraphics(graphics, x, top, width, font["font"].height)
+        clipped.DrawText(canvas, font["font"], scroll_pos, y, text_color, visible_text)
 
         return total_width
     else:
@@ -169,5 +169,30 @@ def _make_parser(defaults) -> argparse.ArgumentParser:
         const=True,
         default=defaults.get("emulated", False),
     )
+    parser.add_argument(
+        "--api-url",
+        action="store",
+        help="Send MLB API requests to this server instead, e.g. a local stand-in for testing.",
+        default=defaults.get("api_url", None),
+        metavar="URL",
+        type=str,
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        action="store",
+        help="Save all MLB API responses to this archive, to replay later.",
+        default=defaults.get("record", None),
+        metavar="ARCHIVE",
+        type=str,
+    )
+    archive.add_argument(
+        "--replay",
+        action="store",
+        help="Answer all MLB API requests from this archive, made with --record, instead of the network.",
+        default=defaults.get("replay", None),
+        metavar="ARCHIVE",
+        type=str,
+    )
 
     return parser
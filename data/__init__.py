@@ -21,7 +21,9 @@ class Data:
     def refresh_game(self) -> None:
         # handle double buffering
         status = self.games.producer_tick(self.schedule.next_game)
-        status = UpdateStatus.merge([status] + [g.update() for g in self.games.items if g is not None])
+        # games that are over are frozen and don't need updates
+        live_games = [g for g in self.games.items if g is not None and not g.is_frozen()]
+        status = UpdateStatus.merge([status] + [g.update() for g in live_games])
 
         # network requests
         self.__process_network_status(status)
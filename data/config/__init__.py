@@ -6,8 +6,8 @@ import logging
 from datetime import datetime, timedelta
 from collections import defaultdict, namedtuple
 from typing import Mapping
-from math import ceil
 
+from bullpen import clock
 from bullpen.api.config import MLBConfig
 from bullpen.util import deep_update
 from bullpen.time_formats import TIME_FORMAT_12H, TIME_FORMAT_24H
@@ -110,9 +110,6 @@ class Config:
         self.check_delay()
         self.check_api_refresh_rate()
 
-        # Set up update delay parameter
-        self.sync_amount = ceil(self.sync_delay_seconds / self.api_refresh_rate)
-
     def check_delay(self):
         if self.sync_delay_seconds < 0:
             LOGGER.warning("sync_delay_seconds should be a positive integer. Using default value of 0")
@@ -183,11 +180,11 @@ class Config:
         if self.demo_date:
             today = datetime.strptime(self.demo_date, "%Y-%m-%d")
         else:
-            today = datetime.today()
+            today = clock.now()
             end_of_day = datetime.strptime(self.end_of_day, "%H:%M").replace(
                 year=today.year, month=today.month, day=today.day
             )
-            if end_of_day > datetime.now():
+            if end_of_day > today:
                 today -= timedelta(days=1)
         return today.date()
 
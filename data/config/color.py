@@ -1,23 +1,51 @@
+from functools import lru_cache
+
 from driver import graphics
 
 
+@lru_cache(maxsize=None)
+def graphics_color(r, g, b):
+    """
+    A shared `graphics.Color` for the given components.
+    The render loop uses the same handful of colors every frame, so there's no need to make new ones.
+    """
+    return graphics.Color(r, g, b)
+
+
 class Color:
     def __init__(self, color_json):
         self.json = color_json
+        # Every keypath in the file, so lookups don't walk the JSON
+        self.__colors = {}
+        _flatten(color_json, "", self.__colors)
+        # Filled in on first use, as the driver (and so graphics.Color) isn't chosen until after the config loads
+        self.__graphics_colors = {}
+        self.__palettes = {}
 
     def color(self, keypath):
-        return self.__find_at_keypath(keypath)
+        return self.__colors[keypath]
 
     def graphics_color(self, keypath):
-        color = self.color(keypath)
-        return graphics.Color(color["r"], color["g"], color["b"])
+        try:
+            return self.__graphics_colors[keypath]
+        except KeyError:
+            color = self.color(keypath)
+            c = self.__graphics_colors[keypath] = graphics_color(color["r"], color["g"], color["b"])
+            return c
 
-    def __find_at_keypath(self, keypath):
-        keys = keypath.split(".")
-        rv = self.json
-        for key in keys:
-            rv = rv[key]
-        return rv
+    def palette(self, keypath, special_uniform=None):
+        """
+        The colors at `keypath`, filled in with the colors at "default".
+        If `special_uniform` is given and found, its colors are substituted.
+        Palettes are only merged once; the result must not be modified.
+        """
+        key = (keypath, special_uniform)
+        if key not in self.__palettes:
+            colors = self.color(keypath)
+            if special_uniform is not None and special_uniform in colors:
+                colors = colors | colors[special_uniform]
+            self.__palettes[key] = self.color("default") | colors
+        return self.__palettes[key]
 
     def __eq__(self, other):
         return isinstance(other, Color) and self.json == other.json
@@ -33,3 +61,11 @@ class Color:
         json = {plugin_name: plugin}
         json["default"] = self.json["default"]
         return Color(json)
+
+
+def _flatten(node, prefix, table):
+    for key, value in node.items():
+        keypath = prefix + key
+        table[keypath] = value
+        if isinstance(value, dict):
+            _flatten(value, keypath + ".", table)
@@ -0,0 +1,102 @@
+"""
+Fonts shared by every layout in the process.
+
+The scoreboard and each plugin get their own `Layout`, but they mostly use the same few
+fonts. Each font file is loaded once and the same font dictionary is handed to every layout.
+
+Reading a font's size means parsing the whole BDF file, which is slow on a Pi, so the
+parsed headers are also kept in a small index on disk, along with where each glyph starts
+in the file so that letters can be read one at a time when they are drawn (see `bullpen.bdf`).
+An entry is only trusted while the font file's modification time and size still match.
+"""
+
+import json
+import os
+from typing import Any
+
+import bdfparser
+
+from bullpen import bdf, clip
+from bullpen.logging import LOGGER
+from data.paths import CACHE_DIRECTORY
+from driver import graphics
+
+FONT_INDEX = CACHE_DIRECTORY / "fonts.json"
+
+_fonts: dict[str, dict[str, Any]] = {}
+_index: dict[str, dict[str, Any]] = {}
+_index_loaded = False
+
+
+def load(path: str) -> dict[str, Any]:
+    """
+    Returns the font dictionary (see `Layout.font`) for the BDF file at `path`, loading it if needed.
+    The result is shared and must not be modified.
+    """
+    path = os.path.abspath(path)
+    if path not in _fonts:
+        font = graphics.Font()
+        font.LoadFont(path)
+        headers, glyphs = _headers(path)
+        clip.register_font(font, path, glyphs)
+        _fonts[path] = {
+            "font": font,
+            "path": path,
+            "bdf_headers": headers,
+            "size": {"width": headers["fbbx"], "height": headers["fbby"]},
+        }
+    return _fonts[path]
+
+
+def _headers(path: str) -> tuple[dict[str, Any], bdf.GlyphIndex]:
+    global _index_loaded
+    if not _index_loaded:
+        _index.update(_read_index())
+        _index_loaded = True
+
+    stat = os.stat(path)
+    entry = _index.get(path)
+    if (
+        entry is not None
+        and entry["mtime"] == stat.st_mtime
+        and entry["size"] == stat.st_size
+        # written before glyphs were indexed
+        and "glyphs" in entry
+    ):
+        glyphs = entry["glyphs"]
+        return entry["headers"], bdf.GlyphIndex(glyphs["width"], {int(c): o for c, o in glyphs["offsets"].items()})
+
+    headers = bdfparser.Font(path).headers
+    glyphs = bdf.scan(path)
+    _index[path] = {
+        "mtime": stat.st_mtime,
+        "size": stat.st_size,
+        "headers": headers,
+        "glyphs": {"width": glyphs.width, "offsets": glyphs.offsets},
+    }
+    _write_index()
+    return headers, glyphs
+
+
+def _read_index() -> dict[str, dict[str, Any]]:
+    try:
+        with open(FONT_INDEX) as f:
+            index = json.load(f)
+        if isinstance(index, dict):
+            return index
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError):
+        LOGGER.warning("Could not read the font index, fonts will be parsed again")
+    return {}
+
+
+def _write_index() -> None:
+    try:
+        FONT_INDEX.parent.mkdir(parents=True, exist_ok=True)
+        tmp = FONT_INDEX.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(_index, f)
+        os.replace(tmp, FONT_INDEX)
+    except (OSError, TypeError, ValueError):
+        LOGGER.warning("Could not store the font index")
@@ -1,9 +1,8 @@
 from data import status
-from driver import graphics
+from data.config import fonts
 
 import os.path
-
-import bdfparser
+from functools import lru_cache
 
 FONTNAME_DEFAULT = "4x6"
 FONTNAME_KEY = "font_name"
@@ -23,13 +22,25 @@ class Layout:
         self.width = width
         self.height = height
         self.state = None
+
+        # Every keypath is resolved once for each state up front, so lookups while rendering are a single dict access
+        keypaths = dict(_flatten(layout_json))
+        self.__coords_by_state = {
+            state: {keypath: _apply_state(value, state) for keypath, value in keypaths.items()}
+            for state in [None] + AVAILABLE_OPTIONAL_KEYS
+        }
+        self.__coords = self.__coords_by_state[None]
+
         self.default_font_name = FONTNAME_DEFAULT
         self.default_font_name = self.coords("defaults.font_name")
 
-        self.font_cache = {}
-
         # Cache the default font to start
-        self.__get_font_object(self.default_font_name)
+        self.__default_font = self.__get_font_object(self.default_font_name)
+
+        self.__fonts_by_state = {
+            state: self.__resolve_fonts(coords) for state, coords in self.__coords_by_state.items()
+        }
+        self.__fonts = self.__fonts_by_state[None]
 
     def font(self, keypath):
         """
@@ -45,32 +56,18 @@ class Layout:
             }
         }
         """
-        try:
-            return self.__get_font_object(self.coords(keypath)[FONTNAME_KEY])
-        except KeyboardInterrupt as e:
-            raise e
-        except:
-            return self.__get_font_object(self.default_font_name)
+        return self.__fonts.get(keypath, self.__default_font)
 
     def coords(self, keypath):
-        try:
-            coord_dict = self.__find_at_keypath(keypath)
-        except KeyError as e:
-            raise e
-
-        if not isinstance(coord_dict, dict) or not self.state in AVAILABLE_OPTIONAL_KEYS:
-            return coord_dict
-
-        if self.state in coord_dict:
-            return coord_dict[self.state]
-
-        return coord_dict
+        return self.__coords[keypath]
 
     def set_state(self, new_state=None):
         if new_state in AVAILABLE_OPTIONAL_KEYS:
             self.state = new_state
         else:
             self.state = None
+        self.__coords = self.__coords_by_state[self.state]
+        self.__fonts = self.__fonts_by_state[self.state]
 
     def state_for_game(self, game):
         new_state = None
@@ -91,36 +88,18 @@ class Layout:
     def state_is_nohitter(self):
         return self.state in [LAYOUT_STATE_NOHIT, LAYOUT_STATE_PERFECT]
 
-    def __find_at_keypath(self, keypath):
-        keys = keypath.split(".")
-        rv = self.json
-        for key in keys:
-            rv = rv[key]
-        return rv
+    def __resolve_fonts(self, coords):
+        """Font for each keypath that names one. Any other keypath uses the default font."""
+        return {
+            keypath: self.__get_font_object(value[FONTNAME_KEY])
+            for keypath, value in coords.items()
+            if isinstance(value, dict) and isinstance(value.get(FONTNAME_KEY), str)
+        }
 
     def __get_font_object(self, font_name):
-        if font_name in self.font_cache:
-            return self.font_cache[font_name]
-
-        font_paths = [DIR_FONT_PATCHED, DIR_FONT_DRIVER]
-        for font_path in font_paths:
-            abs_path = os.path.abspath(os.path.join(__file__, "../../..", f"{font_path}/{font_name}.bdf"))
-
-            if os.path.isfile(abs_path):
-                font = graphics.Font()
-                font.LoadFont(abs_path)
-
-                self.font_cache[font_name] = {
-                    "font": font,
-                    "path": abs_path,
-                } | self.__get_font_bdf_properties(abs_path)
-
-                return self.font_cache[font_name]
-
-    def __get_font_bdf_properties(self, path):
-        bdf = bdfparser.Font(path)
-
-        return {"bdf_headers": bdf.headers, "size": {"width": bdf.headers["fbbx"], "height": bdf.headers["fbby"]}}
+        path = _font_path(font_name)
+        if path is not None:
+            return fonts.load(path)
 
     def __eq__(self, other):
 
@@ -144,3 +123,30 @@ class Layout:
         plugin_layout = Layout(json, self.width, self.height)
 
         return plugin_layout
+
+
+@lru_cache(maxsize=None)
+def _font_path(font_name):
+    font_paths = [DIR_FONT_PATCHED, DIR_FONT_DRIVER]
+    for font_path in font_paths:
+        abs_path = os.path.abspath(os.path.join(__file__, "../../..", f"{font_path}/{font_name}.bdf"))
+
+        if os.path.isfile(abs_path):
+            return abs_path
+
+    return None
+
+
+def _flatten(json, prefix=""):
+    """Yields every (keypath, value) pair in the layout, including those of nested objects."""
+    for key, value in json.items():
+        keypath = f"{prefix}.{key}" if prefix else key
+        yield keypath, value
+        if isinstance(value, dict):
+            yield from _flatten(value, keypath)
+
+
+def _apply_state(value, state):
+    if state is not None and isinstance(value, dict) and state in value:
+        return value[state]
+    return value
@@ -1,13 +1,18 @@
-import time
-from datetime import datetime
+import logging
+import re
+from datetime import timezone
 from typing import Any, Optional
 
+import requests
 import statsapi
 
+from bullpen import clock
 from bullpen.logging import LOGGER
-from data import teams
+from data import game_cache, polling, status
 from bullpen.api import UpdateStatus
-from data.utils.circular_queue import CircularQueue
+from data.utils.delay_buffer import DelayBuffer
+from data.utils.json_patch import JsonPatchError, apply_patch
+from data.game_snapshot import GameSnapshot, parse_snapshot, player_id
 from data.uniforms import Uniforms
 from data.scoreboard import Scoreboard
 from data.scoreboard.postgame import Postgame
@@ -26,9 +31,13 @@ API_FIELDS = (
     + "currentPlay,result,eventType,playEvents,isPitch,pitchData,startSpeed,details,type,code,description,decisions,"
     + "winner,loser,save,id,linescore,outs,balls,strikes,note,inningState,currentInning,currentInningOrdinal,offense,"
     + "batter,inHole,onDeck,first,second,third,defense,pitcher,boxscore,teams,runs,players,seasonStats,pitching,wins,"
-    + "losses,saves,era,hits,errors,stats,pitching,numberOfPitches,weather,condition,temp,wind,metaData,timeStamp"
+    + "losses,saves,era,hits,errors,stats,pitching,numberOfPitches,weather,condition,temp,wind,metaData,timeStamp,wait"
 )
 
+# every key API_FIELDS keeps, besides the players' "ID123456" keys, which the API always keeps
+API_FIELD_NAMES = frozenset(API_FIELDS.split(","))
+PLAYER_KEY = re.compile(r"ID\d+")
+
 SCHEDULE_API_FIELDS = "dates,date,games,status,detailedState,abstractGameState,reason"
 
 GAME_UPDATE_RATE = 10
@@ -37,60 +46,88 @@ GAME_UPDATE_RATE = 10
 class Game:
     @staticmethod
     def from_scheduled(game_data: dict[str, Any], config: "Config") -> Optional["Game"]:
-        game = Game(
+        args = (
             game_data["game_id"],
             game_data["game_date"],
             game_data.get("national_broadcasts") or [],
             game_data.get("series_status") or "",
             config,
         )
+        frozen = game_cache.load(game_data["game_id"], game_data["game_date"])
+        if frozen is not None:
+            uniforms = Uniforms.from_known(game_data["game_id"], *frozen["uniforms"])
+            game = Game(*args, uniforms=uniforms)
+            game.__restore(frozen)
+            return game
+
+        game = Game(*args, schedule_status=game_data.get("status_data"))
         if game.update(True) == UpdateStatus.SUCCESS:
             return game
         return None
 
-    def __init__(self, game_id, date, broadcasts, series_status, config: "Config"):
+    def __init__(
+        self,
+        game_id,
+        date,
+        broadcasts,
+        series_status,
+        config: "Config",
+        uniforms: Optional[Uniforms] = None,
+        schedule_status: Optional[dict[str, Any]] = None,
+    ):
         self.game_id = game_id
         self.date = date
-        self.starttime = time.time()
-        self._data_wait_queue = CircularQueue(config.sync_amount + 1)
-        self._current_data: dict[str, Any] = {}
+        self.starttime = clock.time()
+        # the status and snapshot of each version of the game, until they are old enough to be shown
+        self._data_wait_queue: DelayBuffer[tuple[dict[str, Any], GameSnapshot]] = DelayBuffer(config.sync_delay_seconds)
+        # the full game feed as of the latest fetch, which changes are fetched against
+        self._latest_data: dict[str, Any] = {}
         self._broadcasts = broadcasts
         self._series_status = series_status
         self._api_refresh_rate = config.api_refresh_rate
         self._status: dict[str, Any] = {}
-        self._uniform_data = Uniforms(game_id, config.uniform_types)
+        # everything the accessors below need, as of the delayed data being shown
+        self._snapshot: GameSnapshot
+        # increases whenever anything the accessors return changes, starting at 1 once there is data
+        self.version = 0
+        # the game's status on our schedule, if we already know it
+        self._status_on_schedule = schedule_status
+        # status from the schedule, which overrides the game feed for postponed games
+        self._scheduled_status: Optional[dict[str, Any]] = None
+        # when the game should next be fetched from the API, or None if it never needs to be again
+        self._next_fetch: Optional[float] = 0
+        # final games never change, so they are no longer updated
+        self._frozen = False
+        self._uniform_data = uniforms or Uniforms(game_id, config.uniform_types)
 
     def update(self, force=False, testing_params={}) -> UpdateStatus:
+        if self._frozen and not force:
+            return UpdateStatus.DEFERRED
         if force or self.__should_update():
-            self.starttime = time.time()
+            self.starttime = clock.time()
+            if not force and not self.__fetch_due():
+                # nothing new is expected from the API yet, but the delayed data still needs to move along
+                self.__show_delayed()
+                # a game that is over is no longer fetched, so this is where the delayed data catches up with it
+                self.__freeze_if_final()
+                return UpdateStatus.DEFERRED
             try:
-                LOGGER.debug("Fetching data for game %s", str(self.game_id))
-                live_data = statsapi.get(
-                    "game",
-                    {"gamePk": self.game_id, "fields": API_FIELDS} | testing_params,
-                    request_kwargs={"headers": data.headers.API_HEADERS},
-                )
-                # we add a delay to avoid spoilers. During construction, this will still yield live data, but then
-                # it will recycle that data until the queue is full.
-                self._data_wait_queue.push(live_data)
-                self._current_data = self._data_wait_queue.peek()
-                self._status = self._current_data["gameData"]["status"]
+                live_data = self.__fetch(testing_params)
+                self._latest_data = live_data
+                self._scheduled_status = None
                 if live_data["gameData"]["datetime"]["officialDate"] > self.date:
                     # this is odd, but if a game is postponed then the 'game' endpoint gets the rescheduled game
-                    LOGGER.debug("Getting game status from schedule for game with strange date!")
-                    try:
-                        scheduled = statsapi.get(
-                            "schedule",
-                            {"gamePk": self.game_id, "sportId": 1, "fields": SCHEDULE_API_FIELDS},
-                            request_kwargs={"headers": data.headers.API_HEADERS},
-                        )
-                        self._status = next(
-                            g["games"][0]["status"] for g in scheduled["dates"] if g["date"] == self.date
-                        )
-                    except:
-                        LOGGER.error("Failed to get game status from schedule")
-
-                self._uniform_data.update()
+                    self._scheduled_status = self.__status_from_schedule()
+                    self._next_fetch = clock.time() + polling.IDLE_REFRESH_RATE
+                else:
+                    delay = polling.next_game_update(live_data, self._api_refresh_rate, clock.now(timezone.utc))
+                    self._next_fetch = None if delay is None else clock.time() + delay
+                    LOGGER.debug("Next fetch for game %s in %s seconds", str(self.game_id), delay)
+
+                self.__push_data(live_data)
+                self.__update_uniforms()
+                self._frozen = False
+                self.__freeze_if_final()
                 self.print_game_data_debug()
                 return UpdateStatus.SUCCESS
             except:
@@ -98,27 +135,129 @@ class Game:
                 return UpdateStatus.FAIL
         return UpdateStatus.DEFERRED
 
+    def __status_from_schedule(self):
+        if self._status_on_schedule:
+            return self._status_on_schedule
+
+        LOGGER.debug("Getting game status from schedule for game with strange date!")
+        try:
+            scheduled = statsapi.get(
+                "schedule",
+                {"gamePk": self.game_id, "sportId": 1, "fields": SCHEDULE_API_FIELDS},
+                request_kwargs={"headers": data.headers.API_HEADERS},
+            )
+            return next(g["games"][0]["status"] for g in scheduled["dates"] if g["date"] == self.date)
+        except:
+            LOGGER.error("Failed to get game status from schedule")
+            return None
+
+    def __push_data(self, live_data):
+        game_status = self._scheduled_status or live_data["gameData"]["status"]
+        self._data_wait_queue.push((game_status, parse_snapshot(live_data, game_status)))
+        self.__show_delayed()
+
+    def __show_delayed(self):
+        # we add a delay to avoid spoilers. During construction, this will still yield live data, but then
+        # it will hold on to that data until the delay has built up.
+        self._status, snapshot = self._data_wait_queue.peek()
+        if self.version == 0 or snapshot != self._snapshot:
+            self._snapshot = snapshot
+            self.version += 1
+
+    def __update_uniforms(self):
+        uniforms = (self.home_special_uniforms(), self.away_special_uniforms())
+        self._uniform_data.update()
+        if uniforms != (self.home_special_uniforms(), self.away_special_uniforms()):
+            self.version += 1
+
+    def __freeze_if_final(self):
+        # only once the delayed data being shown has also reached the end of the game
+        latest_status = self._scheduled_status or self._latest_data["gameData"]["status"]
+        if not (_is_settled(self._status) and _is_settled(latest_status)):
+            return
+
+        LOGGER.debug("Game %s is final, it will no longer be updated", str(self.game_id))
+        self._frozen = True
+        self._next_fetch = None
+        # nothing more will happen, so there is no need to keep hiding the latest data
+        self._data_wait_queue.clear()
+        self.__push_data(self._latest_data)
+        game_cache.save(
+            self.game_id,
+            self.date,
+            {
+                "live_data": self._latest_data,
+                "status": self._status,
+                "uniforms": [self.home_special_uniforms(), self.away_special_uniforms()],
+            },
+        )
+
+    def __restore(self, frozen: dict[str, Any]):
+        self._frozen = True
+        self._next_fetch = None
+        self._latest_data = frozen["live_data"]
+        self._scheduled_status = frozen["status"]
+        self.__push_data(self._latest_data)
+
+    def is_frozen(self):
+        return self._frozen
+
+    def __fetch_due(self):
+        return self._next_fetch is not None and clock.time() >= self._next_fetch
+
+    def __fetch(self, testing_params):
+        if self._latest_data and not testing_params:
+            try:
+                return self.__fetch_changes()
+            # a bad patch, or the diff endpoint failing (or missing from a replayed archive), shouldn't stop updates
+            except (JsonPatchError, KeyError, TypeError, ValueError, requests.RequestException):
+                LOGGER.debug("Could not patch data for game %s, fetching it in full", str(self.game_id))
+
+        LOGGER.debug("Fetching data for game %s", str(self.game_id))
+        return statsapi.get(
+            "game",
+            {"gamePk": self.game_id, "fields": API_FIELDS} | testing_params,
+            request_kwargs={"headers": data.headers.API_HEADERS},
+        )
+
+    def __fetch_changes(self) -> dict[str, Any]:
+        """
+        Fetch only what changed since our latest data and apply it, which is much
+        smaller than the full feed when little has happened between refreshes.
+        """
+        LOGGER.debug("Fetching changes for game %s", str(self.game_id))
+        # statsapi lists endTimecode as required, but the API defaults it to the present
+        patches = statsapi.get(
+            "game_diff",
+            {"gamePk": self.game_id, "startTimecode": self._latest_data["metaData"]["timeStamp"]},
+            force=True,
+            request_kwargs={"headers": data.headers.API_HEADERS},
+        )
+        if not isinstance(patches, list):
+            # the API sends the whole (unfiltered) feed when it can't produce a diff
+            raise JsonPatchError("Received a full game feed instead of a patch")
+
+        live_data = self._latest_data
+        for patch in patches:
+            live_data = apply_patch(live_data, patch["diff"], keep=_is_api_field)
+        return live_data
+
     def datetime(self):
-        time = self._current_data["gameData"]["datetime"]["dateTime"]
-        return datetime.fromisoformat(time.replace("Z", "+00:00"))
+        if self._snapshot.start_time is None:
+            raise KeyError("dateTime")
+        return self._snapshot.start_time
 
     def current_delay(self):
-        return (len(self._data_wait_queue) - 1) * self._api_refresh_rate
+        return self._data_wait_queue.lag()
 
     def home_name(self):
-        return teams.TEAM_ID_NAME.get(
-            self._current_data["gameData"]["teams"]["home"]["id"],
-            self._current_data["gameData"]["teams"]["home"]["teamName"],
-        )
+        return self._snapshot.home.name
 
     def home_abbreviation(self):
-        return teams.TEAM_ID_ABBR.get(
-            self._current_data["gameData"]["teams"]["home"]["id"],
-            self._current_data["gameData"]["teams"]["home"]["abbreviation"],
-        )
+        return self._snapshot.home.abbreviation
 
     def home_record(self):
-        return self._current_data["gameData"]["teams"]["home"]["record"] or {}
+        return self._snapshot.home.record
 
     def home_special_uniforms(self):
         return self._uniform_data.home_special_uniform()
@@ -127,63 +266,40 @@ class Game:
         return self._uniform_data.away_special_uniform()
 
     def away_record(self):
-        return self._current_data["gameData"]["teams"]["away"]["record"] or {}
+        return self._snapshot.away.record
 
     def pregame_weather(self):
-        try:
-            wx = (
-                self._current_data["gameData"]["weather"]["condition"]
-                + " and "
-                + self._current_data["gameData"]["weather"]["temp"]
-                + "\N{DEGREE SIGN}"
-                + " wind "
-                + self._current_data["gameData"]["weather"]["wind"]
-            )
-        except KeyError:
-            return None
-        else:
-            return wx
+        return self._snapshot.weather
 
     def away_name(self):
-        return teams.TEAM_ID_NAME.get(
-            self._current_data["gameData"]["teams"]["away"]["id"],
-            self._current_data["gameData"]["teams"]["away"]["teamName"],
-        )
+        return self._snapshot.away.name
 
     def away_abbreviation(self):
-        return teams.TEAM_ID_ABBR.get(
-            self._current_data["gameData"]["teams"]["away"]["id"],
-            self._current_data["gameData"]["teams"]["away"]["abbreviation"],
-        )
+        return self._snapshot.away.abbreviation
 
     def status(self):
-        return self._status["detailedState"]
+        return self._snapshot.status
 
     def home_score(self):
-        return self._current_data["liveData"]["linescore"]["teams"]["home"].get("runs", 0)
+        return self._snapshot.home.runs
 
     def away_score(self):
-        return self._current_data["liveData"]["linescore"]["teams"]["away"].get("runs", 0)
+        return self._snapshot.away.runs
 
     def home_hits(self):
-        return self._current_data["liveData"]["linescore"]["teams"]["home"].get("hits", 0)
+        return self._snapshot.home.hits
 
     def away_hits(self):
-        return self._current_data["liveData"]["linescore"]["teams"]["away"].get("hits", 0)
+        return self._snapshot.away.hits
 
     def home_errors(self):
-        return self._current_data["liveData"]["linescore"]["teams"]["home"].get("errors", 0)
+        return self._snapshot.home.errors
 
     def away_errors(self):
-        return self._current_data["liveData"]["linescore"]["teams"]["away"].get("errors", 0)
+        return self._snapshot.away.errors
 
     def winning_team(self):
-        if self._status["abstractGameState"] == "Final":
-            if self.home_score() > self.away_score():
-                return "home"
-            if self.home_score() < self.away_score():
-                return "away"
-        return None
+        return self._snapshot.winning_team
 
     def losing_team(self):
         winner = self.winning_team()
@@ -194,152 +310,85 @@ class Game:
         return None
 
     def inning_state(self):
-        return self._current_data["liveData"]["linescore"].get("inningState", "Top")
+        return self._snapshot.inning_state
 
     def inning_number(self):
-        return self._current_data["liveData"]["linescore"].get("currentInning", 0)
+        return self._snapshot.inning_number
 
     def inning_ordinal(self):
-        return self._current_data["liveData"]["linescore"].get("currentInningOrdinal", 0)
+        return self._snapshot.inning_ordinal
 
     def features_team(self, team):
-        return team in [
-            self._current_data["gameData"]["teams"]["away"]["teamName"],
-            self._current_data["gameData"]["teams"]["home"]["teamName"],
-        ]
+        return team in (self._snapshot.away.team_name, self._snapshot.home.team_name)
 
     def is_no_hitter(self):
-        return self._current_data["gameData"]["flags"]["noHitter"]
+        return self._snapshot.no_hitter
 
     def is_perfect_game(self):
-        return self._current_data["gameData"]["flags"]["perfectGame"]
+        return self._snapshot.perfect_game
 
     def man_on(self, base):
-        try:
-            id = self._current_data["liveData"]["linescore"]["offense"][base]["id"]
-        except KeyError:
-            return None
-        else:
-            return id
+        return self._snapshot.runners.get(base)
 
     def full_name(self, player):
-        ID = Game._format_id(player)
-        return self._current_data["gameData"]["players"][ID]["fullName"]
+        return self._snapshot.players[player_id(player)].full_name
 
     def boxscore_name(self, player):
-        ID = Game._format_id(player)
-        return self._current_data["gameData"]["players"][ID]["boxscoreName"]
+        return self._snapshot.players[player_id(player)].boxscore_name
 
     def pitcher_stat(self, player, stat, team=None):
-        ID = Game._format_id(player)
+        ID = player_id(player)
+        pitching = self._snapshot.season_pitching
 
         if team is not None:
-            stats = self._current_data["liveData"]["boxscore"]["teams"][team]["players"][ID]["seasonStats"]["pitching"]
+            stats = pitching[team][ID]
+        elif ID in pitching.get("home", {}):
+            stats = pitching["home"][ID]
+        elif ID in pitching.get("away", {}):
+            stats = pitching["away"][ID]
         else:
-            try:
-                stats = self._current_data["liveData"]["boxscore"]["teams"]["home"]["players"][ID]["seasonStats"][
-                    "pitching"
-                ]
-            except:
-                try:
-                    stats = self._current_data["liveData"]["boxscore"]["teams"]["away"]["players"][ID]["seasonStats"][
-                        "pitching"
-                    ]
-                except:
-                    return ""
+            return ""
 
         return stats[stat]
 
     def probable_pitcher_id(self, team):
-        try:
-            return self._current_data["gameData"]["probablePitchers"][team]["id"]
-        except:
-            return None
+        return self._snapshot.probable_pitchers.get(team)
 
     def decision_pitcher_id(self, decision):
-        try:
-            return self._current_data["liveData"]["decisions"][decision]["id"]
-        except:
-            return None
+        return self._snapshot.decisions.get(decision)
 
     def batter(self):
-        try:
-            batter_id = self._current_data["liveData"]["linescore"]["offense"]["batter"]["id"]
-            return self.boxscore_name(batter_id)
-        except:
-            return ""
+        return self._snapshot.batter
 
     def in_hole(self):
-        try:
-            batter_id = self._current_data["liveData"]["linescore"]["offense"]["inHole"]["id"]
-            return self.boxscore_name(batter_id)
-        except:
-            return ""
+        return self._snapshot.in_hole
 
     def on_deck(self):
-        try:
-            batter_id = self._current_data["liveData"]["linescore"]["offense"]["onDeck"]["id"]
-            return self.boxscore_name(batter_id)
-        except:
-            return ""
+        return self._snapshot.on_deck
 
     def pitcher(self):
-        try:
-            pitcher_id = self._current_data["liveData"]["linescore"]["defense"]["pitcher"]["id"]
-            return self.boxscore_name(pitcher_id)
-        except:
-            return ""
+        return self._snapshot.pitcher
 
     def balls(self):
-        return self._current_data["liveData"]["linescore"].get("balls", 0)
+        return self._snapshot.balls
 
     def strikes(self):
-        return self._current_data["liveData"]["linescore"].get("strikes", 0)
+        return self._snapshot.strikes
 
     def outs(self):
-        return self._current_data["liveData"]["linescore"].get("outs", 0)
+        return self._snapshot.outs
 
     def last_pitch(self):
-        try:
-            play = self._current_data["liveData"]["plays"].get("currentPlay", {}).get("playEvents", [{}])[-1]
-            if play.get("isPitch", False):
-                return (
-                    play["pitchData"].get("startSpeed", 0),
-                    play["details"]["type"]["code"],
-                    play["details"]["type"]["description"],
-                )
-        except:
-            return None
+        return self._snapshot.last_pitch
 
     def current_pitcher_pitch_count(self):
-        try:
-            pitcher_id = self._current_data["liveData"]["linescore"]["defense"]["pitcher"]["id"]
-            ID = Game._format_id(pitcher_id)
-            try:
-                return self._current_data["liveData"]["boxscore"]["teams"]["away"]["players"][ID]["stats"]["pitching"][
-                    "numberOfPitches"
-                ]
-            except:
-                return self._current_data["liveData"]["boxscore"]["teams"]["home"]["players"][ID]["stats"]["pitching"][
-                    "numberOfPitches"
-                ]
-        except:
-            return 0
+        return self._snapshot.pitch_count
 
     def note(self):
-        try:
-            return self._current_data["liveData"]["linescore"]["note"]
-        except:
-            return None
+        return self._snapshot.note
 
     def reason(self):
-        try:
-            return self._status["reason"]
-        except:
-            try:
-                return self._status["detailedState"].split(":")[1].strip()
-            except:
-                return None
+        return self._snapshot.reason
 
     def broadcasts(self):
         return self._broadcasts
@@ -348,31 +397,32 @@ class Game:
         return self._series_status
 
     def current_play_result(self):
-        result = self._current_data["liveData"]["plays"].get("currentPlay", {}).get("result", {}).get("eventType", "")
-        if result == "strikeout" and (
-            "called"
-            in self._current_data["liveData"]["plays"].get("currentPlay", {}).get("result", {}).get("description", "")
-        ):
-            result += "_looking"
-        return result
+        return self._snapshot.play_result
 
     def __should_update(self):
-        endtime = time.time()
+        endtime = clock.time()
         time_delta = endtime - self.starttime
         return time_delta >= self._api_refresh_rate
 
-    @staticmethod
-    def _format_id(player):
-        return player if "ID" in str(player) else "ID" + str(player)
-
     def __eq__(self, value):
         if isinstance(value, Game):
             return self.game_id == value.game_id
         return False
 
     def print_game_data_debug(self):
-        LOGGER.debug("Game Data Refreshed: %s", self._current_data["gameData"]["game"]["id"])
+        if not LOGGER.isEnabledFor(logging.DEBUG):
+            return
+        LOGGER.debug("Game Data Refreshed: %s", self._latest_data["gameData"]["game"]["id"])
         LOGGER.debug("Game is %d seconds behind", self.current_delay())
         LOGGER.debug("Pre: %s", Pregame(self, TIME_FORMAT_24H))
         LOGGER.debug("Live: %s", Scoreboard(self))
         LOGGER.debug("Final: %s", Postgame(self))
+
+
+def _is_settled(game_status: dict[str, Any]) -> bool:
+    # 'Game Over' is followed by 'Final' once everything is official
+    return game_status["abstractGameState"] == "Final" and not status.is_fresh(game_status["detailedState"])
+
+
+def _is_api_field(key: str) -> bool:
+    return key in API_FIELD_NAMES or PLAYER_KEY.fullmatch(key) is not None
@@ -0,0 +1,78 @@
+"""
+Storage for games that are over.
+
+Once a game is final its data can't change, so it is kept on disk and never fetched
+again, even after a restart. The latest day's games are also kept in memory.
+"""
+
+import json
+import os
+import time
+from typing import Any, Optional
+
+from bullpen.logging import LOGGER
+from data.paths import CACHE_DIRECTORY
+
+GAMES_DIRECTORY = CACHE_DIRECTORY / "games"
+
+# Stored games older than this (in seconds) are deleted
+MAX_AGE = 7 * 24 * 60 * 60
+
+_games: dict[tuple[int, str], dict[str, Any]] = {}
+
+
+def load(game_id: int, date: str) -> Optional[dict[str, Any]]:
+    """Returns the stored snapshot of a final game, or None if we don't have one."""
+    key = (game_id, date)
+    snapshot = _games.get(key)
+    if snapshot is None:
+        try:
+            with open(_path(game_id, date)) as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            LOGGER.warning("Could not read stored data for game %s", str(game_id))
+            return None
+        _games[key] = snapshot
+        _forget_older_days()
+    return snapshot
+
+
+def save(game_id: int, date: str, snapshot: dict[str, Any]) -> None:
+    _games[(game_id, date)] = snapshot
+    path = _path(game_id, date)
+    try:
+        GAMES_DIRECTORY.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp, path)
+    except OSError:
+        LOGGER.warning("Could not store data for game %s", str(game_id))
+    prune()
+
+
+def prune() -> None:
+    """Deletes stored games older than MAX_AGE, and forgets all but the latest day's games."""
+    _forget_older_days()
+
+    cutoff = time.time() - MAX_AGE
+    try:
+        for path in GAMES_DIRECTORY.glob("*.json"):
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+    except OSError:
+        LOGGER.warning("Could not clean up stored game data")
+
+
+def _forget_older_days() -> None:
+    if _games:
+        latest = max(date for _, date in _games)
+        # anything older is read from disk again if it is needed
+        for key in [key for key in _games if key[1] != latest]:
+            del _games[key]
+
+
+def _path(game_id: int, date: str):
+    return GAMES_DIRECTORY / f"{date}_{game_id}.json"
@@ -0,0 +1,218 @@
+"""
+A game's data, parsed once per update.
+
+The raw game feed is a deeply nested dict. Rather than digging through it every time
+the render thread asks for a value, each update is parsed into a `GameSnapshot`, whose
+fields are read as-is. Snapshots are never modified, so the render thread can safely
+keep using one while the data thread builds the next.
+"""
+
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+from data import teams
+
+
+class TeamSnapshot(NamedTuple):
+    id: int
+    name: str
+    abbreviation: str
+    team_name: str
+    record: dict[str, Any]
+    runs: int
+    hits: int
+    errors: int
+
+
+class PlayerSnapshot(NamedTuple):
+    full_name: str
+    boxscore_name: str
+
+
+class GameSnapshot(NamedTuple):
+    start_time: Optional[datetime]
+    home: TeamSnapshot
+    away: TeamSnapshot
+    weather: Optional[str]
+
+    status: str
+    reason: Optional[str]
+    winning_team: Optional[str]
+
+    inning_state: str
+    inning_number: int
+    inning_ordinal: str
+    no_hitter: bool
+    perfect_game: bool
+
+    balls: int
+    strikes: int
+    outs: int
+    runners: dict[str, Optional[int]]
+    batter: str
+    in_hole: str
+    on_deck: str
+    pitcher: str
+    pitch_count: int
+    last_pitch: Optional[tuple[float, str, str]]
+    play_result: str
+    note: Optional[str]
+
+    players: dict[int, PlayerSnapshot]
+    # season pitching stats of each player in the boxscore, by team ("home"/"away") then player ID
+    season_pitching: dict[str, dict[int, dict[str, Any]]]
+    probable_pitchers: dict[str, Optional[int]]
+    decisions: dict[str, Optional[int]]
+
+
+def parse_snapshot(live_data: dict[str, Any], game_status: dict[str, Any]) -> GameSnapshot:
+    """
+    Parse a game feed (filtered with `data.game.API_FIELDS`) into a snapshot.
+    `game_status` is passed separately, as it doesn't always come from the feed.
+    """
+    game_data = live_data["gameData"]
+    linescore = live_data["liveData"]["linescore"]
+    boxscore = live_data["liveData"].get("boxscore", {}).get("teams", {})
+    plays = live_data["liveData"].get("plays", {})
+    offense = linescore.get("offense", {})
+    defense = linescore.get("defense", {})
+
+    players = {
+        player["id"]: PlayerSnapshot(player.get("fullName", ""), player.get("boxscoreName", ""))
+        for player in game_data.get("players", {}).values()
+    }
+
+    scores = linescore.get("teams", {})
+    home = _parse_team(game_data["teams"]["home"], scores.get("home", {}))
+    away = _parse_team(game_data["teams"]["away"], scores.get("away", {}))
+
+    winning_team = None
+    if game_status["abstractGameState"] == "Final":
+        if home.runs > away.runs:
+            winning_team = "home"
+        elif home.runs < away.runs:
+            winning_team = "away"
+
+    return GameSnapshot(
+        start_time=_parse_datetime(game_data.get("datetime", {}).get("dateTime")),
+        home=home,
+        away=away,
+        weather=_parse_weather(game_data),
+        status=game_status["detailedState"],
+        reason=_parse_reason(game_status),
+        winning_team=winning_team,
+        inning_state=linescore.get("inningState", "Top"),
+        inning_number=linescore.get("currentInning", 0),
+        inning_ordinal=linescore.get("currentInningOrdinal", 0),
+        no_hitter=game_data.get("flags", {}).get("noHitter", False),
+        perfect_game=game_data.get("flags", {}).get("perfectGame", False),
+        balls=linescore.get("balls", 0),
+        strikes=linescore.get("strikes", 0),
+        outs=linescore.get("outs", 0),
+        runners={base: offense.get(base, {}).get("id") for base in ("first", "second", "third")},
+        batter=_player_name(players, offense.get("batter")),
+        in_hole=_player_name(players, offense.get("inHole")),
+        on_deck=_player_name(players, offense.get("onDeck")),
+        pitcher=_player_name(players, defense.get("pitcher")),
+        pitch_count=_pitch_count(boxscore, defense.get("pitcher")),
+        last_pitch=_parse_last_pitch(plays),
+        play_result=_parse_play_result(plays),
+        note=linescore.get("note"),
+        players=players,
+        season_pitching={
+            side: {
+                player_id(key): player["seasonStats"]["pitching"]
+                for key, player in team.get("players", {}).items()
+                if "pitching" in player.get("seasonStats", {})
+            }
+            for side, team in boxscore.items()
+        },
+        probable_pitchers={side: pitcher.get("id") for side, pitcher in game_data.get("probablePitchers", {}).items()},
+        decisions={
+            decision: pitcher.get("id") for decision, pitcher in live_data["liveData"].get("decisions", {}).items()
+        },
+    )
+
+
+def player_id(player) -> int:
+    """Player IDs are sometimes given in the feed's "ID123456" format."""
+    if isinstance(player, int):
+        return player
+    return int(str(player).removeprefix("ID"))
+
+
+def _parse_team(team: dict[str, Any], score: dict[str, Any]) -> TeamSnapshot:
+    return TeamSnapshot(
+        id=team["id"],
+        name=teams.TEAM_ID_NAME.get(team["id"], team["teamName"]),
+        abbreviation=teams.TEAM_ID_ABBR.get(team["id"], team["abbreviation"]),
+        team_name=team["teamName"],
+        record=team.get("record") or {},
+        runs=score.get("runs", 0),
+        hits=score.get("hits", 0),
+        errors=score.get("errors", 0),
+    )
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _parse_weather(game_data: dict[str, Any]):
+    try:
+        weather = game_data["weather"]
+        return weather["condition"] + " and " + weather["temp"] + "\N{DEGREE SIGN}" + " wind " + weather["wind"]
+    except KeyError:
+        return None
+
+
+def _parse_reason(game_status: dict[str, Any]):
+    if "reason" in game_status:
+        return game_status["reason"]
+    try:
+        return game_status["detailedState"].split(":")[1].strip()
+    except:
+        return None
+
+
+def _player_name(players: dict[int, PlayerSnapshot], player: Optional[dict[str, Any]]) -> str:
+    try:
+        return players[player["id"]].boxscore_name  # type: ignore[index]
+    except:
+        return ""
+
+
+def _pitch_count(boxscore: dict[str, Any], pitcher: Optional[dict[str, Any]]):
+    if pitcher is None or "id" not in pitcher:
+        return 0
+    key = "ID" + str(pitcher["id"])
+    for side in ("away", "home"):
+        try:
+            return boxscore[side]["players"][key]["stats"]["pitching"]["numberOfPitches"]
+        except (KeyError, TypeError):
+            continue
+    return 0
+
+
+def _parse_last_pitch(plays: dict[str, Any]) -> Optional[tuple[float, str, str]]:
+    try:
+        play = plays.get("currentPlay", {}).get("playEvents", [{}])[-1]
+        if play.get("isPitch", False):
+            return (
+                play["pitchData"].get("startSpeed", 0),
+                play["details"]["type"]["code"],
+                play["details"]["type"]["description"],
+            )
+    except:
+        pass
+    return None
+
+
+def _parse_play_result(plays: dict[str, Any]):
+    result = plays.get("currentPlay", {}).get("result", {})
+    event = result.get("eventType", "")
+    if event == "strikeout" and "called" in result.get("description", ""):
+        event += "_looking"
+    return event
@@ -5,3 +5,4 @@ CURRENT_DIRECTORY = Path.cwd()
 ROOT_DIRECTORY = (Path(__file__) / ".." / "..").resolve()
 COORDINATES_DIRECTORY = ROOT_DIRECTORY / "coordinates"
 COLORS_DIRECTORY = ROOT_DIRECTORY / "colors"
+CACHE_DIRECTORY = ROOT_DIRECTORY / "cache"
@@ -0,0 +1,87 @@
+"""
+Decides how long to wait before fetching a game (or the schedule) again.
+
+Fetches are driven by what is happening in the game rather than a single fixed rate:
+games hours away are barely polled, live at-bats are polled as often as the API allows,
+and finished games are never fetched again.
+"""
+
+from datetime import datetime
+from typing import Any, Iterable, Optional
+
+from data import status
+
+# Schedule data is re-checked on this cadence, even when nothing needs to be fetched
+SCHEDULE_REFRESH_RATE = 15
+# Longest we go without fetching the schedule or a game
+IDLE_REFRESH_RATE = 10 * 60
+
+# Games starting within this window are polled at PREGAME_REFRESH_RATE
+PREGAME_WINDOW = 60 * 60
+PREGAME_REFRESH_RATE = 60
+
+INNING_BREAK_REFRESH_RATE = 30
+# Delayed and suspended games, or games that are over but not yet official
+STALLED_REFRESH_RATE = 60
+
+
+def next_game_update(live_data: dict[str, Any], refresh_rate: float, now: datetime) -> Optional[float]:
+    """
+    Returns the number of seconds until `live_data` (a game feed) should be fetched again,
+    or None if the game is over and never needs to be fetched again.
+
+    `now` must be timezone aware.
+    """
+    game_status = live_data["gameData"]["status"]
+    detailed_state = game_status["detailedState"]
+
+    if game_status["abstractGameState"] == "Final":
+        # 'Game Over' comes shortly before 'Final', while decisions and stats are still being settled
+        if detailed_state in status.GAME_STATE_FRESH:
+            return STALLED_REFRESH_RATE
+        return None
+
+    if _is_stalled(detailed_state):
+        return STALLED_REFRESH_RATE
+
+    if game_status["abstractGameState"] == "Preview":
+        return _until_pregame_window(_parse_datetime(live_data["gameData"]["datetime"]["dateTime"]), refresh_rate, now)
+
+    # the API tells us how often its live data changes
+    wait: float = max(refresh_rate, live_data.get("metaData", {}).get("wait", 0))
+    if status.is_inning_break(live_data["liveData"]["linescore"].get("inningState", "Top")):
+        return max(wait, INNING_BREAK_REFRESH_RATE)
+    return wait
+
+
+def next_schedule_update(games: Iterable[dict[str, Any]], now: datetime) -> float:
+    """
+    Returns the number of seconds until the schedule should be fetched again, given
+    the games (see `data.schedule.parse_schedule`) it contained last time.
+    """
+    delay: float = IDLE_REFRESH_RATE
+    for game in games:
+        game_status = game["status"]
+        if status.is_pregame(game_status) and game_status != status.WARMUP:
+            delay = min(
+                delay, _until_pregame_window(_parse_datetime(game["game_datetime"]), SCHEDULE_REFRESH_RATE, now)
+            )
+        elif status.is_live(game_status) or status.is_fresh(game_status) or _is_stalled(game_status):
+            return SCHEDULE_REFRESH_RATE
+
+    return delay
+
+
+def _until_pregame_window(start: datetime, refresh_rate: float, now: datetime) -> float:
+    until_window = (start - now).total_seconds() - PREGAME_WINDOW
+    if until_window <= 0:
+        return max(refresh_rate, PREGAME_REFRESH_RATE)
+    return min(max(until_window, refresh_rate), IDLE_REFRESH_RATE)
+
+
+def _is_stalled(detailed_state: str) -> bool:
+    return detailed_state.startswith((status.DELAYED, status.SUSPENDED))
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -1,79 +1,94 @@
 import datetime
-import time
 from collections import defaultdict
 from typing import Any, Optional
-from math import ceil
 
 import statsapi
 
+from bullpen import clock
 from bullpen.logging import LOGGER
 from data.game import Game
 from bullpen.api import UpdateStatus
-from data.utils.circular_queue import CircularQueue
+from data.utils.delay_buffer import DelayBuffer
 from data.config import Config
+from data.polling import SCHEDULE_REFRESH_RATE, next_schedule_update
+import data.headers
 
-GAMES_REFRESH_RATE = 15
+# the schedule already knows each game's status, score and inning, which is all our rotation rules need
+SCHEDULE_HYDRATE = "linescore,broadcasts,seriesStatus,game(content(media(epg)))"
+SCHEDULE_API_FIELDS = (
+    "dates,date,games,gamePk,gameDate,status,detailedState,abstractGameState,reason,teams,away,home,team,id,score,"
+    + "linescore,currentInning,inningState,broadcasts,name,isNational,seriesStatus,result,content,media,freeGame"
+)
 
 
 class Schedule:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.date = self.config.parse_today()
-        self.starttime = time.time()
+        self.starttime = clock.time()
         self.current_idx = 0
 
-        delay_required = ceil(self.config.sync_delay_seconds / GAMES_REFRESH_RATE)
-
-        self._data_wait_queue = CircularQueue(delay_required + 1)
+        # the priority and games we would show, until they are old enough to be shown
+        self._data_wait_queue: DelayBuffer[tuple[int, list[dict[str, Any]]]] = DelayBuffer(
+            self.config.sync_delay_seconds
+        )
         # the (filtered) schedule
         self._games: list[dict[str, Any]] = []
+        # the full schedule from the last fetch
+        self._all_games: list[dict[str, Any]] = []
+        self._next_fetch = 0.0
         self.priority = 0
         self.update(True)
 
     def update(self, force=False) -> UpdateStatus:
         if force or self.__should_update():
-            self.date = self.config.parse_today()
-            LOGGER.debug("Updating schedule for %s", self.date)
-            self.starttime = time.time()
-            try:
-                # add sportId=51 to additionally get WBC games
-                all_games = statsapi.schedule(self.date.strftime("%Y-%m-%d"), sportId="1,51")
-            except:
-                LOGGER.exception("Networking error while refreshing schedule")
-                return UpdateStatus.FAIL
+            date = self.config.parse_today()
+            self.starttime = clock.time()
+            fetched = force or date != self.date or self.starttime >= self._next_fetch
+            if fetched:
+                LOGGER.debug("Updating schedule for %s", date)
+                try:
+                    self._all_games = fetch_schedule(date.strftime("%Y-%m-%d"))
+                except:
+                    LOGGER.exception("Networking error while refreshing schedule")
+                    return UpdateStatus.FAIL
+                self.date = date
+                delay = next_schedule_update(self._all_games, clock.now(datetime.timezone.utc))
+                self._next_fetch = self.starttime + delay
+                LOGGER.debug("Next schedule fetch in %d seconds", delay)
+
+            # even without new data, which games we show depends on the time
+            priority, games = self.__filter_games(self._all_games)
+            if priority > self.priority:
+                # going up a priority level should never be delayed
+                self._data_wait_queue.clear()
+            self._data_wait_queue.push((priority, games))
+
+            priority, games = self._data_wait_queue.peek()
+
+            if len(games) > 0:
+                self.current_idx %= len(games)
             else:
-
-                priority, games = self.__filter_games(all_games)
-                if priority > self.priority:
-                    # going up a priority level should never be delayed
-                    self._data_wait_queue.clear()
-                self._data_wait_queue.push((priority, games))
-
-                priority, games = self._data_wait_queue.peek()
-
-                if len(games) > 0:
-                    self.current_idx %= len(games)
-                else:
-                    self.current_idx = 0
-
-                self._games = games
-                self.priority = priority
-                LOGGER.debug(
-                    "Schedule updated with %d games (priority %d) (current delay %d)",
-                    len(self._games),
-                    priority,
-                    self.current_delay(),
-                )
-                return UpdateStatus.SUCCESS
+                self.current_idx = 0
+
+            self._games = games
+            self.priority = priority
+            LOGGER.debug(
+                "Schedule updated with %d games (priority %d) (current delay %d)",
+                len(self._games),
+                priority,
+                self.current_delay(),
+            )
+            return UpdateStatus.SUCCESS if fetched else UpdateStatus.DEFERRED
 
         return UpdateStatus.DEFERRED
 
     def __should_update(self):
-        endtime = time.time()
-        return endtime - self.starttime >= GAMES_REFRESH_RATE
+        endtime = clock.time()
+        return endtime - self.starttime >= SCHEDULE_REFRESH_RATE
 
     def current_delay(self):
-        return (len(self._data_wait_queue) - 1) * GAMES_REFRESH_RATE
+        return self._data_wait_queue.lag()
 
     def num_games(self):
         return len(self._games)
@@ -107,8 +122,9 @@ class Schedule:
         priorities: defaultdict[int, list] = defaultdict(list)
         highest = 0
 
+        now = clock.now()
         for rule in self.config.rotation_time_rules:
-            priority = rule.matches(datetime.datetime.now())
+            priority = rule.matches(now)
             if priority:
                 highest = max(highest, priority)
 
@@ -127,3 +143,44 @@ class Schedule:
                         highest = max(highest, priority)
 
         return highest, priorities[highest]
+
+
+def fetch_schedule(date: str) -> list[dict[str, Any]]:
+    # add sportId=51 to additionally get WBC games
+    response = statsapi.get(
+        "schedule",
+        {"date": date, "sportId": "1,51", "hydrate": SCHEDULE_HYDRATE, "fields": SCHEDULE_API_FIELDS},
+        request_kwargs={"headers": data.headers.API_HEADERS},
+    )
+    return parse_schedule(response)
+
+
+def parse_schedule(response: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Turns a raw schedule response into a list of games. The keys match those
+    of `statsapi.schedule`, plus the game's full `status` object as `status_data`.
+    """
+    games = []
+    for date in response.get("dates", []):
+        for game in date.get("games", []):
+            linescore = game.get("linescore", {})
+            broadcasts = set(b["name"] for b in game.get("broadcasts", []) if b.get("isNational", False))
+            game_info = {
+                "game_id": game["gamePk"],
+                "game_datetime": game["gameDate"],
+                "game_date": date["date"],
+                "status": game["status"]["detailedState"],
+                "status_data": game["status"],
+                "away_id": game["teams"]["away"]["team"]["id"],
+                "home_id": game["teams"]["home"]["team"]["id"],
+                "away_score": game["teams"]["away"].get("score", 0),
+                "home_score": game["teams"]["home"].get("score", 0),
+                "current_inning": linescore.get("currentInning", ""),
+                "inning_state": linescore.get("inningState", ""),
+                "national_broadcasts": list(broadcasts),
+                "series_status": game.get("seriesStatus", {}).get("result"),
+            }
+            if game.get("content", {}).get("media", {}).get("freeGame", False):
+                game_info["national_broadcasts"].append("MLB.tv Free Game")
+            games.append(game_info)
+    return games
@@ -22,17 +22,13 @@ class Team:
         Any missing data is filled in with the default colors.
         If the team has a special uniform, the colors for that uniform are substituted
         """
-        default_colors = team_colors.color("default")
         if self.abbrev in _IGNORED_TEAMS:
-            return default_colors
+            return team_colors.color("default")
 
         try:
-            colors = team_colors.color(self.abbrev.lower())
-            if self.special_uniform is not None and self.special_uniform in colors:
-                colors = colors | colors[self.special_uniform]
-            return default_colors | colors
+            return team_colors.palette(self.abbrev.lower(), self.special_uniform)
 
         except KeyError:
             LOGGER.exception("No color found for team: {}".format(self.abbrev))
             _IGNORED_TEAMS.add(self.abbrev)
-            return default_colors
+            return team_colors.color("default")
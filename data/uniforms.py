@@ -1,6 +1,6 @@
-import time
 import statsapi
 
+from bullpen import clock
 from bullpen.logging import LOGGER
 import data.headers
 
@@ -20,10 +20,18 @@ class Uniforms:
         self.game_id = game_id
         self.home_special = None
         self.away_special = None
-        self.starttime = time.time()
+        self.starttime = clock.time()
         self._special_uniforms = {key: _make_uniform_check(val) for key, val in uniform_types.items()}
         self.update(force=True)
 
+    @staticmethod
+    def from_known(game_id, home_special, away_special) -> "Uniforms":
+        """Uniforms we already know, e.g. for a game that is over. Makes no API calls."""
+        uniforms = Uniforms(game_id, {})
+        uniforms.home_special = home_special
+        uniforms.away_special = away_special
+        return uniforms
+
     def home_special_uniform(self):
         return self.home_special
 
@@ -58,6 +66,6 @@ class Uniforms:
             LOGGER.exception(f"Error while fetching game {self.game_id} uniform data")
 
     def __should_update(self):
-        endtime = time.time()
+        endtime = clock.time()
         time_delta = endtime - self.starttime
         return time_delta >= UPDATE_RATE
@@ -0,0 +1,61 @@
+from bisect import bisect_right
+from typing import Callable, Generic, TypeVar
+
+import bullpen.clock
+
+T = TypeVar("T")
+
+
+class DelayBuffer(Generic[T]):
+    """
+    Holds on to values for `delay` seconds before showing them, to keep the
+    scoreboard from spoiling a delayed broadcast.
+
+    `peek` returns the value as it was exactly `delay` seconds ago, however often
+    values were pushed in the meantime. Like a spoiler delay on a stream, the first
+    value pushed is shown straight away, and then held until the delay has built up.
+
+    A value is only stored when it differs from the one before it, and values
+    older than the one being shown are dropped, so a game that changes rarely
+    costs the same however long the delay is.
+    """
+
+    def __init__(self, delay: float, now: Callable[[], float] = bullpen.clock.monotonic) -> None:
+        self.delay = delay
+        self._now = now
+        self._times: list[float] = []
+        self._values: list[T] = []
+        # when the first value was pushed, for how long the delay has had to build up
+        self._started = 0.0
+
+    def push(self, value: T) -> None:
+        if self._values and self._values[-1] == value:
+            return
+        now = self._now()
+        if not self._values:
+            self._started = now
+        self._times.append(now)
+        self._values.append(value)
+
+    def peek(self) -> T:
+        """The value as of `delay` seconds ago, or the oldest we have. Raises IndexError if empty."""
+        if not self._values:
+            raise IndexError("peek from an empty DelayBuffer")
+        shown = max(bisect_right(self._times, self._now() - self.delay) - 1, 0)
+        if shown:
+            del self._times[:shown]
+            del self._values[:shown]
+        return self._values[0]
+
+    def lag(self) -> float:
+        """How many seconds behind the shown value is, which is less than `delay` until it has built up"""
+        if not self._values:
+            return 0.0
+        return max(min(self.delay, self._now() - self._started), 0.0)
+
+    def clear(self) -> None:
+        self._times.clear()
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
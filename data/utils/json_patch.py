@@ -0,0 +1,134 @@
+import copy
+from typing import Any, Callable, Optional
+
+
+class JsonPatchError(Exception):
+    """Raised when a patch can't be applied, meaning our copy of the document is out of sync."""
+
+
+class _Filtered(Exception):
+    """The operation targets part of the document we don't keep (see `apply_patch`)."""
+
+
+def apply_patch(document: Any, operations: list[dict[str, Any]], keep: Optional[Callable[[str], bool]] = None) -> Any:
+    """
+    Apply a list of JSON Patch (RFC 6902) operations to `document`, returning the new document.
+
+    The input document is never modified. Only the containers along each patched path are copied,
+    everything else is shared with the original. This lets older versions of a document (e.g. one
+    still being read elsewhere) stay valid while newer ones are built from them.
+
+    Our documents are filtered with the API's `fields` parameter, but patches are generated against
+    the full document, so operations touching keys we filtered out are skipped rather than treated
+    as errors. If `keep` is given, it says which keys the filter keeps: anything else is left out of
+    what is added, and a kept key missing along a path means we are out of sync. Anything else that
+    doesn't line up raises `JsonPatchError`.
+    """
+    root = {"": document}
+    owned: set[int] = set()  # containers copied during this call, which are safe to modify in place
+
+    for operation in operations:
+        try:
+            _apply_operation(root, operation, owned, keep)
+        except _Filtered:
+            continue
+        except JsonPatchError:
+            raise
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise JsonPatchError(f"Could not apply {operation}") from e
+
+    return root[""]
+
+
+def _apply_operation(root: dict, operation: dict[str, Any], owned: set[int], keep: Optional[Callable[[str], bool]]):
+    op = operation["op"]
+    container, key = _locate(root, operation["path"], owned, keep)
+
+    if op == "add":
+        _add(container, key, operation["value"], keep)
+    elif op == "remove":
+        _remove(container, key)
+    elif op == "replace":
+        _remove(container, key)
+        _add(container, key, operation["value"], keep)
+    elif op == "move":
+        value = _remove(*_locate(root, operation["from"], owned, keep))
+        container, key = _locate(root, operation["path"], owned, keep)
+        _add(container, key, value, keep)
+    elif op == "copy":
+        value = _get(*_locate(root, operation["from"], owned, keep))
+        _add(container, key, copy.deepcopy(value), keep)
+    elif op == "test":
+        if _get(container, key) != operation["value"]:
+            raise JsonPatchError(f"Test failed: {operation}")
+    else:
+        raise JsonPatchError(f"Unknown operation: {op}")
+
+
+def _locate(root: dict, pointer: str, owned: set[int], keep: Optional[Callable[[str], bool]]) -> tuple[Any, Any]:
+    """
+    Find the container and key `pointer` refers to, copying every container on the way
+    (including the one returned) so it can be modified without touching the original document.
+    """
+    if pointer and not pointer.startswith("/"):
+        raise JsonPatchError(f"Invalid path: {pointer}")
+
+    container: Any = root
+    key: Any = ""
+    for token in pointer.split("/")[1:]:
+        if keep is not None and isinstance(container, dict) and key not in container and keep(key):
+            raise JsonPatchError(f"Missing {key} in {pointer}")
+        child = _get(container, key)
+        if id(child) not in owned:
+            child = copy.copy(child)
+            owned.add(id(child))
+            container[key] = child
+        container = child
+        key = _key(container, token.replace("~1", "/").replace("~0", "~"))
+    return container, key
+
+
+def _key(container: Any, token: str) -> Any:
+    if isinstance(container, list):
+        if token == "-":
+            return len(container)
+        if not token.isdigit():
+            raise JsonPatchError(f"Invalid array index: {token}")
+        return int(token)
+    if isinstance(container, dict):
+        return token
+    raise JsonPatchError(f"Cannot index into {type(container).__name__}")
+
+
+def _get(container, key):
+    if isinstance(container, dict) and key not in container:
+        raise _Filtered()
+    return container[key]
+
+
+def _add(container, key, value, keep):
+    if keep is not None:
+        if isinstance(container, dict) and not keep(key):
+            raise _Filtered()
+        value = _filter(value, keep)
+    if isinstance(container, list):
+        if not 0 <= key <= len(container):
+            raise JsonPatchError(f"Index {key} out of range")
+        container.insert(key, value)
+    else:
+        container[key] = value
+
+
+def _filter(value, keep):
+    """`value` with only the keys `keep` keeps, as the API would have sent it"""
+    if isinstance(value, dict):
+        return {k: _filter(v, keep) for k, v in value.items() if keep(k)}
+    if isinstance(value, list):
+        return [_filter(v, keep) for v in value]
+    return value
+
+
+def _remove(container, key):
+    if isinstance(container, dict) and key not in container:
+        raise _Filtered()
+    return container.pop(key)
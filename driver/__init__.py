@@ -11,6 +11,8 @@ class DriverWrapper:
     def __init__(self):
         self.hardware_load_failed = False
         self.mode = None
+        # so the submodules (like driver.null) can still be imported once this stands in for the package
+        self.__path__ = __path__
 
         if "unittest" in sys.modules:
             self.set_mode(DriverMode.SOFTWARE_EMULATION)
@@ -27,6 +29,9 @@ class DriverWrapper:
     def is_emulated(self):
         return self.mode == DriverMode.SOFTWARE_EMULATION
 
+    def is_headless(self):
+        return self.mode == DriverMode.HEADLESS
+
     def set_mode(self, mode):
         self.mode = mode
 
@@ -41,6 +46,10 @@ class DriverWrapper:
                 self.mode = DriverMode.SOFTWARE_EMULATION
                 self.driver = RGBMatrixEmulator
                 self.hardware_load_failed = True
+        elif self.is_headless():
+            import driver.null
+
+            self.driver = driver.null
         else:
             import RGBMatrixEmulator
 
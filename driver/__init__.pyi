@@ -13,4 +13,5 @@ hardware_load_failed: bool
 
 def is_hardware() -> bool: ...
 def is_emulated() -> bool: ...
+def is_headless() -> bool: ...
 def set_mode(mode: DriverMode) -> None: ...
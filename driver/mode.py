@@ -4,3 +4,5 @@ from enum import Enum
 class DriverMode(Enum):
     HARDWARE = 0
     SOFTWARE_EMULATION = 1
+    # draws into memory only, see driver.null
+    HEADLESS = 2
@@ -0,0 +1,89 @@
+"""
+A display driver that only draws into memory.
+
+It has the same API as `rgbmatrix` (and so the emulator), but nothing is ever shown, so it costs
+nothing beyond the drawing itself. This makes it useful for measuring how long our own rendering
+takes, and for testing it on machines without a display.
+
+What was drawn can be inspected through `instruments`: it can count the draw calls made and
+keep a copy of every frame swapped onto the display. Both are off until turned on.
+"""
+
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+from driver.null import graphics
+from driver.null.instruments import Instruments, instruments
+
+__version__ = "null"
+
+__all__ = ["Canvas", "FrameCanvas", "Instruments", "RGBMatrix", "RGBMatrixOptions", "graphics", "instruments"]
+
+
+class RGBMatrixOptions:
+    def __init__(self) -> None:
+        self.rows = 32
+        self.cols = 32
+        self.chain_length = 1
+        self.parallel = 1
+        self.brightness = 100
+
+
+class Canvas:
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+
+    def Fill(self, red: int, green: int, blue: int) -> None:
+        instruments.count("Fill")
+        self.pixels[:, :] = (red, green, blue)
+
+    def Clear(self) -> None:
+        instruments.count("Clear")
+        self.pixels.fill(0)
+
+    def SetPixel(self, x: int, y: int, red: int, green: int, blue: int) -> None:
+        instruments.count("SetPixel")
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[y, x] = (red, green, blue)
+
+    def SetImage(self, image: Image.Image, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True) -> None:
+        instruments.count("SetImage")
+        left, top = max(offset_x, 0), max(offset_y, 0)
+        right, bottom = min(offset_x + image.width, self.width), min(offset_y + image.height, self.height)
+        if left < right and top < bottom:
+            source = np.asarray(image.convert("RGB"))
+            self.pixels[top:bottom, left:right] = source[
+                top - offset_y : bottom - offset_y, left - offset_x : right - offset_x
+            ]
+
+    def _set_points(self, xs: np.ndarray, ys: np.ndarray, color: "graphics.Color") -> None:
+        inside = (0 <= xs) & (xs < self.width) & (0 <= ys) & (ys < self.height)
+        self.pixels[ys[inside], xs[inside]] = (color.red, color.green, color.blue)
+
+
+class FrameCanvas(Canvas):
+    pass
+
+
+class RGBMatrix(Canvas):
+    def __init__(self, options: Any = None) -> None:
+        options = options or RGBMatrixOptions()
+        super().__init__(options.cols * options.chain_length, options.rows * options.parallel)
+        self.brightness = getattr(options, "brightness", 100)
+        self.__shown = FrameCanvas(self.width, self.height)
+
+    def CreateFrameCanvas(self) -> FrameCanvas:
+        return FrameCanvas(self.width, self.height)
+
+    def SwapOnVSync(self, canvas: FrameCanvas, framerate_fraction: int = 1) -> FrameCanvas:
+        """Shows `canvas`, and returns the canvas that was shown before it to draw the next frame on."""
+        instruments.count("SwapOnVSync")
+        if instruments.capturing:
+            instruments.frames.append(canvas.pixels.copy())
+        self.pixels[:] = canvas.pixels
+        previous, self.__shown = self.__shown, canvas
+        return previous
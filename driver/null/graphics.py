@@ -0,0 +1,101 @@
+"""
+The `graphics` module of the null driver.
+
+Letters are drawn the way `rgbmatrix` draws them: each glyph's bitmap with its baseline at `y`,
+the font's replacement character standing in for missing glyphs, and nothing past a glyph's
+advance width.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+import bdfparser
+import numpy as np
+
+from bullpen.clip import circle_points, line_points
+from driver.null.instruments import instruments
+
+if TYPE_CHECKING:
+    from driver.null import Canvas
+
+# Drawn in place of glyphs the font doesn't have
+REPLACEMENT_CODEPOINT = 0xFFFD
+
+
+class Color:
+    def __init__(self, red: int = 0, green: int = 0, blue: int = 0) -> None:
+        self.red = red
+        self.green = green
+        self.blue = blue
+
+
+class Font:
+    def __init__(self) -> None:
+        self._bdf: Optional[bdfparser.Font] = None
+
+    def LoadFont(self, file: str) -> None:
+        try:
+            self._bdf = bdfparser.Font(file)
+        except Exception as e:
+            raise Exception("Couldn't load font " + file) from e
+
+    def CharacterWidth(self, char: int) -> int:
+        glyph = self.__find(char)
+        # Missing glyphs return -1, like rgbmatrix
+        if glyph is None:
+            return -1
+        return int(glyph.meta["dwx0"])
+
+    @property
+    def height(self) -> int:
+        if self._bdf is None:
+            return -1
+        return int(self._bdf.headers["fbby"])
+
+    @property
+    def baseline(self) -> int:
+        if self._bdf is None:
+            return 0
+        return int(self._bdf.headers["fbby"] + self._bdf.headers["fbbyoff"])
+
+    @lru_cache(maxsize=512)
+    def _glyph(self, letter: str) -> tuple[np.ndarray, np.ndarray, int]:
+        """The lit pixels of a letter relative to its left edge on the baseline, and its advance width."""
+        glyph = self.__find(ord(letter)) or self.__find(REPLACEMENT_CODEPOINT)
+        if glyph is None:
+            return np.zeros(0, dtype=int), np.zeros(0, dtype=int), 0
+
+        meta = glyph.meta
+        advance = meta["dwx0"]
+        rows = np.array(glyph.draw().todata(2), dtype=bool).reshape(meta["bbh"], meta["bbw"])
+        # pixels past the advance width are dropped
+        ys, xs = np.nonzero(rows[:, : max(advance - meta["bbxoff"], 0)])
+        return xs + meta["bbxoff"], ys - meta["bbh"] - meta["bbyoff"], advance
+
+    def __find(self, codepoint: int) -> Optional[bdfparser.Glyph]:
+        # bdfparser warns about every missing glyph it is asked for
+        if self._bdf is None or codepoint not in self._bdf.glyphs:
+            return None
+        return self._bdf.glyphbycp(codepoint)
+
+
+def DrawText(canvas: "Canvas", font: Font, x: int, y: int, color: Color, text: str) -> int:
+    instruments.count("DrawText")
+    start = x
+    for letter in text:
+        xs, ys, advance = font._glyph(letter)
+        canvas._set_points(xs + x, ys + y, color)
+        x += advance
+    return x - start
+
+
+def DrawLine(canvas: "Canvas", x1: int, y1: int, x2: int, y2: int, color: Color) -> None:
+    instruments.count("DrawLine")
+    xs, ys = np.array(list(line_points(x1, y1, x2, y2))).T
+    canvas._set_points(xs, ys, color)
+
+
+def DrawCircle(canvas: "Canvas", x: int, y: int, r: int, color: Color) -> None:
+    instruments.count("DrawCircle")
+    xs, ys = np.array(list(circle_points(x, y, r))).T
+    canvas._set_points(xs, ys, color)
@@ -0,0 +1,24 @@
+from collections import Counter
+
+import numpy as np
+
+
+class Instruments:
+    def __init__(self) -> None:
+        # Whether draw calls are counted into `calls`, by name
+        self.counting = False
+        self.calls: Counter[str] = Counter()
+        # Whether every frame swapped onto the display is copied into `frames`
+        self.capturing = False
+        self.frames: list[np.ndarray] = []
+
+    def count(self, name: str) -> None:
+        if self.counting:
+            self.calls[name] += 1
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.frames.clear()
+
+
+instruments = Instruments()
@@ -18,16 +18,18 @@ if statsapi_version < (1, 9, 0):
 
 import os
 import threading
-import time
 
 from PIL import Image
 from pathlib import Path
 
+import cli
 import driver
 
+from bullpen import clock, http
 
 from data import Data
 from data.config import Config
+from data.headers import API_HEADERS
 from data.plugins import load_plugins
 
 from renderers.main import MainRenderer
@@ -70,20 +72,20 @@ def main(matrix, config):
     render = threading.Thread(
         target=__render_main, args=[matrix, data, plugin_renderers], name="render_thread", daemon=True
     )
-    time.sleep(1)
+    clock.sleep(1)
     render.start()
 
     while render.is_alive():
-        time.sleep(0.1)
+        clock.sleep(0.1)
         data.refresh_schedule()
-        time.sleep(0.1)
+        clock.sleep(0.1)
         if data.schedule.num_games():
             data.refresh_game()
-        time.sleep(0.1)
+        clock.sleep(0.1)
         for plugin in plugin_data:
             if data.config.screen_time_at_priority(plugin, data.schedule.priority):
                 data.refresh_plugin(plugin)
-        time.sleep(0.2)
+        clock.sleep(0.2)
 
 
 def __render_main(matrix, data, plugins):
@@ -91,6 +93,18 @@ def __render_main(matrix, data, plugins):
 
 
 if __name__ == "__main__":
+    # All Stats API traffic (including plugins) shares one pool of kept-alive connections
+    http.install(API_HEADERS)
+
+    # set up before the config, which already makes requests
+    args = cli.arguments()
+    if args.api_url:
+        http.set_base_url(args.api_url)
+    if args.record:
+        http.record(args.record)
+    elif args.replay:
+        http.replay(args.replay)
+
     config = Config()
 
     if config.emulated:
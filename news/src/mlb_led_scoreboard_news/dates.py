@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, date
 
 import statsapi
 
+from bullpen import clock
 from bullpen.logging import LOGGER
 
 
@@ -12,7 +13,7 @@ class Dates:
         try:
             data_d = statsapi.get("season", {"sportId": 1, "seasonId": year})
             end_date = self.__parse_important_dates(data_d["seasons"][0], year)
-            now = datetime.now()
+            now = clock.now()
             if year == now.year and end_date < now:
                 data_d = statsapi.get("season", {"sportId": 1, "seasonId": year + 1})
                 self.__parse_important_dates(data_d["seasons"][0], year + 1)
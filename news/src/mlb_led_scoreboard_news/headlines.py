@@ -1,10 +1,9 @@
 import html
-import time
-from datetime import datetime
 from typing import Any
 
 import feedparser
 
+from bullpen import clock
 from bullpen.api import UpdateStatus
 from bullpen.logging import LOGGER
 
@@ -101,7 +100,7 @@ class Headlines:
         self.date_format = config.news_ticker_date_format
         self.feed_urls: list[str] = []
         self.feed_data: list[Any] = []
-        self.starttime = time.time()
+        self.starttime = clock.time()
         self.important_dates = Dates(config.custom_countdowns, config.date)
 
         self.ticker: list[str] = []
@@ -114,7 +113,7 @@ class Headlines:
         status = UpdateStatus.SUCCESS
         if force or self.__should_update():
             LOGGER.debug("Headlines should update!")
-            self.starttime = time.time()
+            self.starttime = clock.time()
             feeds = []
             LOGGER.debug("%d feeds to update...", len(self.feed_urls))
             feedparser.USER_AGENT = "mlb-led-scoreboard/3.0 +https://github.com/MLB-LED-Scoreboard/mlb-led-scoreboard"
@@ -149,7 +148,7 @@ class Headlines:
     def _build_ticker(self, max_entries=HEADLINE_MAX_ENTRIES) -> list[str]:
         ticker: list[str] = []
         if self.include_date:
-            date_string = datetime.now().strftime(self.date_format)
+            date_string = clock.now().strftime(self.date_format)
             ticker.append(date_string)
 
         if self.include_countdowns:
@@ -163,7 +162,7 @@ class Headlines:
             self.__strings_for_feed(feed, ticker, max_entries)
 
         # In case all of the ticker options are turned off and there's no data, return the date
-        return [datetime.now().strftime(FALLBACK_DATE_FORMAT)] if len(ticker) < 1 else ticker
+        return [clock.now().strftime(FALLBACK_DATE_FORMAT)] if len(ticker) < 1 else ticker
 
     def __strings_for_feed(self, feed, ticker, max_entries):
         ticker.append(feed.feed.title)
@@ -208,6 +207,6 @@ class Headlines:
         return "{}/{}/{}".format(TRADE_BASE, feed_name, TRADE_PATH)
 
     def __should_update(self):
-        endtime = time.time()
+        endtime = clock.time()
         time_delta = endtime - self.starttime
         return time_delta >= HEADLINE_UPDATE_RATE
@@ -1,11 +1,10 @@
 from typing import TYPE_CHECKING
 
 
-import time
-
 from PIL import Image
 
 import bullpen.api as api
+from bullpen import clock
 from bullpen.time_formats import TIME_FORMAT_12H
 from bullpen.util import center_text_position, scrolling_text
 
@@ -40,12 +39,29 @@ class Renderer(api.PluginRenderer["NewsData"]):
 
         self.icon_coords = layout.coords("news.weather_icon")
         self.icon_color = colors.color("news.weather_icon")
+        # Icons ready to draw, by name and scale
+        self.icons: dict[tuple, Image.Image] = {}
 
         self.first = True
 
     def wait_time(self) -> float:
         return self.config.scrolling_speed
 
+    def fingerprint(self, data: NewsData, scrolling_text_pos: int) -> tuple:
+        # The ticker always scrolls, so `next_redraw` is left at `wait_time`, and the position tells
+        # most frames apart. Past that, the screen changes with the headline, the weather, and the clock.
+        weather = data.weather
+        return (
+            scrolling_text_pos,
+            data.headlines.ticker_string(),
+            self._clock_text(),
+            weather.icon_name,
+            weather.conditions,
+            weather.temp,
+            weather.wind_speed,
+            weather.wind_dir,
+        )
+
     def render(self, data: NewsData, canvas: "Canvas", graphics: api.renderer.graphics, scrolling_text_pos: int) -> int:
         if scrolling_text_pos == canvas.width:
             if self.first:
@@ -54,6 +70,9 @@ class Renderer(api.PluginRenderer["NewsData"]):
                 data.headlines.advance_ticker()
 
         canvas.Fill(self.bg.red, self.bg.green, self.bg.blue)
+        # The icon is drawn with its background filled in, so it goes first
+        if data.weather.available():
+            self._render_weather_icon(canvas, data.weather)
 
         text_len = self._render_news_ticker(canvas, graphics, data.headlines, scrolling_text_pos)
         self._render_clock(canvas, graphics)
@@ -61,41 +80,32 @@ class Renderer(api.PluginRenderer["NewsData"]):
 
         return text_len
 
+    def _clock_text(self) -> str:
+        return clock.now().strftime(self.time_fmt_str)
+
     def _render_clock(self, canvas, graphics):
 
-        time_text = time.strftime(self.time_fmt_str)
+        time_text = self._clock_text()
 
         text_x = center_text_position(time_text, self.time_coords["x"], self.time_font["size"]["width"])
         graphics.DrawText(canvas, self.time_font["font"], text_x, self.time_coords["y"], self.time_color, time_text)
 
     def _render_weather(self, canvas, graphics, layout, colors, weather: Weather):
         if weather.available():
-            self._render_weather_icon(canvas, weather.icon())
             _render_weather_text(canvas, graphics, layout, colors, weather.conditions, "conditions")
             _render_weather_text(canvas, graphics, layout, colors, weather.temperature_string(), "temperature")
             _render_weather_text(canvas, graphics, layout, colors, weather.wind_speed_string(), "wind_speed")
             _render_weather_text(canvas, graphics, layout, colors, weather.wind_dir_string(), "wind_dir")
             _render_weather_text(canvas, graphics, layout, colors, weather.wind_string(), "wind")
 
-    def _render_weather_icon(self, canvas, weather_icon):
-
-        resize = self.icon_coords.get("rescale_icon")
-
-        if resize:
-            weather_icon = weather_icon.resize(
-                (weather_icon.width * resize, weather_icon.height * resize), Image.NEAREST
-            )
-        for x in range(weather_icon.width):
-            for y in range(weather_icon.height):
-                pixel = weather_icon.getpixel((x, y))
-                if pixel[3] > 0:
-                    canvas.SetPixel(
-                        self.icon_coords["x"] + x,
-                        self.icon_coords["y"] + y,
-                        self.icon_color["r"],
-                        self.icon_color["g"],
-                        self.icon_color["b"],
-                    )
+    def _render_weather_icon(self, canvas, weather: Weather):
+        scale = self.icon_coords.get("rescale_icon") or 1
+        key = (weather.icon_name, scale)
+        icon = self.icons.get(key)
+        if icon is None:
+            icon = self.icons[key] = _prepare_icon(weather.icon(), scale, self.icon_color, self.bg)
+
+        canvas.SetImage(icon, self.icon_coords["x"], self.icon_coords["y"])
 
     def _render_news_ticker(self, canvas: "Canvas", graphics, headlines: Headlines, text_pos) -> int:
 
@@ -121,3 +131,13 @@ def _render_weather_text(canvas, graphics, layout, colors, text, keyname):
     color = colors.graphics_color("news.{}".format(keyname))
     text_x = center_text_position(text, coords["x"], font["size"]["width"])
     graphics.DrawText(canvas, font["font"], text_x, coords["y"], color, text)
+
+
+def _prepare_icon(weather_icon, scale, color, bg):
+    """The icon scaled up, in the icon color where it is opaque and the background color elsewhere."""
+    if scale != 1:
+        weather_icon = weather_icon.resize((weather_icon.width * scale, weather_icon.height * scale), Image.NEAREST)
+    mask = weather_icon.getchannel("A").point(lambda a: 255 if a > 0 else 0)
+    icon = Image.new("RGB", weather_icon.size, (bg.red, bg.green, bg.blue))
+    icon.paste((color["r"], color["g"], color["b"]), mask=mask)
+    return icon
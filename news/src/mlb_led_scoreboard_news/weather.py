@@ -1,8 +1,9 @@
-import time
+from functools import lru_cache
 from importlib.resources import files
 
 import pyowm
 from PIL import Image
+from bullpen import clock
 from bullpen.api import UpdateStatus
 from bullpen.logging import LOGGER
 
@@ -18,7 +19,7 @@ class Weather:
         self.metric = config.weather_metric_units
         self.temperature_unit = "celsius" if self.metric else "fahrenheit"
         self.speed_unit = "meters_sec" if self.metric else "miles_hour"
-        self.starttime = time.time()
+        self.starttime = clock.time()
         owm = pyowm.OWM(self.apikey)
         self.client = owm.weather_manager()
 
@@ -44,7 +45,7 @@ class Weather:
     def update(self, force=False) -> UpdateStatus:
         if force or self.__should_update():
             LOGGER.debug("Weather should update!")
-            self.starttime = time.time()
+            self.starttime = clock.time()
             if self.apikey_valid:
                 LOGGER.debug("API Key hasn't been flagged as bad yet")
                 try:
@@ -104,11 +105,10 @@ class Weather:
         return "{} {}".format(self.wind_speed_string(), self.wind_dir_string())
 
     def icon(self):
-        image_file = files("mlb_led_scoreboard_news.icons").joinpath(f"{self.icon_name}.png").open(mode="rb")
-        return Image.open(image_file)
+        return _load_icon(self.icon_name)
 
     def __should_update(self):
-        endtime = time.time()
+        endtime = clock.time()
         time_delta = endtime - self.starttime
         return time_delta >= WEATHER_UPDATE_RATE
 
@@ -129,3 +129,12 @@ class Weather:
             self.conditions = "Error"
         if self.icon_name is None:
             self.icon_name = "50d"
+
+
+@lru_cache(maxsize=None)
+def _load_icon(icon_name):
+    """Icons are decoded once; the image returned is shared and must not be modified."""
+    with files("mlb_led_scoreboard_news.icons").joinpath(f"{icon_name}.png").open(mode="rb") as image_file:
+        image = Image.open(image_file)
+        image.load()
+    return image
@@ -0,0 +1,60 @@
+"""
+Animations timed in seconds, rather than in frames.
+
+An `Animation` only describes how it moves; the renderer keeps track of when it started and
+evaluates it at the current time of the frame clock. This way animations run at the same
+speed no matter the scrolling speed or how long a frame takes to draw.
+"""
+
+import math
+from typing import Callable, Optional
+
+Easing = Callable[[float], float]
+
+
+def linear(t: float) -> float:
+    return t
+
+
+def ease_in_out(t: float) -> float:
+    return (1 - math.cos(math.pi * t)) / 2
+
+
+class Animation:
+    def __init__(self, duration: float, easing: Easing = linear, repeat: bool = True):
+        self.duration = duration
+        self.easing = easing
+        self.repeat = repeat
+
+    def progress(self, elapsed: Optional[float]) -> float:
+        """
+        How far along the animation is after `elapsed` seconds, from 0 to 1, after easing.
+        An animation that hasn't started (`elapsed` is None) is at 0.
+        """
+        if elapsed is None or elapsed <= 0:
+            return self.easing(0.0)
+        if self.repeat:
+            t = (elapsed % self.duration) / self.duration
+        else:
+            t = min(elapsed / self.duration, 1.0)
+        return self.easing(t)
+
+    def step(self, elapsed: Optional[float], steps: int) -> int:
+        """Which of `steps` equal parts of the animation we are in, from 0 to steps - 1."""
+        return min(int(self.progress(elapsed) * steps), steps - 1)
+
+    def time_to_next_step(self, elapsed: Optional[float], steps: int) -> Optional[float]:
+        """
+        Seconds until `step` next changes, or None if the animation is idle.
+        This is only exact for linear easing; with any other easing it is 0, meaning "every frame".
+        """
+        if elapsed is None or self.is_idle(elapsed):
+            return None
+        if self.easing is not linear:
+            return 0.0
+        step_duration = self.duration / steps
+        return step_duration - (max(elapsed, 0.0) % step_duration)
+
+    def is_idle(self, elapsed: Optional[float]) -> bool:
+        """True if the animation isn't moving: it hasn't started, or it has finished and doesn't repeat."""
+        return elapsed is None or (not self.repeat and elapsed >= self.duration)
@@ -0,0 +1,82 @@
+"""
+Paces the render loop.
+
+Sleeping for a fixed time after each frame makes the real frame period depend on how long
+the frame took to draw, so text scrolls slower on bigger boards and busier CPUs. The
+`FrameClock` instead keeps an absolute deadline for every frame.
+"""
+
+from typing import Callable
+
+import bullpen.clock
+
+
+class FrameClock:
+    # If we fall further behind than this many frames, the rest are dropped rather than caught up
+    MAX_CATCHUP = 5
+
+    def __init__(self, period: float, now: Callable[[], float] = bullpen.clock.monotonic, sleep=bullpen.clock.sleep):
+        self._now = now
+        self._sleep = sleep
+        self.period = period
+        # When the current frame was due. The next one is due a period later.
+        self.frame_time = self._now()
+        # Total frames the clock has advanced, including any that were caught up
+        self.frame = 0
+        # Number of times a frame finished after its deadline
+        self.overruns = 0
+        self._period_changed = False
+
+    def now(self) -> float:
+        return self._now()
+
+    @property
+    def deadline(self) -> float:
+        return self.frame_time + self.period
+
+    def start(self, period: float) -> None:
+        """Starts pacing frames `period` seconds apart, from now. Called whenever the board changes screens."""
+        self.period = period
+        self.frame_time = self._now()
+
+    def set_period(self, period: float) -> None:
+        """
+        Changes the time between frames, starting with the next one.
+        Frames missed because the previous period was longer are not caught up.
+        """
+        if period != self.period:
+            self.period = period
+            self._period_changed = True
+
+    def tick(self) -> int:
+        """
+        Waits until the next frame is due.
+        Returns the number of frames that have passed since the last tick. This is normally 1,
+        but is more if drawing overran the deadline, so that movement can catch up.
+        """
+        now = self._now()
+        deadline = self.deadline
+        if self.period <= 0:
+            self.frame_time = now
+            frames = 1
+        elif now < deadline:
+            self._sleep(deadline - now)
+            self.frame_time = deadline
+            frames = 1
+        elif self._period_changed:
+            # the new period would have had this frame already, which isn't the same as falling behind
+            self.frame_time = now
+            frames = 1
+        else:
+            self.overruns += 1
+            frames = 1 + int((now - deadline) // self.period)
+            if frames > self.MAX_CATCHUP:
+                # Too far behind to catch up, start over from now
+                frames = self.MAX_CATCHUP
+                self.frame_time = now
+            else:
+                self.frame_time = deadline + (frames - 1) * self.period
+
+        self._period_changed = False
+        self.frame += frames
+        return frames
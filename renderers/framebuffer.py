@@ -0,0 +1,159 @@
+"""
+An off-screen frame, drawn into with array operations.
+
+Drawing straight onto the matrix's canvas takes a call into the driver for every line,
+letter and pixel. Game screens are instead drawn into a `FrameBuffer`, where filling a
+row or a box or stamping a word is a single NumPy assignment, and the finished frame is
+then copied onto the canvas all at once with `push`.
+
+`FRAMEBUFFER_GRAPHICS` has the same functions as `graphics`. Given a `FrameBuffer` it draws
+into it, and given anything else it passes the call on to the driver's `graphics`, so
+helpers that take a canvas work with either.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from PIL import Image
+
+from bullpen.clip import circle_points, glyph_pixels, line_points
+from driver import graphics
+
+if TYPE_CHECKING:
+    from RGBMatrixEmulator.emulation.canvas import Canvas
+    from RGBMatrixEmulator import Color as GraphicsColor, Font
+
+# Number of words kept ready to stamp. A screen has a few dozen at most
+TEXT_CACHE_SIZE = 256
+
+
+class FrameBuffer:
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.pixels = np.zeros((height, width, 3), dtype=np.uint8)
+
+    def Fill(self, r: int, g: int, b: int) -> None:
+        self.pixels[:, :] = (r, g, b)
+
+    def Clear(self) -> None:
+        self.pixels.fill(0)
+
+    def SetPixel(self, x: int, y: int, r: int, g: int, b: int) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.pixels[y, x] = (r, g, b)
+
+    def SetImage(self, image: Image.Image, offset_x: int = 0, offset_y: int = 0, unsafe: bool = True) -> None:
+        """Copies `image` onto the frame. An image with transparency is blended over what's already there."""
+        left, top = max(offset_x, 0), max(offset_y, 0)
+        right, bottom = min(offset_x + image.width, self.width), min(offset_y + image.height, self.height)
+        if left >= right or top >= bottom:
+            return
+
+        source = np.asarray(image.convert("RGBA") if image.mode != "RGB" else image)
+        source = source[top - offset_y : bottom - offset_y, left - offset_x : right - offset_x]
+        target = self.pixels[top:bottom, left:right]
+        if source.shape[2] == 4:
+            alpha = source[:, :, 3:].astype(np.uint16)
+            target[:] = (source[:, :, :3] * alpha + target * (255 - alpha)) // 255
+        else:
+            target[:] = source
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, color: "GraphicsColor") -> None:
+        left, top = max(x, 0), max(y, 0)
+        right, bottom = min(x + width, self.width), min(y + height, self.height)
+        if left < right and top < bottom:
+            self.pixels[top:bottom, left:right] = (color.red, color.green, color.blue)
+
+    def push(self, canvas: "Canvas") -> None:
+        """Copies the whole frame onto `canvas`."""
+        canvas.SetImage(Image.fromarray(self.pixels), 0, 0)
+
+
+class _FrameBufferGraphics:
+    """The drawing functions of `graphics`, for drawing on a `FrameBuffer`."""
+
+    @staticmethod
+    def Color(r: int = 0, g: int = 0, b: int = 0) -> "GraphicsColor":
+        return graphics.Color(r, g, b)
+
+    @staticmethod
+    def DrawText(canvas: Any, font: "Font", x: int, y: int, color: "GraphicsColor", text: str) -> int:
+        if not isinstance(canvas, FrameBuffer):
+            width: int = graphics.DrawText(canvas, font, x, y, color, text)
+            return width
+
+        left, top, mask, width = _text_mask(font, text)
+        _stamp(canvas, x + left, y + top, mask, color)
+        return width
+
+    @staticmethod
+    def DrawLine(canvas: Any, x1: int, y1: int, x2: int, y2: int, color: "GraphicsColor") -> None:
+        if not isinstance(canvas, FrameBuffer):
+            graphics.DrawLine(canvas, x1, y1, x2, y2, color)
+            return
+
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        if y1 == y2 or x1 == x2:
+            canvas.fill_rect(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1, color)
+        else:
+            _set_points(canvas, line_points(x1, y1, x2, y2), color)
+
+    @staticmethod
+    def DrawCircle(canvas: Any, x: int, y: int, r: int, color: "GraphicsColor") -> None:
+        if not isinstance(canvas, FrameBuffer):
+            graphics.DrawCircle(canvas, x, y, r, color)
+            return
+
+        _set_points(canvas, circle_points(x, y, r), color)
+
+
+FRAMEBUFFER_GRAPHICS = _FrameBufferGraphics()
+
+
+def fill_rect(canvas: Any, x: int, y: int, width: int, height: int, color: "GraphicsColor") -> None:
+    """Fills a box on `canvas`, in one go if it's a `FrameBuffer` and a line at a time if not."""
+    if isinstance(canvas, FrameBuffer):
+        canvas.fill_rect(x, y, width, height, color)
+    else:
+        for row in range(height):
+            graphics.DrawLine(canvas, x, y + row, x + width - 1, y + row, color)
+
+
+@lru_cache(maxsize=TEXT_CACHE_SIZE)
+def _text_mask(font: "Font", text: str) -> tuple[int, int, np.ndarray, int]:
+    """
+    The lit pixels of `text`, as a mask and the position of its top left corner relative
+    to where the text is drawn, along with the width the text advances by.
+    """
+    points: list[tuple[int, int]] = []
+    advance = 0
+    for letter in text:
+        pixels = glyph_pixels(font, letter)
+        if pixels is None:
+            raise ValueError("Only fonts loaded through the layout can be drawn on a frame buffer")
+        points.extend((advance + dx, dy) for dx, dy in pixels)
+        advance += max(font.CharacterWidth(ord(letter)), 0)
+
+    if not points:
+        return 0, 0, np.zeros((0, 0), dtype=bool), advance
+    xs, ys = np.array(points).T
+    mask = np.zeros((ys.max() - ys.min() + 1, xs.max() - xs.min() + 1), dtype=bool)
+    mask[ys - ys.min(), xs - xs.min()] = True
+    return int(xs.min()), int(ys.min()), mask, advance
+
+
+def _stamp(canvas: FrameBuffer, x: int, y: int, mask: np.ndarray, color: "GraphicsColor") -> None:
+    height, width = mask.shape
+    left, top = max(x, 0), max(y, 0)
+    right, bottom = min(x + width, canvas.width), min(y + height, canvas.height)
+    if left < right and top < bottom:
+        target = canvas.pixels[top:bottom, left:right]
+        target[mask[top - y : bottom - y, left - x : right - x]] = (color.red, color.green, color.blue)
+
+
+def _set_points(canvas: FrameBuffer, points, color: "GraphicsColor") -> None:
+    xs, ys = np.array(list(points)).T
+    inside = (0 <= xs) & (xs < canvas.width) & (0 <= ys) & (ys < canvas.height)
+    canvas.pixels[ys[inside], xs[inside]] = (color.red, color.green, color.blue)
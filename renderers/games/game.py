@@ -1,7 +1,6 @@
 from bullpen.util import scrolling_text
 
 from data import status
-from driver import graphics
 from data.config.color import Color
 from data.config.layout import Layout
 from data.scoreboard import Scoreboard
@@ -11,10 +10,35 @@ from data.scoreboard.inning import Inning
 from data.scoreboard.pitches import Pitches
 from data.plays import PLAY_RESULTS
 
+from renderers.animation import Animation
+from renderers.framebuffer import FRAMEBUFFER_GRAPHICS as graphics, fill_rect
 from renderers.games import nohitter
 
+# A play result blinks on and off, and a home run lights up each base and then none in turn
+PLAY_RESULT_BLINK = Animation(1.2)
+HOME_RUN_CYCLE = Animation(2.0)
+
+
+def animation_phase(animation_time):
+    """
+    What the live game animations show `animation_time` seconds after the play,
+    as (play result shown, base lit for a home run).
+    """
+    return PLAY_RESULT_BLINK.step(animation_time, 2), HOME_RUN_CYCLE.step(animation_time, 4)
+
+
+def next_animation_step(animation_time):
+    """Seconds until any of the live game animations next changes, or None if they aren't running."""
+    steps = [
+        PLAY_RESULT_BLINK.time_to_next_step(animation_time, 2),
+        HOME_RUN_CYCLE.time_to_next_step(animation_time, 4),
+    ]
+    steps = [step for step in steps if step is not None]
+    return min(steps) if steps else None
+
 
 def render_live_game(canvas, layout: Layout, colors: Color, scoreboard: Scoreboard, text_pos, animation_time):
+    blink, home_run_base = animation_phase(animation_time)
     pos = 0
     if not status.is_inning_break(scoreboard.inning.state):
         pos = _render_at_bat(
@@ -24,7 +48,7 @@ def render_live_game(canvas, layout: Layout, colors: Color, scoreboard: Scoreboa
             scoreboard.atbat,
             text_pos,
             scoreboard.play_result,
-            (animation_time // 6) % 2,
+            blink,
             scoreboard.pitches,
         )
 
@@ -36,7 +60,7 @@ def render_live_game(canvas, layout: Layout, colors: Color, scoreboard: Scoreboa
 
         _render_count(canvas, layout, colors, scoreboard.pitches)
         _render_outs(canvas, layout, colors, scoreboard.outs)
-        _render_bases(canvas, layout, colors, scoreboard.bases, scoreboard.homerun(), (animation_time % 16) // 5)
+        _render_bases(canvas, layout, colors, scoreboard.bases, scoreboard.homerun(), home_run_base)
 
         _render_inning_display(canvas, layout, colors, scoreboard.inning)
 
@@ -257,8 +281,7 @@ def __fill_out_circle(canvas, out, color):
     x += 1
     y += 1
     size -= 1
-    for y_offset in range(size):
-        graphics.DrawLine(canvas, x, y + y_offset, x + size - 1, y + y_offset, color)
+    fill_rect(canvas, x, y, size, size, color)
 
 
 # --------------- inning information ---------------
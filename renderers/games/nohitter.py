@@ -1,4 +1,4 @@
-from driver import graphics
+from renderers.framebuffer import FRAMEBUFFER_GRAPHICS as graphics
 import data.config.layout as cfglayout
 from bullpen.logging import LOGGER
 
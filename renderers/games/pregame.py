@@ -1,4 +1,4 @@
-from driver import graphics
+from renderers.framebuffer import FRAMEBUFFER_GRAPHICS as graphics
 from data.config.color import Color
 from data.config.layout import Layout
 from data.scoreboard.pregame import Pregame
@@ -1,8 +1,15 @@
-from driver import graphics
+from bullpen.clip import ClippedGraphics
+
+from data.config.color import graphics_color
+from renderers.layer import LAYER_GRAPHICS as graphics, Layer
 
 ABSOLUTE = "absolute"
 RELATIVE = "relative"
 
+# Banners drawn recently, by what they show. See `render_team_banner`
+BANNER_CACHE_SIZE = 8
+_banners: dict[tuple, tuple[object, object, Layer]] = {}
+
 
 def render_team_banner(
     canvas,
@@ -11,6 +18,53 @@ def render_team_banner(
     home_team,
     away_team,
     show_score,
+):
+    """
+    The banner only changes when a score or record does, so it is drawn once into a layer
+    which is then copied onto every frame until something on it changes.
+    """
+    key = (
+        id(layout),
+        layout.state,
+        id(team_colors),
+        canvas.width,
+        canvas.height,
+        _team_key(home_team),
+        _team_key(away_team),
+        show_score,
+    )
+    cached = _banners.get(key)
+    # the layout and colors are kept alongside, so their ids can't be reused while they are in the cache
+    if cached is None or cached[0] is not layout or cached[1] is not team_colors:
+        if len(_banners) >= BANNER_CACHE_SIZE:
+            del _banners[next(iter(_banners))]
+        layer = Layer(canvas.width, canvas.height)
+        __draw_team_banner(layer, layout, team_colors, home_team, away_team, show_score)
+        cached = _banners[key] = (layout, team_colors, layer)
+
+    cached[2].draw(canvas)
+
+
+def _team_key(team):
+    return (
+        team.abbrev,
+        team.name,
+        team.special_uniform,
+        team.runs,
+        team.hits,
+        team.errors,
+        team.record.get("wins"),
+        team.record.get("losses"),
+    )
+
+
+def __draw_team_banner(
+    canvas,
+    layout,
+    team_colors,
+    home_team,
+    away_team,
+    show_score,
 ):
     away_colors = away_team.lookup_color(team_colors)
     home_colors = home_team.lookup_color(team_colors)
@@ -23,7 +77,12 @@ def render_team_banner(
     accent_coords["away"] = layout.coords("teams.accent.away")
     accent_coords["home"] = layout.coords("teams.accent.home")
 
+    # each team's text is kept to its own background, rather than spilling into the other's
+    clipped = {}
     for team in ["away", "home"]:
+        coords = bg_coords[team]
+        clipped[team] = ClippedGraphics(graphics, coords["x"], coords["y"], coords["width"] + 1, coords["height"])
+
         # Background
         bg_color = home_colors["home"] if team == "home" else away_colors["home"]
         __draw_filled_box(canvas, bg_coords[team], bg_color)
@@ -34,12 +93,16 @@ def render_team_banner(
 
     use_full_team_names = can_use_full_team_names(layout, [home_team, away_team])
 
-    away_name_end_pos = __render_team_text(canvas, layout, away_colors["text"], away_team, "away", use_full_team_names)
-    home_name_end_pos = __render_team_text(canvas, layout, home_colors["text"], home_team, "home", use_full_team_names)
+    away_name_end_pos = __render_team_text(
+        canvas, clipped["away"], layout, away_colors["text"], away_team, "away", use_full_team_names
+    )
+    home_name_end_pos = __render_team_text(
+        canvas, clipped["home"], layout, home_colors["text"], home_team, "home", use_full_team_names
+    )
 
     if can_show_record_text(layout, [home_team, away_team]):
-        __render_record_text(canvas, layout, away_colors["text"], away_team, "away", away_name_end_pos)
-        __render_record_text(canvas, layout, home_colors["text"], home_team, "home", home_name_end_pos)
+        __render_record_text(canvas, clipped["away"], layout, away_colors["text"], away_team, "away", away_name_end_pos)
+        __render_record_text(canvas, clipped["home"], layout, home_colors["text"], home_team, "home", home_name_end_pos)
 
     if show_score:
         # Number of characters in each score.
@@ -48,8 +111,8 @@ def render_team_banner(
             "hits": max(len(str(away_team.hits)), len(str(home_team.hits))),
             "errors": max(len(str(away_team.errors)), len(str(home_team.errors))),
         }
-        __render_team_score(canvas, layout, away_colors["text"], away_team, "away", score_spacing)
-        __render_team_score(canvas, layout, home_colors["text"], home_team, "home", score_spacing)
+        __render_team_score(canvas, clipped["away"], layout, away_colors["text"], away_team, "away", score_spacing)
+        __render_team_score(canvas, clipped["home"], layout, home_colors["text"], home_team, "home", score_spacing)
 
 
 def can_use_full_team_names(layout, teams):
@@ -97,23 +160,23 @@ def can_show_record_text(layout, teams):
     return True
 
 
-def __render_team_text(canvas, layout, text_color, team, homeaway, full_team_names):
-    text_color_graphic = graphics.Color(text_color["r"], text_color["g"], text_color["b"])
+def __render_team_text(canvas, text_graphics, layout, text_color, team, homeaway, full_team_names):
+    text_color_graphic = graphics_color(text_color["r"], text_color["g"], text_color["b"])
     coords = layout.coords("teams.name.{}".format(homeaway))
     font = layout.font("teams.name.{}".format(homeaway))
     team_text = "{:3s}".format(team.abbrev.upper()).strip()
     if full_team_names:
         team_text = "{:13s}".format(team.name).strip()
-    graphics.DrawText(canvas, font["font"], coords["x"], coords["y"], text_color_graphic, team_text)
+    text_graphics.DrawText(canvas, font["font"], coords["x"], coords["y"], text_color_graphic, team_text)
 
     return (coords["x"] + (len(team_text) * font["size"]["width"]), coords["y"])
 
 
-def __render_record_text(canvas, layout, text_color, team, homeaway, origin):
+def __render_record_text(canvas, text_graphics, layout, text_color, team, homeaway, origin):
     if "losses" not in team.record or "wins" not in team.record:
         return
 
-    text_color_graphic = graphics.Color(text_color["r"], text_color["g"], text_color["b"])
+    text_color_graphic = graphics_color(text_color["r"], text_color["g"], text_color["b"])
     coords = layout.coords("teams.record.{}".format(homeaway))
     font = layout.font("teams.record.{}".format(homeaway))
     record_text = "({}-{})".format(team.record["wins"], team.record["losses"])
@@ -124,38 +187,44 @@ def __render_record_text(canvas, layout, text_color, team, homeaway, origin):
     x = coords["x"] + origin[0]
     y = coords["y"] + origin[1]
 
-    graphics.DrawText(canvas, font["font"], x, y, text_color_graphic, record_text)
+    text_graphics.DrawText(canvas, font["font"], x, y, text_color_graphic, record_text)
 
 
-def __render_score_component(canvas, layout, text_color, homeaway, coords, component_val, width_chars):
+def __render_score_component(canvas, text_graphics, layout, text_color, homeaway, coords, component_val, width_chars):
     # The coords passed in are the rightmost pixel.
     font = layout.font(f"teams.line_score.{homeaway}")
     font_width = font["size"]["width"]
     # Number of pixels between runs/hits and hits/errors.
     line_score_coords = layout.coords("teams.line_score")
-    text_color_graphic = graphics.Color(text_color["r"], text_color["g"], text_color["b"])
+    text_color_graphic = graphics_color(text_color["r"], text_color["g"], text_color["b"])
     component_val = str(component_val)
     # Draw each digit from right to left.
     for i, c in enumerate(component_val[::-1]):
         if i > 0 and line_score_coords["compress_digits"]:
             coords["x"] += 1
         char_draw_x = coords["x"] - font_width * (i + 1)  # Determine character position
-        graphics.DrawText(canvas, font["font"], char_draw_x, coords["y"], text_color_graphic, c)
+        text_graphics.DrawText(canvas, font["font"], char_draw_x, coords["y"], text_color_graphic, c)
     if line_score_coords["compress_digits"]:
         coords["x"] += width_chars - len(component_val)  # adjust for compaction on values not rendered
     coords["x"] -= font_width * width_chars + line_score_coords["spacing"] - 1  # adjust coordinates for next score.
 
 
-def __render_team_score(canvas, layout, text_color, team, homeaway, score_spacing):
+def __render_team_score(canvas, text_graphics, layout, text_color, team, homeaway, score_spacing):
     coords = layout.coords(f"teams.line_score.{homeaway}").copy()
     if layout.coords("teams.line_score")["show_hits_and_errors"]:
-        __render_score_component(canvas, layout, text_color, homeaway, coords, team.errors, score_spacing["errors"])
-        __render_score_component(canvas, layout, text_color, homeaway, coords, team.hits, score_spacing["hits"])
-    __render_score_component(canvas, layout, text_color, homeaway, coords, team.runs, score_spacing["runs"])
+        __render_score_component(
+            canvas, text_graphics, layout, text_color, homeaway, coords, team.errors, score_spacing["errors"]
+        )
+        __render_score_component(
+            canvas, text_graphics, layout, text_color, homeaway, coords, team.hits, score_spacing["hits"]
+        )
+    __render_score_component(
+        canvas, text_graphics, layout, text_color, homeaway, coords, team.runs, score_spacing["runs"]
+    )
 
 
 def __draw_filled_box(canvas, coords, color):
-    c = graphics.Color(color["r"], color["g"], color["b"])
+    c = graphics_color(color["r"], color["g"], color["b"])
 
     x = coords["x"]
     y = coords["y"]
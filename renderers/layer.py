@@ -0,0 +1,80 @@
+"""
+Off-screen layers.
+
+Parts of a screen that rarely change can be drawn once into a `Layer` and then copied onto
+each frame's canvas, instead of being drawn shape by shape and letter by letter every frame.
+A layer is drawn into with `LAYER_GRAPHICS`, which has the same drawing functions as `graphics`.
+
+Pixels nothing was drawn on are transparent, so a layer can be drawn on top of other things.
+"""
+
+from typing import TYPE_CHECKING, Optional
+
+from PIL import Image
+
+from bullpen.blocks import opaque_boxes
+from bullpen.clip import glyph_pixels, line_points
+from renderers.framebuffer import FrameBuffer
+
+if TYPE_CHECKING:
+    from RGBMatrixEmulator.emulation.canvas import Canvas
+    from RGBMatrixEmulator import Color, Font
+
+
+class Layer:
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self.image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        self._blocks: Optional[list[tuple[int, int, Image.Image]]] = None
+
+    def SetPixel(self, x: int, y: int, r: int, g: int, b: int) -> None:
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.image.putpixel((x, y), (r, g, b, 255))
+            self._blocks = None
+
+    def draw(self, canvas: "Canvas | FrameBuffer") -> None:
+        """Copies everything drawn on the layer onto `canvas`."""
+        if isinstance(canvas, FrameBuffer):
+            # blended in one go, by the layer's transparency
+            canvas.SetImage(self.image)
+            return
+        for x, y, block in self.blocks():
+            canvas.SetImage(block, x, y)
+
+    def blocks(self) -> list[tuple[int, int, Image.Image]]:
+        """
+        The drawn parts of the layer, as the fewest opaque rectangles found by scanning row by row.
+        Each is a `(x, y, image)` ready to be passed to `canvas.SetImage`.
+        """
+        if self._blocks is None:
+            rgb = self.image.convert("RGB")
+            self._blocks = [
+                (left, top, rgb.crop((left, top, right, bottom)))
+                for left, top, right, bottom in opaque_boxes(self.image)
+            ]
+        return self._blocks
+
+
+class _LayerGraphics:
+    """The drawing functions of `graphics`, for drawing on a `Layer`."""
+
+    @staticmethod
+    def DrawText(layer: Layer, font: "Font", x: int, y: int, color: "Color", text: str) -> int:
+        start = x
+        for letter in text:
+            pixels = glyph_pixels(font, letter)
+            if pixels is None:
+                raise ValueError("Only fonts loaded through the layout can be drawn on a layer")
+            for dx, dy in pixels:
+                layer.SetPixel(x + dx, y + dy, color.red, color.green, color.blue)
+            x += max(font.CharacterWidth(ord(letter)), 0)
+        return x - start
+
+    @staticmethod
+    def DrawLine(layer: Layer, x1: int, y1: int, x2: int, y2: int, color: "Color") -> None:
+        for x, y in line_points(x1, y1, x2, y2):
+            layer.SetPixel(x, y, color.red, color.green, color.blue)
+
+
+LAYER_GRAPHICS = _LayerGraphics()
@@ -1,7 +1,8 @@
-import time
-from typing import Callable, NoReturn
+from functools import cached_property
+from typing import Callable, Hashable, NoReturn, Optional
 
 import bullpen.api as api
+import bullpen.clock
 
 
 from bullpen.logging import LOGGER
@@ -12,23 +13,49 @@ from data.scoreboard.pregame import Pregame
 from data.game import Game
 
 from renderers import network
+from renderers.clock import FrameClock
+from renderers.framebuffer import FrameBuffer
 from renderers.games import game as gamerender
 from renderers.games import irregular
 from renderers.games import postgame as postgamerender
 from renderers.games import pregame as pregamerender
 from renderers.games import teams
 
+# How often a screen with nothing moving on it is redrawn, in seconds
+IDLE_FRAME_PERIOD = 1.0
+
 
 class MainRenderer:
     def __init__(self, matrix, data: Data, plugins: dict[str, api.PluginRenderer]) -> None:
         self.matrix = matrix
         self.data = data
         self.canvas = matrix.CreateFrameCanvas()
+        # Game screens are drawn here, then pushed to the canvas in one go
+        self.framebuffer = FrameBuffer(self.canvas.width, self.canvas.height)
         self.scrolling_text_pos = self.canvas.width
         self.scrolling_finished: bool = False
         self.plugins = plugins
 
-        self.animation_time = 0
+        self.clock = FrameClock(self.data.config.scrolling_speed)
+        # Frames passed since the last one drawn; more than 1 if drawing fell behind the clock
+        self.frames_elapsed = 1
+        # When the current play's animation started, and how long ago, by the frame clock
+        self.animation_start: Optional[float] = None
+        self.animation_time: Optional[float] = None
+        self._views: Optional[GameViews] = None
+        # Everything the last frame drawn depended on. Frames with the same key are skipped entirely.
+        self._frame_key: Optional[Hashable] = None
+
+        # Whether the last frame drawn had text scrolling across it
+        self.text_moving = False
+        # Set once a whole scrolling cycle of a game screen passes without any text that needs to scroll.
+        # The scrolling position then stops moving until the screen's data changes.
+        self.text_settled = False
+        self._text_scrolled_this_cycle = False
+        # The part of the frame key that isn't about movement
+        self._content_key: Optional[Hashable] = None
+        # Seconds until the current screen needs to be drawn again
+        self.next_redraw: float = self.data.config.scrolling_speed
 
     def render(self) -> NoReturn:
         while True:
@@ -38,17 +65,21 @@ class MainRenderer:
             for plugin in self.data.config.rotation_screen_rules.get(self.data.schedule.priority, {}):
                 if t := self.data.config.screen_time_at_priority(plugin, self.data.schedule.priority):
                     LOGGER.debug("Rotating to plugin %s for %d seconds", plugin, t)
-                    self.__draw_plugin_screen(plugin, any_of(timer_cond(t), self.scrolling_finished_cond()))
+                    self.__draw_plugin_screen(
+                        plugin, any_of(timer_cond(t, self.clock.now), self.scrolling_finished_cond())
+                    )
 
     def __render_games(self):
         seen_games = set()
         while True:
             self.scrolling_text_pos = self.canvas.width
+            self._frame_key = None
+            self._content_key = None
 
             game = self.data.games.next()
             if game is None:
                 LOGGER.warning("Render thread: no game to render, sleeping for a bit")
-                time.sleep(1)
+                bullpen.clock.sleep(1)
                 break
 
             if len(seen_games) >= self.data.schedule.num_games():
@@ -58,27 +89,58 @@ class MainRenderer:
             LOGGER.debug("Render thread: showing game %d / %d", len(seen_games), self.data.schedule.num_games())
 
             cond = any_of(
-                timer_cond(self.data.config.rotate_rate_for_status(game.status())),
+                timer_cond(self.data.config.rotate_rate_for_status(game.status()), self.clock.now),
                 self.scrolling_finished_cond(),
             )
+            self.clock.start(self.data.config.scrolling_speed)
+            self.frames_elapsed = 1
             while cond():
                 self.data.config.layout.state_for_game(game)
                 self.__draw_game(game)
-                time.sleep(self.data.config.scrolling_speed)
+                self.clock.set_period(self.next_redraw)
+                self.frames_elapsed = self.clock.tick()
 
     # Draws the provided game on the canvas
     def __draw_game(self, game: Game):
+        views = self.__views_for(game)
+        scoreboard = views.scoreboard
+        game_status = game.status()
+        live = not (
+            status.is_pregame(game_status) or status.is_complete(game_status) or status.is_irregular(game_status)
+        )
+        if live:
+            self.__update_animation(scoreboard)
+
+        # The scrolling position only moves while there is text to scroll, and the animations only
+        # change between steps, so a static screen keeps the same key until its data changes.
+        content_key = (game.game_id, game.version, self.data.config.layout.state, self.data.network_issues)
+        frame_key = content_key + (
+            self.scrolling_text_pos,
+            gamerender.animation_phase(self.animation_time) if live else None,
+        )
+        if content_key != self._content_key:
+            # New data might bring new text to scroll. If it came partway through a cycle, that cycle doesn't count.
+            self.text_settled = False
+            self.scrolling_finished = False
+            self._text_scrolled_this_cycle = self._content_key is not None
+            self._content_key = content_key
+
+        if frame_key == self._frame_key:
+            self.next_redraw = self.__next_game_redraw(live)
+            return
+        self._frame_key = frame_key
+
+        canvas = self.framebuffer
         bgcolor = self.data.config.scoreboard_colors.color("default.background")
-        self.canvas.Fill(bgcolor["r"], bgcolor["g"], bgcolor["b"])
-        scoreboard = Scoreboard(game)
+        canvas.Fill(bgcolor["r"], bgcolor["g"], bgcolor["b"])
         layout = self.data.config.layout
         colors = self.data.config.scoreboard_colors
 
-        if status.is_pregame(game.status()):  # Draw the pregame information
+        if status.is_pregame(game_status):  # Draw the pregame information
             self.__max_scroll_x(layout.coords("pregame.scrolling_text"))
-            pregame = Pregame(game, self.data.config.time_format)
+            pregame = views.pregame
             pos = pregamerender.render_pregame(
-                self.canvas,
+                canvas,
                 layout,
                 colors,
                 pregame,
@@ -86,13 +148,13 @@ class MainRenderer:
                 self.data.config.pregame_weather,
                 self.data.config.is_postseason(),
             )
-            self.__update_scrolling_text_pos(pos, self.canvas.width)
+            self.__update_scrolling_text_pos(pos, self.canvas.width, settle=True)
 
-        elif status.is_complete(game.status()):  # Draw the game summary
+        elif status.is_complete(game_status):  # Draw the game summary
             self.__max_scroll_x(layout.coords("final.scrolling_text"))
-            final = Postgame(game)
+            final = views.postgame
             pos = postgamerender.render_postgame(
-                self.canvas,
+                canvas,
                 layout,
                 colors,
                 final,
@@ -100,26 +162,21 @@ class MainRenderer:
                 self.scrolling_text_pos,
                 self.data.config.is_postseason(),
             )
-            self.__update_scrolling_text_pos(pos, self.canvas.width)
+            self.__update_scrolling_text_pos(pos, self.canvas.width, settle=True)
 
-        elif status.is_irregular(game.status()):  # Draw game status
+        elif status.is_irregular(game_status):  # Draw game status
             short_text = self.data.config.layout.coords("status.text")["short_text"]
             if scoreboard.get_text_for_reason():
                 self.__max_scroll_x(layout.coords("status.scrolling_text"))
                 pos = irregular.render_irregular_status(
-                    self.canvas, layout, colors, scoreboard, short_text, self.scrolling_text_pos
+                    canvas, layout, colors, scoreboard, short_text, self.scrolling_text_pos
                 )
-                self.__update_scrolling_text_pos(pos, self.canvas.width)
+                self.__update_scrolling_text_pos(pos, self.canvas.width, settle=True)
             else:
-                irregular.render_irregular_status(self.canvas, layout, colors, scoreboard, short_text)
-                self.scrolling_finished = True
+                irregular.render_irregular_status(canvas, layout, colors, scoreboard, short_text)
+                self.__update_scrolling_text_pos(None, self.canvas.width)
 
         else:  # draw a live game
-            if scoreboard.homerun() or scoreboard.strikeout() or scoreboard.hit() or scoreboard.walk():
-                self.animation_time += 1
-            else:
-                self.animation_time = 0
-
             if status.is_inning_break(scoreboard.inning.state):
                 loop_point = self.data.config.layout.coords("inning.break.due_up")["loop"]
             else:
@@ -127,35 +184,76 @@ class MainRenderer:
 
             self.scrolling_text_pos = min(self.scrolling_text_pos, loop_point)
             pos = gamerender.render_live_game(
-                self.canvas, layout, colors, scoreboard, self.scrolling_text_pos, self.animation_time
+                canvas, layout, colors, scoreboard, self.scrolling_text_pos, self.animation_time
             )
-            self.__update_scrolling_text_pos(pos, loop_point)
+            self.__update_scrolling_text_pos(pos, loop_point, settle=True)
 
         # draw last so it is always on top
         teams.render_team_banner(
-            self.canvas,
+            canvas,
             layout,
             self.data.config.team_colors,
             scoreboard.home_team,
             scoreboard.away_team,
-            show_score=not status.is_pregame(game.status()),
+            show_score=not status.is_pregame(game_status),
         )
 
         # Show network issues
         if self.data.network_issues:
-            network.render_network_error(self.canvas, layout, colors)
+            network.render_network_error(canvas, layout, colors)
 
+        canvas.push(self.canvas)
         self.canvas = self.matrix.SwapOnVSync(self.canvas)
+        # from the frame just drawn, so text that has just appeared starts moving straight away
+        self.next_redraw = self.__next_game_redraw(live)
+
+    def __next_game_redraw(self, live: bool):
+        """Full speed while text scrolls, otherwise just often enough to show the next animation step"""
+        speed = self.data.config.scrolling_speed
+        if self.text_moving:
+            return speed
+        next_redraw = max(speed, IDLE_FRAME_PERIOD)
+        if live and (next_step := gamerender.next_animation_step(self.animation_time)) is not None:
+            next_redraw = min(next_redraw, max(speed, next_step))
+        return next_redraw
+
+    def __update_animation(self, scoreboard: Scoreboard):
+        """Starts timing the animations when a play that has one comes in"""
+        if scoreboard.homerun() or scoreboard.strikeout() or scoreboard.hit() or scoreboard.walk():
+            if self.animation_start is None:
+                self.animation_start = self.clock.now()
+            self.animation_time = self.clock.now() - self.animation_start
+        else:
+            self.animation_start = None
+            self.animation_time = None
+
+    def __views_for(self, game: Game) -> "GameViews":
+        # read the version first, so if the game updates while we build these we'll rebuild next frame
+        version = game.version
+        if self._views is None or self._views.game is not game or self._views.version != version:
+            self._views = GameViews(game, version, self.data.config.time_format)
+        return self._views
 
     def __draw_plugin_screen(self, plugin_name: str, cond: Callable[[], bool]) -> None:
         from driver import graphics
 
         self.scrolling_text_pos = self.canvas.width
+        self._frame_key = None
 
         renderer = self.plugins[plugin_name]
         data = self.data.plugin_data[plugin_name]
-        wait_time = renderer.wait_time()
+        self.clock.start(renderer.wait_time())
+        self.frames_elapsed = 1
         while renderer.can_render(data) and cond():
+            fingerprint = renderer.fingerprint(data, self.scrolling_text_pos)
+            if fingerprint is not None:
+                frame_key = (plugin_name, fingerprint, self.data.network_issues)
+                if frame_key == self._frame_key:
+                    self.clock.set_period(renderer.next_redraw(data))
+                    self.frames_elapsed = self.clock.tick()
+                    continue
+                self._frame_key = frame_key
+
             pos = renderer.render(data, self.canvas, graphics, self.scrolling_text_pos)
             self.__update_scrolling_text_pos(pos, self.canvas.width)
 
@@ -163,7 +261,8 @@ class MainRenderer:
             if self.data.network_issues:
                 network.render_network_error(self.canvas, self.data.config.layout, self.data.config.scoreboard_colors)
             self.canvas = self.matrix.SwapOnVSync(self.canvas)
-            time.sleep(wait_time)
+            self.clock.set_period(renderer.next_redraw(data))
+            self.frames_elapsed = self.clock.tick()
 
         renderer.reset()
 
@@ -171,16 +270,26 @@ class MainRenderer:
         scroll_max_x = scroll_coords["x"] + scroll_coords["width"]
         self.scrolling_text_pos = min(scroll_max_x, self.scrolling_text_pos)
 
-    def __update_scrolling_text_pos(self, new_pos, end):
-        """Updates the position of scrolling text"""
-        if new_pos is None:
+    def __update_scrolling_text_pos(self, new_pos, end, settle=False):
+        """
+        Updates the position of scrolling text.
+        With `settle`, the text stops moving once a whole cycle passes without any text that needs to scroll.
+        """
+        if new_pos is None or self.text_settled:
+            self.text_moving = False
             self.scrolling_finished = True
             return
-        pos_after_scroll = self.scrolling_text_pos - 1
+        self.text_moving = True
+        if new_pos:
+            self._text_scrolled_this_cycle = True
+        pos_after_scroll = self.scrolling_text_pos - self.frames_elapsed
         if pos_after_scroll + new_pos < 0:
             self.scrolling_finished = True
             if pos_after_scroll + new_pos < -10:
                 self.scrolling_text_pos = end
+                # Text that fits is drawn in place (and reports 0) wherever the scrolling position is
+                self.text_settled = settle and not self._text_scrolled_this_cycle
+                self._text_scrolled_this_cycle = False
                 return
         else:
             self.scrolling_finished = False
@@ -199,17 +308,41 @@ class MainRenderer:
         return cond
 
 
+class GameViews:
+    """
+    The data the game screens show, built once for each version of a game's data
+    rather than every frame.
+    """
+
+    def __init__(self, game: Game, version: int, time_format: str):
+        self.game = game
+        self.version = version
+        self.time_format = time_format
+
+    @cached_property
+    def scoreboard(self) -> Scoreboard:
+        return Scoreboard(self.game)
+
+    @cached_property
+    def pregame(self) -> Pregame:
+        return Pregame(self.game, self.time_format)
+
+    @cached_property
+    def postgame(self) -> Postgame:
+        return Postgame(self.game)
+
+
 def never_cond() -> bool:
     """A condition that is always false"""
     return False
 
 
-def timer_cond(seconds) -> Callable[[], bool]:
-    """Create a condition that is true for the specified number of seconds"""
-    end = time.time() + seconds
+def timer_cond(seconds, now: Callable[[], float] = bullpen.clock.monotonic) -> Callable[[], bool]:
+    """Create a condition that is true for the specified number of seconds, as measured by `now`"""
+    end = now() + seconds
 
     def cond():
-        return time.time() < end
+        return now() < end
 
     return cond
 
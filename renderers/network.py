@@ -1,4 +1,4 @@
-from driver import graphics
+from renderers.framebuffer import FRAMEBUFFER_GRAPHICS as graphics, fill_rect
 
 from bullpen.util import center_text_position
 
@@ -10,12 +10,10 @@ def render_network_error(canvas, layout, colors):
     coords = layout.coords("network")
     bg_coords = coords["background"]
     text_color = colors.graphics_color("network.text")
-    bg_color = colors.color("network.background")
+    bg_color = colors.graphics_color("network.background")
 
     # Fill in the background so it's clearly visible
-    for x in range(bg_coords["width"]):
-        for y in range(bg_coords["height"]):
-            canvas.SetPixel(x + bg_coords["x"], y + bg_coords["y"], bg_color["r"], bg_color["g"], bg_color["b"])
+    fill_rect(canvas, bg_coords["x"], bg_coords["y"], bg_coords["width"], bg_coords["height"], bg_color)
     text = NETWORK_ERROR_TEXT
     x = center_text_position(text, coords["text"]["x"], font["size"]["width"])
     graphics.DrawText(canvas, font["font"], x, coords["text"]["y"], text_color, text)
@@ -18,16 +18,31 @@ class Renderer(api.PluginRenderer):
         self.update = 1
         self.standings_stat = "w"
         self.standings_league = "NL"
+        self.first = True
 
     def wait_time(self) -> float:
         return 1
 
     def reset(self):
         self.update = 1
+        self.first = True
 
     def can_render(self, data: Standings):
         return data.populated()
 
+    def fingerprint(self, data: Standings, scrolling_text_pos: int) -> tuple:
+        # This is asked for once a second, drawn or not, so the pages are turned here to keep them turning
+        # while the frames in between are skipped.
+        if self.first:
+            self.first = False
+        else:
+            self.__turn_page(data)
+
+        # An update replaces the divisions and leagues, so the ones being shown stand in for their data
+        if self.config.is_postseason():
+            return (self.standings_league, data.leagues[self.standings_league])
+        return (data.current_standings(), self.standings_stat)
+
     def render(
         self, data: Standings, canvas: "Canvas", graphics: api.renderer.graphics, scrolling_text_pos: int
     ) -> None:
@@ -49,19 +64,20 @@ class Renderer(api.PluginRenderer):
                 self.standings_stat,
             )
 
+    def __turn_page(self, data: Standings) -> None:
         if self.config.is_postseason():
             if self.update % 20 == 0:
                 if self.standings_league == "NL":
                     self.standings_league = "AL"
                 else:
                     self.standings_league = "NL"
-        elif canvas.width == 32 and self.update % 5 == 0:
+        elif self.layout.width == 32 and self.update % 5 == 0:
             if self.standings_stat == "w":
                 self.standings_stat = "l"
             else:
                 self.standings_stat = "w"
                 data.advance_to_next_standings()
-        elif canvas.width > 32 and self.update % 10 == 0:
+        elif self.layout.width > 32 and self.update % 10 == 0:
             data.advance_to_next_standings()
 
         self.update = (self.update + 1) % 100
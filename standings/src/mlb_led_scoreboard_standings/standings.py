@@ -1,8 +1,6 @@
-import time
-from datetime import datetime
-
 import statsapi
 
+from bullpen import clock
 from bullpen.api import UpdateStatus, PluginData
 from bullpen.logging import LOGGER
 
@@ -22,7 +20,7 @@ class Standings(PluginData):
     def __init__(self, config: Config) -> None:
         self.config = config
         self.date = self.config.parse_today()
-        self.starttime = time.time()
+        self.starttime = clock.time()
         self.preferred_divisions = config.preferred_divisions
         self.wild_cards = any("Wild" in division for division in config.preferred_divisions)
         self.current_division_index = 0
@@ -36,7 +34,7 @@ class Standings(PluginData):
         if force or self.__should_update():
             self.date = self.config.parse_today()
             LOGGER.info("Refreshing standings for %s", self.date.strftime("%m/%d/%Y"))
-            self.starttime = time.time()
+            self.starttime = clock.time()
             try:
                 if not self.config.is_postseason():
 
@@ -47,7 +45,7 @@ class Standings(PluginData):
                         "season": self.date.strftime("%Y"),
                         "fields": API_FIELDS,
                     }
-                    if self.date != datetime.today().date():
+                    if self.date != clock.today():
                         season_params["date"] = self.date.strftime("%m/%d/%Y")
 
                     divisons_data = statsapi.get("standings", season_params)
@@ -82,7 +80,7 @@ class Standings(PluginData):
         return UpdateStatus.DEFERRED
 
     def __should_update(self):
-        endtime = time.time()
+        endtime = clock.time()
         time_delta = endtime - self.starttime
         return time_delta >= STANDINGS_UPDATE_RATE
 
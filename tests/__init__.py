@@ -1,11 +1,17 @@
 import logging
+import tempfile
 
 from pathlib import Path
 
 
 from bullpen.logging import LOGGER, set_log_directory
+from data.config import fonts
 
 # Clear all default log handlers and set up a test logfile
 LOGGER.handlers.clear()
 LOGGER.setLevel(logging.DEBUG)
 set_log_directory(Path(__file__).parents[1] / "logs" / "bullpen.test.log")
+
+# Keep the font index out of the real cache directory, so tests neither read a stale one nor leave one behind
+_font_index_directory = tempfile.TemporaryDirectory()
+fonts.FONT_INDEX = Path(_font_index_directory.name) / "fonts.json"
@@ -23,3 +23,22 @@ def make_test_config(**test_overrides):
     with mock.patch.object(cli, "arguments", patched_arguments):
         with mock.patch("bullpen.logging.LOGGER.warning"):
             return Config()
+
+
+def make_game_feed(detailed_state="In Progress", abstract_state="Live", timestamp="20240601_230000", **linescore):
+    """
+    Creates a minimal game feed (as returned by the `game` endpoint) for tests that mock statsapi.
+    """
+    return {
+        "gameData": {
+            "datetime": {"dateTime": "2024-06-01T23:05:00Z", "officialDate": "2024-06-01"},
+            "status": {"abstractGameState": abstract_state, "detailedState": detailed_state},
+            "teams": {
+                "away": {"id": 147, "abbreviation": "NYY", "teamName": "Yankees"},
+                "home": {"id": 111, "abbreviation": "BOS", "teamName": "Red Sox"},
+            },
+            "flags": {"noHitter": False, "perfectGame": False},
+        },
+        "liveData": {"linescore": linescore},
+        "metaData": {"timeStamp": timestamp},
+    }
@@ -0,0 +1,47 @@
+import unittest
+
+from renderers.animation import Animation, ease_in_out
+from renderers.games.game import animation_phase
+
+
+class TestAnimation(unittest.TestCase):
+    def test_repeating(self):
+        animation = Animation(2.0)
+        self.assertEqual([animation.step(t, 4) for t in (0, 0.4, 0.5, 1.9, 2.0, 2.6)], [0, 0, 1, 3, 0, 1])
+        self.assertFalse(animation.is_idle(100))
+
+    def test_once(self):
+        animation = Animation(1.0, repeat=False)
+        self.assertEqual(animation.progress(0.25), 0.25)
+        self.assertEqual(animation.step(5, 4), 3)
+        self.assertFalse(animation.is_idle(0.5))
+        self.assertTrue(animation.is_idle(1.0))
+
+    def test_time_to_next_step(self):
+        animation = Animation(2.0)
+        self.assertAlmostEqual(animation.time_to_next_step(0.2, 4), 0.3)
+        self.assertAlmostEqual(animation.time_to_next_step(2.5, 4), 0.5)
+        self.assertIsNone(animation.time_to_next_step(None, 4))
+        self.assertEqual(Animation(1.0, easing=ease_in_out).time_to_next_step(0.2, 4), 0)
+
+    def test_not_started(self):
+        animation = Animation(1.0)
+        self.assertEqual(animation.progress(None), 0)
+        self.assertTrue(animation.is_idle(None))
+
+    def test_easing(self):
+        animation = Animation(1.0, easing=ease_in_out, repeat=False)
+        self.assertAlmostEqual(animation.progress(0.5), 0.5)
+        self.assertLess(animation.progress(0.25), 0.25)
+        self.assertEqual(animation.progress(1.0), 1.0)
+
+    def test_live_game_animations_are_timed(self):
+        # (play result shown, base lit for a home run)
+        self.assertEqual(animation_phase(None), (0, 0))
+        self.assertEqual(animation_phase(0.7), (1, 1))
+        self.assertEqual(animation_phase(1.3), (0, 2))
+        self.assertEqual(animation_phase(1.9), (1, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
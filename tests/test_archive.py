@@ -0,0 +1,93 @@
+"""
+Tests for bullpen.archive, which records and replays HTTP responses.
+
+Archives are written to a temporary directory, with a virtual clock.
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+import requests
+
+from bullpen.archive import NOT_RECORDED_STATUS, Recorder, Replayer
+from bullpen.clock import VirtualClock
+
+URL = "https://statsapi.mlb.com/api/v1/game/1/feed/live"
+
+
+def _response(body, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body.encode()
+    response.encoding = "utf-8"
+    return response
+
+
+class TestArchive(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "archive.jsonl.gz")
+        self.clock = VirtualClock(1000.0, speed=0)
+
+    def record(self, *responses):
+        """Records (seconds from start, url, body) responses"""
+        recorder = Recorder(self.path, clock=self.clock.time)
+        start = self.clock.time()
+        for seconds, url, body in responses:
+            self.clock.advance(start + seconds - self.clock.time())
+            recorder.record(url, _response(body))
+        recorder.close()
+
+    def test_replays_in_time_order(self):
+        self.record((0, URL, '{"inning": 1}'), (60, URL, '{"inning": 2}'), (120, URL, '{"inning": 3}'))
+
+        self.clock.advance(5000.0 - self.clock.time())
+        replayer = Replayer(self.path, clock=self.clock.time)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 1})
+        self.clock.advance(59)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 1})
+        self.clock.advance(1)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 2})
+        self.clock.advance(1000)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 3})
+
+    def test_first_response_served_before_it_was_recorded(self):
+        self.record((0, "https://example.com", "{}"), (30, URL, '{"inning": 1}'))
+
+        replayer = Replayer(self.path, clock=self.clock.time)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 1})
+
+    def test_not_recorded(self):
+        self.record((0, URL, "{}"))
+
+        response = Replayer(self.path, clock=self.clock.time).response("https://example.com")
+        self.assertEqual(response.status_code, NOT_RECORDED_STATUS)
+        with self.assertRaises(requests.HTTPError):
+            response.raise_for_status()
+
+    def test_recording_is_appended_to(self):
+        self.record((0, URL, '{"inning": 1}'))
+        self.record((60, URL, '{"inning": 2}'))
+
+        replayer = Replayer(self.path, clock=self.clock.time)
+        self.clock.advance(60)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 2})
+
+    def test_incomplete_recording(self):
+        self.record((0, URL, '{"inning": 1}'), (60, URL, '{"inning": 2}'))
+        with gzip.open(self.path, "rb") as f:
+            data = gzip.compress(f.read())
+        # as if the scoreboard was stopped partway through writing
+        with open(self.path, "wb") as f:
+            f.write(data[:-12])
+
+        with self.assertLogs("bullpen", level="WARNING"):
+            replayer = Replayer(self.path, clock=self.clock.time)
+        self.assertEqual(replayer.response(URL).json(), {"inning": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""
+Tests for drawing clipped to a rectangle.
+
+These draw on the emulator's canvas: clipped drawing must match unclipped drawing
+inside the rectangle, and leave everything outside it alone.
+"""
+
+import unittest
+
+import numpy as np
+
+from bullpen.clip import ClippedGraphics
+from data.config.layout import Layout
+from driver import RGBMatrix, RGBMatrixOptions, graphics
+
+WHITE = graphics.Color(255, 255, 255)
+
+# x, y, width, height
+CLIP = (10, 8, 30, 12)
+
+
+def _pixels(canvas):
+    return canvas._Canvas__pixels
+
+
+class TestClippedGraphics(unittest.TestCase):
+    def setUp(self):
+        options = RGBMatrixOptions()
+        options.cols = 64
+        options.rows = 32
+        self.matrix = RGBMatrix(options=options)
+        self.clipped = ClippedGraphics(graphics, *CLIP)
+
+    def assertClipped(self, draw):
+        expected = self.matrix.CreateFrameCanvas()
+        draw(graphics, expected)
+        actual = self.matrix.CreateFrameCanvas()
+        draw(self.clipped, actual)
+
+        x, y, width, height = CLIP
+        inside = np.zeros(_pixels(actual).shape, dtype=bool)
+        inside[y : y + height, x : x + width] = True
+        np.testing.assert_array_equal(_pixels(actual)[inside], _pixels(expected)[inside])
+        self.assertFalse(_pixels(actual)[~inside].any())
+
+    def test_text(self):
+        font = Layout({"defaults": {"font_name": "5x7"}}, 64, 32).font("anything")["font"]
+        for x, y in [(0, 14), (12, 14), (30, 14), (12, 9), (12, 22)]:
+            with self.subTest(x=x, y=y):
+                self.assertClipped(lambda g, canvas: g.DrawText(canvas, font, x, y, WHITE, "Clipped text!"))
+
+    def test_lines(self):
+        for line in [
+            (0, 10, 63, 10),
+            (20, 0, 20, 31),
+            (15, 10, 30, 15),
+            (0, 0, 63, 31),
+            (5, 2, 8, 30),
+            (12.5, 31, 26.67, 31),
+        ]:
+            with self.subTest(line=line):
+                self.assertClipped(lambda g, canvas: g.DrawLine(canvas, *line, WHITE))
+
+    def test_circle(self):
+        self.assertClipped(lambda g, canvas: g.DrawCircle(canvas, 25, 14, 4, WHITE))
+        self.assertClipped(lambda g, canvas: g.DrawCircle(canvas, 12, 10, 6, WHITE))
+
+    def test_nested_clip(self):
+        inner = self.clipped.clip(0, 0, 20, 100)
+        self.assertEqual((inner.x, inner.y, inner.width, inner.height), (10, 8, 10, 12))
+
+
+if __name__ == "__main__":
+    unittest.main()
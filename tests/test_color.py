@@ -0,0 +1,44 @@
+import unittest
+
+from data.config.color import Color
+from data.scoreboard.team import Team
+
+WHITE = {"r": 255, "g": 255, "b": 255}
+BLACK = {"r": 0, "g": 0, "b": 0}
+RED = {"r": 255, "g": 0, "b": 0}
+
+TEAM_COLORS = {
+    "default": {"home": BLACK, "text": WHITE, "accent": WHITE},
+    "bos": {"home": RED, "city_connect": {"home": BLACK, "accent": RED}},
+}
+
+
+class TestColor(unittest.TestCase):
+    def test_keypaths(self):
+        colors = Color(TEAM_COLORS)
+        self.assertEqual(colors.color("bos.home"), RED)
+        self.assertEqual(colors.color("bos.city_connect.accent"), RED)
+        self.assertIs(colors.color("default"), TEAM_COLORS["default"])
+        with self.assertRaises(KeyError):
+            colors.color("nyy.home")
+
+    def test_graphics_colors_are_reused(self):
+        colors = Color(TEAM_COLORS)
+        color = colors.graphics_color("bos.home")
+        self.assertEqual((color.red, color.green, color.blue), (255, 0, 0))
+        self.assertIs(colors.graphics_color("bos.home"), color)
+        # the same color at another keypath is the same object, too
+        self.assertIs(colors.graphics_color("bos.city_connect.accent"), color)
+
+    def test_team_palettes(self):
+        colors = Color(TEAM_COLORS)
+        palette = Team("BOS", 0, "Red Sox", 0, 0, {}, None).lookup_color(colors)
+        self.assertEqual((palette["home"], palette["text"], palette["accent"]), (RED, WHITE, WHITE))
+        self.assertIs(Team("BOS", 1, "Red Sox", 0, 0, {}, None).lookup_color(colors), palette)
+
+        city_connect = Team("BOS", 0, "Red Sox", 0, 0, {}, "city_connect").lookup_color(colors)
+        self.assertEqual((city_connect["home"], city_connect["accent"]), (BLACK, RED))
+
+
+if __name__ == "__main__":
+    unittest.main()
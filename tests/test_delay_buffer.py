@@ -0,0 +1,120 @@
+"""
+Tests for the spoiler delay, which holds data back for `sync_delay_seconds`.
+
+Time is virtual here, so nothing actually sleeps. statsapi is mocked for the game tests.
+"""
+
+import unittest
+from collections import namedtuple
+from unittest.mock import patch
+
+import data.game
+from bullpen import clock
+from bullpen.clock import VirtualClock
+from data.utils.delay_buffer import DelayBuffer
+from tests.helpers import make_game_feed
+
+MockConfig = namedtuple("MockConfig", ["sync_delay_seconds", "api_refresh_rate", "uniform_types"])
+
+
+class TestDelayBuffer(unittest.TestCase):
+    def setUp(self):
+        self.clock = VirtualClock(100.0, speed=0)
+        self.buffer = DelayBuffer(30, now=self.clock.monotonic)
+
+    def test_first_value_is_shown_until_delay_builds_up(self):
+        self.buffer.push("first")
+        self.assertEqual(self.buffer.peek(), "first")
+        self.assertEqual(self.buffer.lag(), 0)
+
+        self.clock.advance(10)
+        self.buffer.push("second")
+        self.assertEqual(self.buffer.peek(), "first")
+        self.assertEqual(self.buffer.lag(), 10)
+
+        self.clock.advance(30)
+        self.assertEqual(self.buffer.peek(), "second")
+        self.assertEqual(self.buffer.lag(), 30)
+
+    def test_delay_does_not_depend_on_how_often_values_are_pushed(self):
+        # each value is the second it is pushed at
+        pushes = [(seconds, "push", seconds) for seconds in (5, 12, 14, 40, 41, 90)]
+        # the value pushed as of 30 seconds before then
+        peeks = [
+            (seconds, "peek", shown)
+            for seconds, shown in ((19, 0), (35, 5), (43, 12), (60, 14), (70, 40), (100, 41), (200, 90))
+        ]
+
+        self.buffer.push(0)
+        for seconds, action, value in sorted(pushes + peeks):
+            self.clock.advance(100 + seconds - self.clock.monotonic())
+            if action == "push":
+                self.buffer.push(value)
+            else:
+                self.assertEqual(self.buffer.peek(), value)
+
+    def test_only_changes_are_kept(self):
+        for _ in range(100):
+            self.buffer.push("unchanged")
+            self.clock.advance(1)
+        self.buffer.push("changed")
+        self.assertEqual(len(self.buffer), 2)
+
+        # and older values are let go once they are no longer shown
+        self.clock.advance(30)
+        self.assertEqual(self.buffer.peek(), "changed")
+        self.assertEqual(len(self.buffer), 1)
+
+    def test_no_delay(self):
+        buffer = DelayBuffer(0, now=self.clock.monotonic)
+        buffer.push(1)
+        buffer.push(2)
+        self.assertEqual(buffer.peek(), 2)
+        self.assertEqual(buffer.lag(), 0)
+
+    def test_empty(self):
+        with self.assertRaises(IndexError):
+            self.buffer.peek()
+        self.assertEqual(self.buffer.lag(), 0)
+
+
+class TestGameDelay(unittest.TestCase):
+    def setUp(self):
+        clock.set_clock(VirtualClock(0.0, speed=0))
+        self.addCleanup(clock.set_clock, None)
+
+        self.outs = 0
+        for patcher in [
+            patch("data.game.statsapi.get", side_effect=self.get),
+            # the debug output needs a complete game feed
+            patch.object(data.game.Game, "print_game_data_debug"),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get(self, endpoint, params, **kwargs):
+        if endpoint == "game":
+            return make_game_feed(outs=self.outs)
+        return {"uniforms": []}
+
+    def test_game_is_shown_as_of_the_delay(self):
+        config = MockConfig(sync_delay_seconds=60, api_refresh_rate=10, uniform_types={})
+        game = data.game.Game.from_scheduled({"game_id": 1, "game_date": "2024-06-01"}, config)
+
+        # outs change every 20 seconds, and polls are sometimes slow
+        shown = []
+        for seconds in (10, 20, 30, 55, 60, 70, 80, 100, 120, 130):
+            clock.sleep(seconds - clock.monotonic())
+            self.outs = seconds // 20
+            game.update(force=True, testing_params={"timecode": str(seconds)})
+            shown.append(game.outs())
+
+        # the outs as of a minute before each poll
+        self.assertEqual(shown, [0, 0, 0, 0, 0, 0, 1, 1, 3, 3])
+        self.assertEqual(game.current_delay(), 60)
+        # only the polls where the outs changed, since what is being shown
+        self.assertLessEqual(len(game._data_wait_queue), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
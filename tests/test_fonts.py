@@ -1,4 +1,9 @@
-import os, re, unittest
+import json, os, re, tempfile, unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from bullpen import bdf, text
+from data.config import fonts
 from data.config.layout import Layout, FONTNAME_DEFAULT, FONTNAME_KEY, DIR_FONT_PATCHED
 
 
@@ -40,3 +45,99 @@ class TestLayout(unittest.TestCase):
                     font_dict = layout.font("test")
 
                     self.assertEqual(font_dict["size"], {"width": int(x), "height": int(y)})
+
+    def test_layout_states(self):
+        layout = Layout(
+            {
+                "defaults": {FONTNAME_KEY: FONTNAME_DEFAULT},
+                "test": {
+                    "x": 1,
+                    "inner": {"x": 2, "warmup": {"x": 3, FONTNAME_KEY: "5x7"}},
+                    "nohit": {"x": 4},
+                },
+            },
+            32,
+            32,
+        )
+
+        self.assertEqual(layout.coords("test.inner.x"), 2)
+        self.assertEqual(layout.coords("test")["x"], 1)
+        self.assertEqual(layout.font("test.inner")["size"], {"width": 4, "height": 6})
+        with self.assertRaises(KeyError):
+            layout.coords("test.missing")
+
+        layout.set_state("warmup")
+        self.assertEqual(layout.coords("test.inner"), {"x": 3, FONTNAME_KEY: "5x7"})
+        self.assertEqual(layout.font("test.inner")["size"], {"width": 5, "height": 7})
+        # states only apply to the object at the keypath itself
+        self.assertEqual(layout.coords("test")["x"], 1)
+
+        layout.set_state("nohit")
+        self.assertEqual(layout.coords("test"), {"x": 4})
+
+        layout.set_state("not a state")
+        self.assertIsNone(layout.state)
+        self.assertEqual(layout.coords("test")["x"], 1)
+        self.assertEqual(layout.font("no.such.keypath")["size"], {"width": 4, "height": 6})
+
+
+class TestFontRegistry(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.index = Path(directory.name) / "fonts.json"
+        for patcher in [
+            patch.object(fonts, "FONT_INDEX", self.index),
+            patch.dict(fonts._fonts, clear=True),
+            patch.dict(fonts._index, clear=True),
+            patch.object(fonts, "_index_loaded", False),
+            patch.dict(bdf._indexes, clear=True),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_fonts_are_shared_between_layouts(self):
+        layout = Layout({"defaults": {FONTNAME_KEY: FONTNAME_DEFAULT}, "test": {FONTNAME_KEY: "5x7"}}, 32, 32)
+        plugin_layout = layout.for_plugin("news")
+
+        self.assertIs(layout.font("test.missing"), plugin_layout.font("news"))
+
+        other_layout = Layout({"defaults": {FONTNAME_KEY: "4x6"}, "other": {FONTNAME_KEY: "5x7"}}, 64, 32)
+        self.assertIs(layout.font("test"), other_layout.font("other"))
+
+    def test_metrics_are_indexed(self):
+        path = os.path.abspath(os.path.join(DIR_FONT_PATCHED, "5x7.bdf"))
+        fonts.load(path)
+        self.assertIn(path, json.loads(self.index.read_text()))
+
+    def test_glyphs_are_read_using_the_index(self):
+        path = os.path.abspath(os.path.join(DIR_FONT_PATCHED, "5x7.bdf"))
+        fonts.load(path)
+
+        # as if starting again, with the index from the last run
+        fonts._fonts.clear()
+        fonts._index.clear()
+        fonts._index_loaded = False
+        bdf._indexes.clear()
+        text.text_strip.cache_clear()
+        with patch.object(fonts, "bdfparser") as bdfparser, patch.object(bdf, "scan") as scan:
+            fonts.load(path)
+            strip = text.text_strip(path, "Indexed", (255, 255, 255))
+
+        bdfparser.Font.assert_not_called()
+        scan.assert_not_called()
+        self.assertTrue(strip.boxes)
+
+        # a fresh process reads the sizes from the index, rather than parsing the font
+        fonts._fonts.clear()
+        fonts._index.clear()
+        fonts._index_loaded = False
+        with patch("data.config.fonts.bdfparser.Font") as parse:
+            self.assertEqual(fonts.load(path)["size"], {"width": 5, "height": 7})
+            parse.assert_not_called()
+
+    def test_stale_metrics_are_parsed_again(self):
+        path = os.path.abspath(os.path.join(DIR_FONT_PATCHED, "5x7.bdf"))
+        self.index.write_text(json.dumps({path: {"mtime": 0, "size": 0, "headers": {"fbbx": 1, "fbby": 1}}}))
+
+        self.assertEqual(fonts.load(path)["size"], {"width": 5, "height": 7})
@@ -0,0 +1,62 @@
+"""
+Tests for pacing the render loop.
+
+Time is virtual here, so nothing actually sleeps.
+"""
+
+import unittest
+
+from bullpen.clock import VirtualClock
+from renderers.clock import FrameClock
+
+
+class TestFrameClock(unittest.TestCase):
+    def setUp(self):
+        self.time = VirtualClock(100.0, speed=0)
+        self.clock = FrameClock(0.1, now=self.time.monotonic, sleep=self.time.sleep)
+
+    def test_draw_time_does_not_slow_frames(self):
+        for _ in range(10):
+            self.time.advance(0.06)  # drawing
+            self.assertEqual(self.clock.tick(), 1)
+
+        self.assertAlmostEqual(self.time.monotonic(), 101.0)
+        self.assertEqual(self.clock.overruns, 0)
+
+    def test_overrun_catches_up(self):
+        self.time.advance(0.35)
+        self.assertEqual(self.clock.tick(), 3)
+        self.assertEqual(self.clock.overruns, 1)
+
+        # back on the original schedule
+        self.assertEqual(self.clock.tick(), 1)
+        self.assertAlmostEqual(self.time.monotonic(), 100.4)
+        self.assertEqual(self.clock.frame, 4)
+
+    def test_long_stall_drops_frames(self):
+        self.time.advance(10)
+        self.assertEqual(self.clock.tick(), FrameClock.MAX_CATCHUP)
+
+        self.assertEqual(self.clock.tick(), 1)
+        self.assertAlmostEqual(self.time.monotonic(), 110.1)
+
+    def test_set_period(self):
+        self.clock.set_period(1.0)
+        self.assertEqual(self.clock.tick(), 1)
+        self.assertAlmostEqual(self.time.monotonic(), 101.0)
+
+        # speeding back up doesn't try to make up for the slow frames
+        self.time.advance(0.5)
+        self.clock.set_period(0.1)
+        self.assertEqual(self.clock.tick(), 1)
+        self.assertEqual(self.clock.overruns, 0)
+
+    def test_start(self):
+        self.time.advance(5)
+        self.clock.start(1)
+        self.assertEqual(self.clock.tick(), 1)
+        self.assertAlmostEqual(self.time.monotonic(), 106.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
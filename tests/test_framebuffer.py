@@ -0,0 +1,92 @@
+"""
+Tests for drawing game screens into a frame buffer.
+
+Everything drawn into the frame buffer must come out the same as drawing it on the emulator's canvas.
+"""
+
+import json
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from data.config.color import Color
+from data.config.layout import Layout
+from data.scoreboard.inning import Inning
+from data.scoreboard.team import Team
+from driver import RGBMatrix, RGBMatrixOptions, graphics
+from renderers import network
+from renderers.framebuffer import FRAMEBUFFER_GRAPHICS, FrameBuffer, fill_rect
+from renderers.games import game, teams
+
+WHITE = graphics.Color(255, 255, 255)
+RED = graphics.Color(255, 0, 0)
+
+
+def _pixels(canvas):
+    return canvas._Canvas__pixels
+
+
+class TestFrameBuffer(unittest.TestCase):
+    def setUp(self):
+        options = RGBMatrixOptions()
+        options.cols = 64
+        options.rows = 32
+        self.matrix = RGBMatrix(options=options)
+
+    def assertSameDrawing(self, draw):
+        expected = self.matrix.CreateFrameCanvas()
+        expected.Fill(0, 0, 80)
+        draw(expected)
+
+        framebuffer = FrameBuffer(64, 32)
+        framebuffer.Fill(0, 0, 80)
+        draw(framebuffer)
+        actual = self.matrix.CreateFrameCanvas()
+        framebuffer.push(actual)
+
+        np.testing.assert_array_equal(_pixels(actual), _pixels(expected))
+
+    def test_text(self):
+        for font_name in ["4x6", "5x7", "6x10", "10x20", "tom-thumb"]:
+            font = Layout({"defaults": {"font_name": font_name}}, 64, 32).font("anything")["font"]
+            for x in [-7, 0, 13, 50]:
+                with self.subTest(font=font_name, x=x):
+                    self.assertSameDrawing(
+                        lambda canvas: FRAMEBUFFER_GRAPHICS.DrawText(canvas, font, x, 20, WHITE, "Top 9th, 3-2")
+                    )
+
+    def test_lines_and_shapes(self):
+        def draw(canvas):
+            FRAMEBUFFER_GRAPHICS.DrawLine(canvas, -5, 3, 70, 3, RED)
+            FRAMEBUFFER_GRAPHICS.DrawLine(canvas, 10, 30, 10, 2, RED)
+            FRAMEBUFFER_GRAPHICS.DrawLine(canvas, 40, 2, 30, 12, WHITE)
+            FRAMEBUFFER_GRAPHICS.DrawLine(canvas, 2, 30, 60, 12, WHITE)
+            FRAMEBUFFER_GRAPHICS.DrawCircle(canvas, 50, 25, 5, RED)
+            fill_rect(canvas, 20, 20, 6, 4, WHITE)
+
+        self.assertSameDrawing(draw)
+
+    def test_game_screen_parts(self):
+        with open("coordinates/w64h32.example.json") as f:
+            layout = Layout(json.load(f), 64, 32)
+        with open("colors/teams.example.json") as f:
+            team_colors = Color(json.load(f))
+        with open("colors/scoreboard.example.json") as f:
+            colors = Color(json.load(f))
+        home = Team("NYY", 3, "Yankees", 5, 0, {"wins": 10, "losses": 3}, None)
+        away = Team("BOS", 2, "Red Sox", 4, 1, {"wins": 8, "losses": 5}, None)
+
+        def draw(canvas):
+            teams.render_team_banner(canvas, layout, team_colors, home, away, True)
+            game._render_bases(canvas, layout, colors, SimpleNamespace(runners=[True, False, True]), False, None)
+            game._render_outs(canvas, layout, colors, SimpleNamespace(number=2))
+            game._render_count(canvas, layout, colors, SimpleNamespace(balls=3, strikes=2))
+            game._render_inning_display(canvas, layout, colors, SimpleNamespace(number=9, state=Inning.BOTTOM))
+            network.render_network_error(canvas, layout, colors)
+
+        self.assertSameDrawing(draw)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,10 +7,12 @@ A similar set of tests with stored responses may be separately added in the futu
 
 import unittest
 import data.game
+from bullpen import clock
 from bullpen.api import UpdateStatus
+from bullpen.clock import VirtualClock
 from collections import namedtuple
 
-MockConfig = namedtuple("MockConfig", ["sync_amount", "api_refresh_rate", "uniform_types"])
+MockConfig = namedtuple("MockConfig", ["sync_delay_seconds", "api_refresh_rate", "uniform_types"])
 
 
 class TestGame(unittest.TestCase):
@@ -22,7 +24,7 @@ class TestGame(unittest.TestCase):
     }
 
     def test_game(self):
-        config = MockConfig(sync_amount=0, api_refresh_rate=10, uniform_types={})
+        config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
 
         game = data.game.Game.from_scheduled(self.game_data, config)
         self.assertIsNotNone(game)
@@ -58,18 +60,22 @@ class TestGame(unittest.TestCase):
 
     def test_game_in_middle(self):
         # uses some timestamps to test specific points in the game and our delay logic
-        config = MockConfig(sync_amount=1, api_refresh_rate=10, uniform_types={})
+        config = MockConfig(sync_delay_seconds=10, api_refresh_rate=10, uniform_types={})
+        clock.set_clock(VirtualClock(0.0, speed=0))
+        self.addCleanup(clock.set_clock, None)
 
         game = data.game.Game.from_scheduled(self.game_data, config)
         self.assertIsNotNone(game)
         self.assertEqual(game.current_delay(), 0)
 
+        clock.sleep(10)
         self.assertEqual(game.update(force=True, testing_params={"timecode": "20190817_230958"}), UpdateStatus.SUCCESS)
         self.assertEqual(game.current_delay(), 10)
         # at this point, should still be 'delayed' (meaning the data is from the end of the game)
         self.assertEqual(game.status(), "Final")
 
         # Yelich hits a single at this timestamp, but we can't observe it yet
+        clock.sleep(10)
         self.assertEqual(game.update(force=True, testing_params={"timecode": "20190817_231033"}), UpdateStatus.SUCCESS)
         self.assertEqual(game.current_delay(), 10)
 
@@ -83,6 +89,7 @@ class TestGame(unittest.TestCase):
 
         # Now we force the second 'live' update
         # (it doesn't matter that this fetch will be at the end of the game!)
+        clock.sleep(10)
         self.assertEqual(game.update(force=True), UpdateStatus.SUCCESS)
 
         self.assertEqual(game.status(), "In Progress")
@@ -94,7 +101,7 @@ class TestGame(unittest.TestCase):
 
     def test_special_status_game(self):
         # https://www.mlb.com/news/tigers-nearly-combine-for-no-hitter-against-orioles
-        config = MockConfig(sync_amount=0, api_refresh_rate=10, uniform_types={"city_connect": "City Connect"})
+        config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={"city_connect": "City Connect"})
 
         game_data = {
             "game_id": 746423,
@@ -132,7 +139,7 @@ class TestGame(unittest.TestCase):
 
     def test_city_connect_uniform(self):
         # Reds vs Angels 2026-04-11: CIN wore City Connect 2.0
-        config = MockConfig(sync_amount=0, api_refresh_rate=10, uniform_types={"city_connect": "City Connect"})
+        config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={"city_connect": "City Connect"})
 
         game_data = {
             "game_id": 824535,
@@ -146,7 +153,7 @@ class TestGame(unittest.TestCase):
     def test_special_uniforms(self):
         # Reds vs Astros 2026-05-08: CIN wore CINCY
         config = MockConfig(
-            sync_amount=0, api_refresh_rate=10, uniform_types={"cincy": "CINCY", "city_connect": "City Connect"}
+            sync_delay_seconds=0, api_refresh_rate=10, uniform_types={"cincy": "CINCY", "city_connect": "City Connect"}
         )
 
         game_data = {
@@ -160,7 +167,7 @@ class TestGame(unittest.TestCase):
 
     def test_weather_delays(self):
         # https://www.northjersey.com/story/sports/mlb/2024/06/26/mets-yankees-subway-series-game-delayed-weather-new-york-postponed/74226587007/
-        config = MockConfig(sync_amount=0, api_refresh_rate=10, uniform_types={})
+        config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
 
         game_data = {
             "game_id": 745808,
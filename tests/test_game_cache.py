@@ -0,0 +1,140 @@
+"""
+Tests for freezing and storing games that are over.
+
+statsapi is mocked here, and games are stored in a temporary directory.
+"""
+
+import tempfile
+import unittest
+from collections import namedtuple
+from pathlib import Path
+from unittest.mock import patch
+
+import data.game
+from bullpen import clock
+from bullpen.api import UpdateStatus
+from bullpen.clock import VirtualClock
+from data import game_cache
+from tests.helpers import make_game_feed
+
+MockConfig = namedtuple("MockConfig", ["sync_delay_seconds", "api_refresh_rate", "uniform_types"])
+
+GAME_DATA = {"game_id": 1, "game_date": "2024-06-01"}
+
+
+def _feed(detailed, abstract="Final"):
+    return make_game_feed(detailed, abstract)
+
+
+class TestFrozenGames(unittest.TestCase):
+    def setUp(self):
+        self.config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        for patcher in [
+            patch.object(game_cache, "GAMES_DIRECTORY", self.directory),
+            patch.dict(game_cache._games, clear=True),
+            # the debug output needs a complete game feed
+            patch.object(data.game.Game, "print_game_data_debug"),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_final_game_is_frozen(self):
+        with patch("data.game.statsapi.get", return_value=_feed("Final")) as mock_get:
+            game = data.game.Game.from_scheduled(GAME_DATA, self.config)
+            self.assertTrue(game.is_frozen())
+            self.assertEqual(game.update(), UpdateStatus.DEFERRED)
+            mock_get.assert_called_once()
+
+        self.assertTrue((self.directory / "2024-06-01_1.json").exists())
+
+    def test_game_over_is_not_frozen(self):
+        with patch("data.game.statsapi.get", return_value=_feed("Game Over")):
+            game = data.game.Game.from_scheduled(GAME_DATA, self.config)
+        self.assertFalse(game.is_frozen())
+
+    def test_live_game_is_not_frozen(self):
+        with patch("data.game.statsapi.get", return_value=_feed("In Progress", "Live")):
+            game = data.game.Game.from_scheduled(GAME_DATA, self.config)
+        self.assertFalse(game.is_frozen())
+        self.assertFalse(list(self.directory.iterdir()))
+
+    def test_frozen_game_is_not_fetched_again(self):
+        with patch("data.game.statsapi.get", return_value=_feed("Final")):
+            data.game.Game.from_scheduled(GAME_DATA, self.config)
+
+        # and not even after a restart
+        game_cache._games.clear()
+
+        with patch("data.game.statsapi.get") as mock_get:
+            game = data.game.Game.from_scheduled(GAME_DATA, self.config)
+            mock_get.assert_not_called()
+
+        self.assertTrue(game.is_frozen())
+        self.assertEqual(game.status(), "Final")
+
+    def test_only_latest_day_kept_in_memory(self):
+        with patch("data.game.statsapi.get", return_value=_feed("Final")):
+            data.game.Game.from_scheduled(GAME_DATA, self.config)
+            data.game.Game.from_scheduled({"game_id": 2, "game_date": "2024-06-02"}, self.config)
+
+        self.assertEqual(list(game_cache._games), [(2, "2024-06-02")])
+        # but older games are still stored
+        self.assertIsNotNone(game_cache.load(1, "2024-06-01"))
+        # and reading them back doesn't keep them either
+        self.assertEqual(list(game_cache._games), [(2, "2024-06-02")])
+
+    def test_loading_a_later_day_forgets_earlier_ones(self):
+        with patch("data.game.statsapi.get", return_value=_feed("Final")):
+            data.game.Game.from_scheduled(GAME_DATA, self.config)
+            data.game.Game.from_scheduled({"game_id": 2, "game_date": "2024-06-02"}, self.config)
+        game_cache._games.clear()
+
+        # after a restart, as games from each day are shown in turn
+        game_cache.load(1, "2024-06-01")
+        game_cache.load(2, "2024-06-02")
+
+        self.assertEqual(list(game_cache._games), [(2, "2024-06-02")])
+
+    def test_forced_update_still_fetches(self):
+        with patch("data.game.statsapi.get", return_value=_feed("Final")):
+            game = data.game.Game.from_scheduled(GAME_DATA, self.config)
+
+        with patch("data.game.statsapi.get", return_value=_feed("In Progress", "Live")) as mock_get:
+            self.assertEqual(game.update(force=True, testing_params={"timecode": "x"}), UpdateStatus.SUCCESS)
+            mock_get.assert_called_once()
+
+        self.assertFalse(game.is_frozen())
+        self.assertEqual(game.status(), "In Progress")
+
+    def test_delayed_game_is_frozen_once_caught_up(self):
+        clock.set_clock(VirtualClock(0.0, speed=0))
+        self.addCleanup(clock.set_clock, None)
+        config = self.config._replace(sync_delay_seconds=30)
+
+        with patch("data.game.statsapi.get", return_value=_feed("In Progress", "Live")):
+            game = data.game.Game.from_scheduled(GAME_DATA, config)
+
+        with patch("data.game.statsapi.get", return_value=_feed("Final")) as mock_get:
+            clock.sleep(10)
+            self.assertEqual(game.update(), UpdateStatus.SUCCESS)
+            self.assertEqual(game.status(), "In Progress")
+            self.assertFalse(game.is_frozen())
+            fetches = mock_get.call_count
+
+            # the game isn't fetched again, but is still shown as it was 30 seconds ago
+            while game.status() != "Final":
+                clock.sleep(10)
+                self.assertEqual(game.update(), UpdateStatus.DEFERRED)
+            self.assertLessEqual(clock.monotonic(), 40)
+            self.assertEqual(mock_get.call_count, fetches)
+
+        self.assertTrue(game.is_frozen())
+        self.assertTrue((self.directory / "2024-06-01_1.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Tests for parsing game feeds into snapshots.
+
+statsapi is mocked here, using a small hand-written feed.
+"""
+
+import unittest
+from collections import namedtuple
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import data.game
+from data.game_snapshot import parse_snapshot
+from renderers.main import GameViews
+from tests.helpers import make_game_feed
+
+MockConfig = namedtuple("MockConfig", ["sync_delay_seconds", "api_refresh_rate", "uniform_types"])
+
+
+def _feed():
+    feed = make_game_feed(
+        balls=2,
+        strikes=1,
+        outs=1,
+        inningState="Bottom",
+        currentInning=7,
+        currentInningOrdinal="7th",
+        teams={"home": {"runs": 4, "hits": 9, "errors": 1}, "away": {"runs": 3, "hits": 6}},
+        offense={"batter": {"id": 1}, "onDeck": {"id": 2}, "first": {"id": 3}},
+        defense={"pitcher": {"id": 10}},
+    )
+    feed["gameData"]["players"] = {
+        "ID1": {"id": 1, "fullName": "Alex Batter", "boxscoreName": "Batter"},
+        "ID10": {"id": 10, "fullName": "Sam Pitcher", "boxscoreName": "Pitcher"},
+        "ID11": {"id": 11, "fullName": "Pat Starter", "boxscoreName": "Starter"},
+    }
+    feed["gameData"]["probablePitchers"] = {"away": {"id": 10}, "home": {"id": 11}}
+    feed["liveData"]["boxscore"] = {
+        "teams": {
+            "away": {
+                "players": {
+                    "ID10": {"seasonStats": {"pitching": {"wins": 5, "era": "3.10"}}, "stats": {"pitching": {}}},
+                    "ID3": {"seasonStats": {"batting": {}}},
+                }
+            },
+            "home": {
+                "players": {
+                    "ID11": {
+                        "seasonStats": {"pitching": {"wins": 2, "era": "4.50"}},
+                        "stats": {"pitching": {"numberOfPitches": 97}},
+                    },
+                }
+            },
+        }
+    }
+    feed["liveData"]["plays"] = {
+        "currentPlay": {
+            "result": {"eventType": "strikeout", "description": "Alex Batter called out on strikes."},
+            "playEvents": [
+                {
+                    "isPitch": True,
+                    "pitchData": {"startSpeed": 95.1},
+                    "details": {"type": {"code": "FF", "description": "Four-Seam Fastball"}},
+                }
+            ],
+        }
+    }
+    return feed
+
+
+class TestGameSnapshot(unittest.TestCase):
+    def test_parse_snapshot(self):
+        feed = _feed()
+        snapshot = parse_snapshot(feed, feed["gameData"]["status"])
+
+        self.assertEqual(snapshot.start_time, datetime(2024, 6, 1, 23, 5, tzinfo=timezone.utc))
+        self.assertEqual((snapshot.away.name, snapshot.home.name), ("Yankees", "Red Sox"))
+        self.assertEqual((snapshot.home.runs, snapshot.home.hits, snapshot.home.errors), (4, 9, 1))
+        self.assertEqual(snapshot.away.errors, 0)
+        self.assertEqual((snapshot.balls, snapshot.strikes, snapshot.outs), (2, 1, 1))
+        self.assertEqual(snapshot.runners, {"first": 3, "second": None, "third": None})
+        self.assertEqual((snapshot.batter, snapshot.on_deck, snapshot.in_hole), ("Batter", "", ""))
+        self.assertEqual(snapshot.pitcher, "Pitcher")
+        self.assertEqual(snapshot.pitch_count, 0)
+        self.assertEqual(snapshot.last_pitch, (95.1, "FF", "Four-Seam Fastball"))
+        self.assertEqual(snapshot.play_result, "strikeout_looking")
+        self.assertIsNone(snapshot.winning_team)
+        self.assertIsNone(snapshot.weather)
+
+    def test_game_accessors(self):
+        config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
+        with patch("data.game.statsapi.get", return_value=_feed()), patch.object(
+            data.game.Game, "print_game_data_debug"
+        ):
+            game = data.game.Game.from_scheduled({"game_id": 1, "game_date": "2024-06-01"}, config)
+
+        self.assertEqual(game.full_name(game.probable_pitcher_id("home")), "Pat Starter")
+        self.assertEqual(game.full_name("ID10"), "Sam Pitcher")
+        self.assertEqual(game.pitcher_stat(11, "era", "home"), "4.50")
+        # without a team, look at both
+        self.assertEqual(game.pitcher_stat(10, "wins"), 5)
+        self.assertEqual(game.pitcher_stat(3, "wins"), "")
+        with self.assertRaises(KeyError):
+            game.pitcher_stat(10, "wins", "home")
+        self.assertIsNone(game.decision_pitcher_id("winner"))
+        self.assertTrue(game.man_on("first"))
+        self.assertFalse(game.man_on("third"))
+        self.assertTrue(game.features_team("Red Sox"))
+
+    def test_version(self):
+        config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
+        unchanged = _feed()
+        changed = _feed()
+        changed["liveData"]["linescore"]["balls"] = 3
+
+        with patch("data.game.statsapi.get", side_effect=[_feed(), unchanged, changed]), patch.object(
+            data.game.Game, "print_game_data_debug"
+        ):
+            game = data.game.Game.from_scheduled({"game_id": 1, "game_date": "2024-06-01"}, config)
+            self.assertEqual(game.version, 1)
+            views = GameViews(game, game.version, "%H")
+            scoreboard = views.scoreboard
+            self.assertIs(views.scoreboard, scoreboard)
+
+            game.update(force=True, testing_params={"timecode": "a"})
+            self.assertEqual(game.version, 1)
+
+            game.update(force=True, testing_params={"timecode": "b"})
+            self.assertEqual(game.version, 2)
+            self.assertEqual(GameViews(game, game.version, "%H").scoreboard.pitches.balls, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests for bullpen.http, the shared connection pool used for Stats API requests.
+
+No network access is needed; the session's `get` is mocked.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest.mock import MagicMock, patch
+
+import requests
+import statsapi
+
+from bullpen import clock, http
+from bullpen.clock import VirtualClock
+
+
+class TestHttp(unittest.TestCase):
+    def setUp(self):
+        self._original_requests = statsapi.requests
+        self._original_session = http._session
+        http._session = None
+
+    def tearDown(self):
+        statsapi.requests = self._original_requests
+        http._session = self._original_session
+        if http._recorder is not None:
+            http._recorder.close()
+        http._recorder = None
+        http._replayer = None
+        http.set_base_url(None)
+        clock.set_clock(None)
+
+    def test_session_is_shared(self):
+        self.assertIs(http.session(), http.session())
+
+    def test_statsapi_host_has_dedicated_pool(self):
+        adapter = http.session().get_adapter(http.STATSAPI_HOST + "/api/v1/game/1/feed/live")
+        self.assertEqual(adapter._pool_maxsize, http.HOST_POOL_SIZES[http.STATSAPI_HOST])
+
+    def test_get_applies_default_timeout(self):
+        with patch.object(requests.Session, "get") as mock_get:
+            http.get("https://example.com")
+            mock_get.assert_called_once_with("https://example.com", timeout=http.TIMEOUT)
+
+            mock_get.reset_mock()
+            http.get("https://example.com", timeout=1)
+            mock_get.assert_called_once_with("https://example.com", timeout=1)
+
+    def test_install_routes_statsapi_through_session(self):
+        http.install({"User-Agent": "test"})
+        self.assertEqual(http.session().headers["User-Agent"], "test")
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"seasons": []}
+        with patch.object(requests.Session, "get", return_value=response) as mock_get:
+            result = statsapi.get("season", {"seasonId": 2024, "sportId": 1})
+
+        self.assertEqual(result, {"seasons": []})
+        mock_get.assert_called_once()
+        self.assertTrue(mock_get.call_args.args[0].startswith(http.STATSAPI_HOST))
+
+    def test_installed_shim_exposes_requests_module(self):
+        http.install()
+        self.assertIs(statsapi.requests.exceptions, requests.exceptions)
+
+    def test_record_and_replay(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "archive.jsonl.gz")
+        http.install()
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"seasons": [{"seasonId": "2024"}]}'
+        http.record(path)
+        with patch.object(requests.Session, "get", return_value=response):
+            recorded = statsapi.get("season", {"seasonId": 2024, "sportId": 1})
+        http._recorder.close()
+        http._recorder = None
+
+        http.replay(path)
+        with patch.object(requests.Session, "get") as mock_get:
+            self.assertEqual(statsapi.get("season", {"seasonId": 2024, "sportId": 1}), recorded)
+            with self.assertRaises(requests.HTTPError):
+                statsapi.get("season", {"seasonId": 2025, "sportId": 1})
+            mock_get.assert_not_called()
+
+    def test_replay_runs_at_the_recorded_time(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "archive.jsonl.gz")
+        http.install()
+
+        recorded_clock = VirtualClock(datetime(2024, 6, 1, 12, 30), speed=0)
+        clock.set_clock(recorded_clock)
+        http.record(path)
+        for inning in (1, 2):
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b'{"inning": %d}' % inning
+            with patch.object(requests.Session, "get", return_value=response):
+                statsapi.get("game", {"gamePk": 1})
+            recorded_clock.advance(600)
+        http._recorder.close()
+        http._recorder = None
+        clock.set_clock(None)
+
+        http.replay(path)
+        self.assertEqual(clock.today(), date(2024, 6, 1))
+        self.assertEqual(statsapi.get("game", {"gamePk": 1}), {"inning": 1})
+
+    def test_base_url(self):
+        http.install()
+        http.set_base_url("http://localhost:8080/")
+
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"seasons": []}
+        with patch.object(requests.Session, "get", return_value=response) as mock_get:
+            statsapi.get("season", {"seasonId": 2024, "sportId": 1})
+            http.get("https://example.com")
+
+        self.assertTrue(mock_get.call_args_list[0].args[0].startswith("http://localhost:8080/api/v1/seasons/2024"))
+        self.assertEqual(mock_get.call_args_list[1].args[0], "https://example.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+Tests for applying incremental game updates.
+
+statsapi is mocked here so the patch and fallback logic can be exercised without the network.
+"""
+
+import copy
+import unittest
+from collections import namedtuple
+from unittest.mock import patch
+
+import requests
+
+import data.game
+from bullpen.api import UpdateStatus
+from data.utils.json_patch import JsonPatchError, apply_patch
+from tests.helpers import make_game_feed
+
+MockConfig = namedtuple("MockConfig", ["sync_delay_seconds", "api_refresh_rate", "uniform_types"])
+
+
+class TestApplyPatch(unittest.TestCase):
+    def test_operations(self):
+        doc = {"a": {"b": 1, "c": [1, 2, 3]}, "d": "x"}
+        result = apply_patch(
+            doc,
+            [
+                {"op": "replace", "path": "/a/b", "value": 2},
+                {"op": "add", "path": "/a/c/-", "value": 4},
+                {"op": "remove", "path": "/a/c/0"},
+                {"op": "add", "path": "/e", "value": {"f": True}},
+                {"op": "move", "from": "/d", "path": "/a/d"},
+                {"op": "copy", "from": "/e", "path": "/g"},
+                {"op": "test", "path": "/a/b", "value": 2},
+            ],
+        )
+        self.assertEqual(result, {"a": {"b": 2, "c": [2, 3, 4], "d": "x"}, "e": {"f": True}, "g": {"f": True}})
+
+    def test_original_is_not_modified(self):
+        doc = {"a": {"b": [1, 2]}, "untouched": {"x": 1}}
+        original = copy.deepcopy(doc)
+
+        result = apply_patch(doc, [{"op": "add", "path": "/a/b/0", "value": 0}])
+
+        self.assertEqual(doc, original)
+        self.assertEqual(result["a"]["b"], [0, 1, 2])
+        self.assertIs(result["untouched"], doc["untouched"])
+
+    def test_escaped_pointer(self):
+        result = apply_patch({"a/b": {"~c": 1}}, [{"op": "replace", "path": "/a~1b/~0c", "value": 2}])
+        self.assertEqual(result, {"a/b": {"~c": 2}})
+
+    def test_filtered_paths_are_skipped(self):
+        doc = {"gameData": {"status": "Live"}}
+        result = apply_patch(
+            doc,
+            [
+                {"op": "add", "path": "/liveData/plays/allPlays/0", "value": {}},
+                {"op": "replace", "path": "/gameData/venue", "value": "Somewhere"},
+                {"op": "remove", "path": "/gameData/officials"},
+                {"op": "replace", "path": "/gameData/status", "value": "Final"},
+            ],
+        )
+        self.assertEqual(result, {"gameData": {"status": "Final"}})
+
+    def test_filtered_keys_are_not_added(self):
+        def keep(key):
+            return key in ("gameData", "status", "players", "id")
+
+        doc = {"gameData": {"status": "Live", "players": {}}}
+        result = apply_patch(
+            doc,
+            [
+                {"op": "add", "path": "/gameData/venue", "value": {"id": 1}},
+                {"op": "add", "path": "/gameData/players/id", "value": {"id": 2, "fullName": "Someone"}},
+                {"op": "replace", "path": "/gameData/status", "value": "Final"},
+            ],
+            keep=keep,
+        )
+        self.assertEqual(result, {"gameData": {"status": "Final", "players": {"id": {"id": 2}}}})
+
+    def test_missing_kept_key_raises(self):
+        keep = {"gameData", "status", "players"}.__contains__
+        with self.assertRaises(JsonPatchError):
+            apply_patch({"gameData": {}}, [{"op": "replace", "path": "/gameData/status/code", "value": "F"}], keep)
+        # but a key we don't keep is still skipped
+        self.assertEqual(
+            apply_patch({"gameData": {}}, [{"op": "replace", "path": "/gameData/venue/id", "value": 1}], keep),
+            {"gameData": {}},
+        )
+
+    def test_mismatched_patch_raises(self):
+        for operation in [
+            {"op": "replace", "path": "/a/5", "value": 1},
+            {"op": "add", "path": "/a/5", "value": 1},
+            {"op": "add", "path": "/a/x", "value": 1},
+            {"op": "add", "path": "/b/c", "value": 1},
+            {"op": "test", "path": "/b", "value": 2},
+            {"op": "frobnicate", "path": "/b"},
+        ]:
+            with self.subTest(operation=operation), self.assertRaises(JsonPatchError):
+                apply_patch({"a": [0], "b": 1}, [operation])
+
+
+def _feed(timestamp, balls):
+    return make_game_feed(timestamp=timestamp, balls=balls)
+
+
+def _diff(timestamp, balls):
+    return {
+        "diff": [
+            {"op": "replace", "path": "/liveData/linescore/balls", "value": balls},
+            {"op": "replace", "path": "/metaData/timeStamp", "value": timestamp},
+        ]
+    }
+
+
+class TestIncrementalGameUpdate(unittest.TestCase):
+    def setUp(self):
+        self.config = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
+        # the debug output needs a complete game feed
+        debug = patch.object(data.game.Game, "print_game_data_debug")
+        debug.start()
+        self.addCleanup(debug.stop)
+
+    def _game(self, responses, updates):
+        with patch("data.game.statsapi.get", side_effect=responses) as mock_get:
+            game = data.game.Game(1, "2024-06-01", [], "", self.config)
+            for _ in range(updates):
+                self.assertEqual(game.update(force=True), UpdateStatus.SUCCESS)
+        return game, [c.args[0] for c in mock_get.call_args_list]
+
+    def test_updates_are_patched(self):
+        game, endpoints = self._game([_feed("20240601_200000", 0), [_diff("20240601_200010", 1)], []], 3)
+
+        self.assertEqual(endpoints, ["game", "game_diff", "game_diff"])
+        self.assertEqual(game.balls(), 1)
+        self.assertEqual(game._latest_data["metaData"]["timeStamp"], "20240601_200010")
+
+    def test_falls_back_to_full_fetch(self):
+        broken = {"diff": [{"op": "remove", "path": "/liveData/linescore/balls/0"}]}
+        game, endpoints = self._game(
+            [_feed("20240601_200000", 0), [broken], _feed("20240601_200010", 2), {"full": "feed"}, _feed("t", 3)], 3
+        )
+
+        self.assertEqual(endpoints, ["game", "game_diff", "game", "game_diff", "game"])
+        self.assertEqual(game.balls(), 3)
+
+    def test_falls_back_when_diff_request_fails(self):
+        game, endpoints = self._game(
+            [
+                _feed("20240601_200000", 0),
+                requests.HTTPError("503 Server Error"),
+                _feed("20240601_200010", 1),
+                ValueError("Expecting value"),
+                _feed("20240601_200020", 2),
+            ],
+            3,
+        )
+
+        self.assertEqual(endpoints, ["game", "game_diff", "game", "game_diff", "game"])
+        self.assertEqual(game.balls(), 2)
+
+    def test_patches_keep_to_api_fields(self):
+        diff = {
+            "diff": [
+                {"op": "add", "path": "/gameData/venue", "value": {"id": 3, "name": "Fenway Park"}},
+                {
+                    "op": "add",
+                    "path": "/gameData/players",
+                    "value": {"ID123": {"id": 123, "fullName": "A Player", "birthDate": ""}},
+                },
+            ]
+        }
+        game, _ = self._game([_feed("20240601_200000", 0), [diff]], 2)
+
+        self.assertNotIn("venue", game._latest_data["gameData"])
+        self.assertEqual(game._latest_data["gameData"]["players"], {"ID123": {"id": 123, "fullName": "A Player"}})
+
+    def test_testing_params_always_fetch_in_full(self):
+        with patch("data.game.statsapi.get", side_effect=[_feed("a", 0), _feed("b", 1)]) as mock_get:
+            game = data.game.Game(1, "2024-06-01", [], "", self.config)
+            game.update(force=True)
+            game.update(force=True, testing_params={"timecode": "b"})
+
+        self.assertEqual([c.args[0] for c in mock_get.call_args_list], ["game", "game"])
+        self.assertEqual(game.balls(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests for off-screen layers and the cached team banner.
+
+These draw on the emulator's canvas.
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from data.config.color import Color
+from data.config.layout import Layout
+from data.scoreboard.team import Team
+from driver import RGBMatrix, RGBMatrixOptions, graphics
+from renderers.games import teams
+from renderers.layer import LAYER_GRAPHICS, Layer
+
+WHITE = graphics.Color(255, 255, 255)
+RED = graphics.Color(255, 0, 0)
+
+
+def _pixels(canvas):
+    return canvas._Canvas__pixels
+
+
+class TestLayer(unittest.TestCase):
+    def setUp(self):
+        options = RGBMatrixOptions()
+        options.cols = 64
+        options.rows = 32
+        self.matrix = RGBMatrix(options=options)
+
+    def test_matches_graphics(self):
+        font = Layout({"defaults": {"font_name": "5x7"}}, 64, 32).font("anything")["font"]
+
+        expected = self.matrix.CreateFrameCanvas()
+        graphics.DrawLine(expected, 0, 3, 63, 3, RED)
+        graphics.DrawLine(expected, 2, 30, 40, 12, RED)
+        width = graphics.DrawText(expected, font, -2, 20, WHITE, "Layered text")
+
+        layer = Layer(64, 32)
+        LAYER_GRAPHICS.DrawLine(layer, 0, 3, 63, 3, RED)
+        LAYER_GRAPHICS.DrawLine(layer, 2, 30, 40, 12, RED)
+        self.assertEqual(LAYER_GRAPHICS.DrawText(layer, font, -2, 20, WHITE, "Layered text"), width)
+        actual = self.matrix.CreateFrameCanvas()
+        layer.draw(actual)
+
+        np.testing.assert_array_equal(_pixels(actual), _pixels(expected))
+
+    def test_transparent_where_not_drawn(self):
+        layer = Layer(64, 32)
+        for y in range(4, 8):
+            LAYER_GRAPHICS.DrawLine(layer, 0, y, 63, y, RED)
+        LAYER_GRAPHICS.DrawLine(layer, 10, 20, 20, 20, WHITE)
+
+        canvas = self.matrix.CreateFrameCanvas()
+        canvas.Fill(0, 0, 255)
+        layer.draw(canvas)
+
+        self.assertEqual(len(layer.blocks()), 2)
+        self.assertEqual(tuple(_pixels(canvas)[5, 30]), (255, 0, 0))
+        self.assertEqual(tuple(_pixels(canvas)[20, 15]), (255, 255, 255))
+        self.assertEqual(tuple(_pixels(canvas)[20, 25]), (0, 0, 255))
+        self.assertEqual(tuple(_pixels(canvas)[10, 30]), (0, 0, 255))
+
+
+class TestTeamBanner(unittest.TestCase):
+    def setUp(self):
+        options = RGBMatrixOptions()
+        options.cols = 64
+        options.rows = 32
+        self.matrix = RGBMatrix(options=options)
+        with open("coordinates/w64h32.example.json") as f:
+            self.layout = Layout(json.load(f), 64, 32)
+        with open("colors/teams.example.json") as f:
+            self.colors = Color(json.load(f))
+        teams._banners.clear()
+
+    def render(self, home_runs):
+        canvas = self.matrix.CreateFrameCanvas()
+        home = Team("NYY", home_runs, "Yankees", 5, 0, {"wins": 10, "losses": 3}, None)
+        away = Team("BOS", 2, "Red Sox", 4, 1, {"wins": 8, "losses": 5}, None)
+        teams.render_team_banner(canvas, self.layout, self.colors, home, away, True)
+        return _pixels(canvas)
+
+    def test_banner_is_cached(self):
+        with patch.object(Layer, "draw", autospec=True, side_effect=Layer.draw) as draw:
+            first = self.render(3)
+            self.render(3)
+            self.assertEqual(len(teams._banners), 1)
+            changed = self.render(4)
+            self.assertEqual(len(teams._banners), 2)
+            self.assertEqual(draw.call_count, 3)
+
+        self.assertTrue(first.any())
+        self.assertFalse(np.array_equal(first, changed))
+
+
+if __name__ == "__main__":
+    unittest.main()
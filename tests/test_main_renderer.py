@@ -0,0 +1,122 @@
+"""
+Tests for skipping frames that would look the same as the last one.
+
+The matrix, data and screens are all mocked here.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import bullpen.api as api
+from renderers.main import IDLE_FRAME_PERIOD, MainRenderer
+
+
+class StaticRenderer(api.PluginRenderer):
+    def __init__(self):
+        self.renders = 0
+
+    def wait_time(self):
+        return 0
+
+    def render(self, data, canvas, graphics, scrolling_text_pos):
+        self.renders += 1
+        return None
+
+    def fingerprint(self, data, scrolling_text_pos):
+        return data
+
+
+class TestFrameSkipping(unittest.TestCase):
+    def setUp(self):
+        self.matrix = MagicMock()
+        self.matrix.CreateFrameCanvas.return_value.width = 64
+        self.matrix.CreateFrameCanvas.return_value.height = 32
+        self.matrix.SwapOnVSync.return_value = self.matrix.CreateFrameCanvas.return_value
+        self.data = MagicMock()
+        self.data.network_issues = False
+        self.data.config.layout.state = None
+        self.data.config.rotation_scroll_until_finished = False
+        self.data.config.scrolling_speed = 0.1
+        self.data.config.layout.coords.return_value = {"x": 0, "width": 64}
+        self.data.config.scoreboard_colors.color.return_value = {"r": 0, "g": 0, "b": 0}
+
+        for patcher in [
+            patch("renderers.main.GameViews"),
+            patch("renderers.main.teams.render_team_banner"),
+            patch("renderers.main.postgamerender.render_postgame", return_value=None),
+            patch("renderers.main.network.render_network_error"),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.game = MagicMock(game_id=1, version=1)
+        self.game.status.return_value = "Final"
+
+    def test_static_game_is_drawn_once(self):
+        renderer = MainRenderer(self.matrix, self.data, {})
+        draw = renderer._MainRenderer__draw_game
+
+        draw(self.game)
+        draw(self.game)
+        self.assertEqual(self.matrix.SwapOnVSync.call_count, 1)
+
+        self.game.version = 2
+        draw(self.game)
+        self.assertEqual(self.matrix.SwapOnVSync.call_count, 2)
+
+        self.data.network_issues = True
+        draw(self.game)
+        draw(self.game)
+        self.assertEqual(self.matrix.SwapOnVSync.call_count, 3)
+
+    def test_text_that_fits_settles(self):
+        renderer = MainRenderer(self.matrix, self.data, {})
+        draw = renderer._MainRenderer__draw_game
+
+        # the final screen's text fits, so is drawn in place wherever the scrolling position is
+        with patch("renderers.main.postgamerender.render_postgame", return_value=0):
+            for _ in range(200):
+                draw(self.game)
+
+        # one full cycle of scrolling, then nothing
+        self.assertTrue(renderer.text_settled)
+        self.assertLess(self.matrix.SwapOnVSync.call_count, 100)
+        self.assertEqual(renderer.next_redraw, IDLE_FRAME_PERIOD)
+
+        # until the data changes
+        self.game.version = 2
+        with patch("renderers.main.postgamerender.render_postgame", return_value=100):
+            for _ in range(200):
+                draw(self.game)
+        self.assertFalse(renderer.text_settled)
+        self.assertEqual(renderer.next_redraw, 0.1)
+
+    def test_new_text_moves_straight_away(self):
+        renderer = MainRenderer(self.matrix, self.data, {})
+        draw = renderer._MainRenderer__draw_game
+
+        with patch("renderers.main.postgamerender.render_postgame", return_value=0):
+            for _ in range(200):
+                draw(self.game)
+        self.assertEqual(renderer.next_redraw, IDLE_FRAME_PERIOD)
+
+        # the first frame with text to scroll is already on the scrolling schedule
+        self.game.version = 2
+        with patch("renderers.main.postgamerender.render_postgame", return_value=100):
+            draw(self.game)
+        self.assertEqual(renderer.next_redraw, 0.1)
+
+    def test_static_plugin_is_drawn_once(self):
+        plugin = StaticRenderer()
+        renderer = MainRenderer(self.matrix, self.data, {"static": plugin})
+        self.data.plugin_data = {"static": "unchanged"}
+
+        frames = iter([True] * 3 + [False])
+        renderer._MainRenderer__draw_plugin_screen("static", lambda: next(frames))
+
+        self.assertEqual(plugin.renders, 1)
+        self.assertEqual(self.matrix.SwapOnVSync.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+"""
+Tests for drawing the news plugin's weather icon, and for when its screen is redrawn.
+
+The weather and headlines are filled in by hand, so nothing is fetched.
+"""
+
+import unittest
+from datetime import datetime
+from importlib.resources import files
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from bullpen import clock
+from bullpen.clock import VirtualClock
+from driver import RGBMatrix, RGBMatrixOptions, graphics
+from mlb_led_scoreboard_news.config import Config as NewsConfig
+from mlb_led_scoreboard_news.data import NewsData
+from mlb_led_scoreboard_news.headlines import Headlines
+from mlb_led_scoreboard_news.renderer import Renderer, _prepare_icon
+from mlb_led_scoreboard_news.weather import Weather, _load_icon
+from tests.helpers import make_test_config
+
+ICON_NAMES = sorted(
+    icon.name[:-4] for icon in files("mlb_led_scoreboard_news.icons").iterdir() if icon.name.endswith(".png")
+)
+
+
+def _draw_icon_pixel_by_pixel(canvas, weather_icon, x, y, scale, color):
+    """How icons were drawn before they were prepared, for comparison"""
+    if scale != 1:
+        weather_icon = weather_icon.resize((weather_icon.width * scale, weather_icon.height * scale), Image.NEAREST)
+    for dx in range(weather_icon.width):
+        for dy in range(weather_icon.height):
+            if weather_icon.getpixel((dx, dy))[3] > 0:
+                canvas.SetPixel(x + dx, y + dy, color["r"], color["g"], color["b"])
+
+
+class NewsTestCase(unittest.TestCase):
+    def setUp(self):
+        clock.set_clock(VirtualClock(datetime(2024, 6, 14, 19, 5), speed=0))
+        self.addCleanup(clock.set_clock, None)
+
+        config = make_test_config()
+        news_config = NewsConfig(config.for_plugin("news"))
+        self.renderer = Renderer(
+            news_config, config.layout.for_plugin("news"), config.scoreboard_colors.for_plugin("news")
+        )
+
+        with patch.object(Weather, "update"), patch.object(Headlines, "update"):
+            self.data = NewsData(news_config)
+        self.data.weather.temp = 74.3
+        self.data.weather.wind_speed = 9.2
+        self.data.weather.wind_dir = 225
+        self.data.weather.conditions = "Clouds"
+        self.data.weather.icon_name = "03d"
+        self.data.headlines.ticker = "Yankees win"
+
+        options = RGBMatrixOptions()
+        options.cols = config.layout.width
+        options.rows = config.layout.height
+        self.matrix = RGBMatrix(options=options)
+
+    def canvas(self):
+        canvas = self.matrix.CreateFrameCanvas()
+        bg = self.renderer.bg
+        canvas.Fill(bg.red, bg.green, bg.blue)
+        return canvas
+
+
+class TestWeatherIcon(NewsTestCase):
+    def test_prepared_icon_matches_drawing_it_pixel_by_pixel(self):
+        color, bg = self.renderer.icon_color, self.renderer.bg
+        for name in ICON_NAMES:
+            for scale in (1, 2):
+                with self.subTest(icon=name, scale=scale):
+                    expected, actual = self.canvas(), self.canvas()
+                    _draw_icon_pixel_by_pixel(expected, _load_icon(name), 3, 2, scale, color)
+                    actual.SetImage(_prepare_icon(_load_icon(name), scale, color, bg), 3, 2)
+                    np.testing.assert_array_equal(actual._Canvas__pixels, expected._Canvas__pixels)
+
+    def test_icon_drawn_first_matches_icon_drawn_last(self):
+        actual = self.canvas()
+        self.renderer.render(self.data, actual, graphics, actual.width)
+
+        # the text drawn first and the icon on top of it, as it used to be
+        expected = self.canvas()
+        with patch.object(Renderer, "_render_weather_icon"):
+            self.renderer.render(self.data, expected, graphics, expected.width)
+        coords = self.renderer.icon_coords
+        _draw_icon_pixel_by_pixel(
+            expected,
+            self.data.weather.icon(),
+            coords["x"],
+            coords["y"],
+            coords.get("rescale_icon") or 1,
+            self.renderer.icon_color,
+        )
+
+        np.testing.assert_array_equal(actual._Canvas__pixels, expected._Canvas__pixels)
+
+    def test_icons_are_loaded_and_prepared_once(self):
+        self.assertIs(self.data.weather.icon(), self.data.weather.icon())
+
+        canvas = self.canvas()
+        with patch("mlb_led_scoreboard_news.renderer._prepare_icon", wraps=_prepare_icon) as prepare:
+            for _ in range(3):
+                self.renderer.render(self.data, canvas, graphics, canvas.width)
+        self.assertEqual(prepare.call_count, 1)
+
+
+class TestNewsRedraws(NewsTestCase):
+    def test_unchanged_frame_has_the_same_fingerprint(self):
+        self.assertEqual(self.renderer.fingerprint(self.data, 20), self.renderer.fingerprint(self.data, 20))
+
+    def test_scrolling_changes_the_fingerprint(self):
+        self.assertNotEqual(self.renderer.fingerprint(self.data, 20), self.renderer.fingerprint(self.data, 19))
+
+    def test_clock_changes_the_fingerprint_once_a_minute(self):
+        fingerprint = self.renderer.fingerprint(self.data, 20)
+
+        clock.sleep(59)
+        self.assertEqual(self.renderer.fingerprint(self.data, 20), fingerprint)
+
+        clock.sleep(1)
+        self.assertNotEqual(self.renderer.fingerprint(self.data, 20), fingerprint)
+
+    def test_new_weather_changes_the_fingerprint(self):
+        fingerprint = self.renderer.fingerprint(self.data, 20)
+
+        self.data.weather.temp = 75.1
+        self.assertNotEqual(self.renderer.fingerprint(self.data, 20), fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
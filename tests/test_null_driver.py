@@ -0,0 +1,111 @@
+"""
+Tests for the headless display driver.
+
+Its drawing must match the emulator's pixel for pixel.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import driver
+from driver import RGBMatrix, RGBMatrixOptions, graphics
+from driver.mode import DriverMode
+from driver.null import RGBMatrix as NullMatrix, RGBMatrixOptions as NullOptions, graphics as null_graphics
+from driver.null import instruments
+
+TEXT = "Due Up: Judge, Soto \N{SNOWMAN}"
+
+
+def _draw(graphics, canvas, font):
+    white = graphics.Color(255, 255, 255)
+    red = graphics.Color(255, 0, 0)
+    width = graphics.DrawText(canvas, font, -3, 20, white, TEXT)
+    graphics.DrawLine(canvas, 0, 2, 63, 2, red)
+    graphics.DrawLine(canvas, 40, 30, 2, 10, red)
+    graphics.DrawCircle(canvas, 50, 16, 6, white)
+    return width
+
+
+class TestNullDriver(unittest.TestCase):
+    def setUp(self):
+        instruments.reset()
+        self.addCleanup(instruments.reset)
+
+    def matrices(self):
+        options = RGBMatrixOptions()
+        options.cols = 64
+        options.rows = 32
+        null_options = NullOptions()
+        null_options.cols = 64
+        null_options.rows = 32
+        return RGBMatrix(options=options), NullMatrix(options=null_options)
+
+    def test_matches_emulator(self):
+        emulated, null = self.matrices()
+        for font_name in ["4x6", "5x7", "6x10", "10x20"]:
+            with self.subTest(font=font_name):
+                path = f"assets/fonts/patched/{font_name}.bdf"
+                font, null_font = graphics.Font(), null_graphics.Font()
+                font.LoadFont(path)
+                null_font.LoadFont(path)
+                self.assertEqual((null_font.height, null_font.baseline), (font.height, font.baseline))
+
+                expected = emulated.CreateFrameCanvas()
+                actual = null.CreateFrameCanvas()
+                self.assertEqual(_draw(null_graphics, actual, null_font), _draw(graphics, expected, font))
+                np.testing.assert_array_equal(actual.pixels, expected._Canvas__pixels)
+
+    def test_instruments(self):
+        _, null = self.matrices()
+        canvas = null.CreateFrameCanvas()
+        canvas.Fill(1, 2, 3)
+        self.assertFalse(instruments.calls)
+
+        instruments.counting = True
+        instruments.capturing = True
+        self.addCleanup(setattr, instruments, "counting", False)
+        self.addCleanup(setattr, instruments, "capturing", False)
+
+        null_graphics.DrawLine(canvas, 0, 0, 5, 5, null_graphics.Color(9, 9, 9))
+        canvas.SetImage(Image.new("RGB", (4, 4), (7, 7, 7)), 60, 30)
+        next_canvas = null.SwapOnVSync(canvas)
+
+        self.assertIsNot(next_canvas, canvas)
+        self.assertEqual(instruments.calls, {"DrawLine": 1, "SetImage": 1, "SwapOnVSync": 1})
+        self.assertEqual(len(instruments.frames), 1)
+        self.assertEqual(tuple(instruments.frames[0][3, 3]), (9, 9, 9))
+        self.assertEqual(tuple(instruments.frames[0][31, 63]), (7, 7, 7))
+        self.assertEqual(tuple(instruments.frames[0][10, 0]), (1, 2, 3))
+
+    def test_driver_mode(self):
+        self.addCleanup(driver.set_mode, driver.mode)
+        driver.set_mode(DriverMode.HEADLESS)
+        self.assertTrue(driver.is_headless())
+        self.assertFalse(driver.is_emulated())
+        self.assertIs(driver.RGBMatrix, NullMatrix)
+
+    def test_only_imported_when_used(self):
+        # in a fresh interpreter, since this one has already imported it
+        code = "import sys, unittest, driver; print('driver.null' in sys.modules)"
+        root = Path(__file__).resolve().parent.parent
+        with tempfile.TemporaryDirectory() as directory:
+            result = subprocess.run(
+                [sys.executable, "-c", code],
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": str(root)},
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
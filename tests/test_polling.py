@@ -0,0 +1,82 @@
+"""
+Tests for choosing when games and the schedule are fetched again.
+"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from data import polling
+
+NOW = datetime(2024, 6, 1, 18, 0, tzinfo=timezone.utc)
+
+
+def _feed(abstract, detailed, start=NOW, inning_state="Top", wait=None):
+    feed = {
+        "gameData": {
+            "status": {"abstractGameState": abstract, "detailedState": detailed},
+            "datetime": {"dateTime": start.isoformat().replace("+00:00", "Z")},
+        },
+        "liveData": {"linescore": {"inningState": inning_state}},
+        "metaData": {},
+    }
+    if wait is not None:
+        feed["metaData"]["wait"] = wait
+    return feed
+
+
+def _scheduled(detailed, start=NOW):
+    return {"status": detailed, "game_datetime": start.isoformat().replace("+00:00", "Z")}
+
+
+class TestGamePolling(unittest.TestCase):
+    def test_pregame(self):
+        far = _feed("Preview", "Scheduled", start=NOW + timedelta(hours=5))
+        self.assertEqual(polling.next_game_update(far, 10, NOW), polling.IDLE_REFRESH_RATE)
+
+        # wakes up right as the game enters the pregame window
+        soon = _feed("Preview", "Scheduled", start=NOW + timedelta(minutes=65))
+        self.assertEqual(polling.next_game_update(soon, 10, NOW), 5 * 60)
+
+        near = _feed("Preview", "Pre-Game", start=NOW + timedelta(minutes=20))
+        self.assertEqual(polling.next_game_update(near, 10, NOW), polling.PREGAME_REFRESH_RATE)
+
+    def test_live(self):
+        self.assertEqual(polling.next_game_update(_feed("Live", "In Progress"), 10, NOW), 10)
+        self.assertEqual(polling.next_game_update(_feed("Live", "In Progress", wait=15), 10, NOW), 15)
+        self.assertEqual(polling.next_game_update(_feed("Live", "In Progress", wait=5), 10, NOW), 10)
+
+    def test_inning_break(self):
+        feed = _feed("Live", "In Progress", inning_state="Middle")
+        self.assertEqual(polling.next_game_update(feed, 10, NOW), polling.INNING_BREAK_REFRESH_RATE)
+
+    def test_stalled(self):
+        self.assertEqual(polling.next_game_update(_feed("Live", "Delayed: Rain"), 10, NOW), 60)
+        self.assertEqual(polling.next_game_update(_feed("Final", "Game Over"), 10, NOW), 60)
+
+    def test_final(self):
+        self.assertIsNone(polling.next_game_update(_feed("Final", "Final"), 10, NOW))
+        self.assertIsNone(polling.next_game_update(_feed("Final", "Postponed: Rain"), 10, NOW))
+
+
+class TestSchedulePolling(unittest.TestCase):
+    def test_no_games(self):
+        self.assertEqual(polling.next_schedule_update([], NOW), polling.IDLE_REFRESH_RATE)
+
+    def test_live_game(self):
+        games = [_scheduled("Final"), _scheduled("In Progress")]
+        self.assertEqual(polling.next_schedule_update(games, NOW), polling.SCHEDULE_REFRESH_RATE)
+
+    def test_next_game_start(self):
+        games = [
+            _scheduled("Final"),
+            _scheduled("Scheduled", start=NOW + timedelta(hours=5)),
+            _scheduled("Scheduled", start=NOW + timedelta(minutes=70)),
+        ]
+        self.assertEqual(polling.next_schedule_update(games, NOW), 10 * 60)
+
+        games.append(_scheduled("Scheduled", start=NOW + timedelta(minutes=62)))
+        self.assertEqual(polling.next_schedule_update(games, NOW), 2 * 60)
+
+
+if __name__ == "__main__":
+    unittest.main()
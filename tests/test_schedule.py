@@ -51,3 +51,55 @@ class TestScheduleOffday(unittest.TestCase):
     def test_schedule_offday(self):
         self.assertEqual(self.schedule.num_games(), 0)
         self.assertIsNone(self.schedule.next_game())
+
+
+class TestParseSchedule(unittest.TestCase):
+    response = {
+        "dates": [
+            {
+                "date": "2024-06-01",
+                "games": [
+                    {
+                        "gamePk": 745000,
+                        "gameDate": "2024-06-01T17:05:00Z",
+                        "status": {"abstractGameState": "Live", "detailedState": "In Progress"},
+                        "teams": {
+                            "away": {"team": {"id": 147}, "score": 2},
+                            "home": {"team": {"id": 111}, "score": 3},
+                        },
+                        "linescore": {"currentInning": 6, "inningState": "Middle"},
+                        "broadcasts": [{"name": "FOX", "isNational": True}, {"name": "NESN", "isNational": False}],
+                        "seriesStatus": {"result": "NYY leads 1-0"},
+                        "content": {"media": {"freeGame": True}},
+                    },
+                    {
+                        "gamePk": 745001,
+                        "gameDate": "2024-06-01T23:10:00Z",
+                        "status": {"abstractGameState": "Preview", "detailedState": "Scheduled"},
+                        "teams": {"away": {"team": {"id": 120}}, "home": {"team": {"id": 158}}},
+                        "content": {},
+                    },
+                ],
+            }
+        ]
+    }
+
+    def test_parse_schedule(self):
+        live, scheduled = data.schedule.parse_schedule(self.response)
+
+        self.assertEqual(live["game_id"], 745000)
+        self.assertEqual(live["game_date"], "2024-06-01")
+        self.assertEqual(live["status"], "In Progress")
+        self.assertEqual(live["status_data"]["abstractGameState"], "Live")
+        self.assertEqual((live["away_id"], live["home_id"]), (147, 111))
+        self.assertEqual((live["away_score"], live["home_score"]), (2, 3))
+        self.assertEqual(live["inning_state"], "Middle")
+        self.assertEqual(live["national_broadcasts"], ["FOX", "MLB.tv Free Game"])
+        self.assertEqual(live["series_status"], "NYY leads 1-0")
+
+        self.assertEqual(scheduled["inning_state"], "")
+        self.assertEqual(scheduled["national_broadcasts"], [])
+        self.assertIsNone(scheduled["series_status"])
+
+    def test_parse_empty_schedule(self):
+        self.assertEqual(data.schedule.parse_schedule({"totalItems": 0, "dates": []}), [])
@@ -0,0 +1,86 @@
+"""
+Tests for the stand-in Stats API server used for load and soak testing.
+
+The server runs on a local port, and the scoreboard's own code fetches from it.
+"""
+
+import threading
+import unittest
+from collections import namedtuple
+from datetime import date
+from unittest.mock import patch
+
+import requests
+import statsapi
+
+from benchmarks import synthetic
+from benchmarks.server import Faults, StandIn, Synthetic, make_server
+from bullpen import http
+from bullpen.api import UpdateStatus
+from data.game import Game
+from data.schedule import fetch_schedule
+from data.uniforms import Uniforms
+
+MockConfig = namedtuple("MockConfig", ["sync_delay_seconds", "api_refresh_rate", "uniform_types"])
+CONFIG = MockConfig(sync_delay_seconds=0, api_refresh_rate=10, uniform_types={})
+
+
+class TestStandInServer(unittest.TestCase):
+    def serve(self, faults=Faults()):
+        self.source = Synthetic(date(2024, 6, 14), games=2)
+        self.stand_in = StandIn(self.source, faults)
+        server = make_server(self.stand_in, "127.0.0.1", 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        original_requests = statsapi.requests
+        http.install()
+        http.set_base_url(f"http://127.0.0.1:{server.server_port}")
+        self.addCleanup(setattr, statsapi, "requests", original_requests)
+        self.addCleanup(http.set_base_url, None)
+
+    def at(self, seconds):
+        return patch.object(self.source, "now", return_value=seconds)
+
+    def test_game_day(self):
+        self.serve()
+        with self.at(0):
+            schedule = fetch_schedule("2024-06-14")
+        self.assertEqual([game["status"] for game in schedule], ["Pre-Game", "Pre-Game"])
+
+        game = Game(schedule[0]["game_id"], "2024-06-14", [], "", CONFIG, Uniforms.from_known(0, None, None))
+        with self.at(0):
+            self.assertEqual(game.update(force=True), UpdateStatus.SUCCESS)
+        self.assertEqual(game.status(), "Pre-Game")
+
+        # later updates are patched onto the first
+        with self.at(synthetic.FIRST_PITCH + 45 * 60):
+            self.assertEqual(game.update(force=True), UpdateStatus.SUCCESS)
+        self.assertEqual(game.status(), "In Progress")
+        self.assertGreater(game.inning_number(), 1)
+
+        with self.at(24 * 60 * 60), patch("data.game.game_cache.save"):
+            self.assertEqual(game.update(force=True), UpdateStatus.SUCCESS)
+        self.assertEqual(game.status(), "Final")
+
+        endpoints = self.stand_in.stats.summary()["endpoints"]
+        self.assertEqual(endpoints["game"]["requests"], 1)
+        self.assertEqual(endpoints["game_diff"]["requests"], 2)
+
+    def test_injected_faults(self):
+        self.serve(Faults(error_rate=1.0))
+        with self.assertRaises(requests.HTTPError):
+            statsapi.get("season", {"sportId": 1, "seasonId": 2024})
+
+        self.stand_in.faults = Faults(partial_rate=1.0)
+        with self.assertRaises(ValueError):
+            statsapi.get("season", {"sportId": 1, "seasonId": 2024})
+
+        game = Game(800000, "2024-06-14", [], "", CONFIG, Uniforms.from_known(0, None, None))
+        with self.assertLogs("bullpen", level="ERROR"):
+            self.assertEqual(game.update(force=True), UpdateStatus.FAIL)
+
+
+if __name__ == "__main__":
+    unittest.main()
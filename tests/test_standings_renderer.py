@@ -0,0 +1,89 @@
+"""
+Tests for when the standings plugin's screen is redrawn.
+
+The standings are filled in by hand, so nothing is fetched, and drawing itself is mocked out.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from mlb_led_scoreboard_standings.config import Config as StandingsConfig
+from mlb_led_scoreboard_standings.renderer import Renderer
+from mlb_led_scoreboard_standings.standings import Division, Standings
+from tests.helpers import make_test_config
+
+
+def _division(name):
+    return Division({"division": {"nameShort": name}, "teamRecords": []})
+
+
+class TestStandingsRedraws(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("mlb_led_scoreboard_standings.renderer.render_standings")
+        self.render_standings = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make(self, cols):
+        config = make_test_config(led_cols=cols, led_rows=32)
+        standings_config = StandingsConfig(config.for_plugin("standings"))
+        standings_config.preferred_divisions = ["NL Central", "NL East"]
+        standings_config.is_postseason = lambda: False
+
+        with patch.object(Standings, "update"):
+            data = Standings(standings_config)
+        data.standings = [_division("NL Central"), _division("NL East")]
+
+        renderer = Renderer(
+            standings_config, config.layout.for_plugin("standings"), config.scoreboard_colors.for_plugin("standings")
+        )
+        return renderer, data
+
+    def show(self, renderer, data, seconds):
+        """What is drawn, and when, over `seconds` of asking for a frame every `wait_time`, like the main loop"""
+        drawn = []
+        last = None
+        for second in range(seconds):
+            fingerprint = renderer.fingerprint(data, 0)
+            if fingerprint != last:
+                last = fingerprint
+                renderer.render(data, None, None, 0)
+                division, stat = self.render_standings.call_args.args[4:6]
+                drawn.append((second, division.name, stat))
+        return drawn
+
+    def test_pages_turn_while_unchanged_frames_are_skipped(self):
+        renderer, data = self.make(64)
+        self.assertEqual(renderer.wait_time(), 1)
+
+        drawn = self.show(renderer, data, 25)
+
+        self.assertEqual(drawn, [(0, "NL Central", "w"), (10, "NL East", "w"), (20, "NL Central", "w")])
+
+    def test_narrow_screens_turn_between_wins_and_losses(self):
+        renderer, data = self.make(32)
+
+        drawn = self.show(renderer, data, 20)
+
+        self.assertEqual(
+            drawn,
+            [(0, "NL Central", "w"), (5, "NL Central", "l"), (10, "NL East", "w"), (15, "NL East", "l")],
+        )
+
+    def test_new_standings_are_drawn(self):
+        renderer, data = self.make(64)
+        key = renderer.fingerprint(data, 0)
+
+        data.standings = [_division("NL Central"), _division("NL East")]
+
+        self.assertNotEqual(renderer.fingerprint(data, 0), key)
+
+    def test_reset_starts_from_the_same_page(self):
+        renderer, data = self.make(64)
+        self.show(renderer, data, 5)
+        renderer.reset()
+
+        self.assertEqual(self.show(renderer, data, 15), [(0, "NL Central", "w"), (10, "NL East", "w")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,12 @@
 from data.config.layout import Layout
 from data.scoreboard.team import Team
-from renderers.games.teams import can_use_full_team_names
+from renderers.games.teams import can_use_full_team_names, render_team_banner
+from renderers.framebuffer import FrameBuffer
+from tests.helpers import make_test_config
 
-import unittest, string, random
+import copy, unittest, string, random
+
+import numpy
 
 WIDTH = 32
 HEIGHT = 32
@@ -82,3 +86,23 @@ class TestCanUseFullTeamNames(unittest.TestCase):
         teams = [make_team(runs=5, hits=5, errors=5), make_team(runs=5, hits=5, errors=5)]
 
         self.assertTrue(can_use_full_team_names(layout, teams))
+
+
+class TestTeamBanner(unittest.TestCase):
+
+    def test_text_is_kept_to_the_team_background(self):
+        config = make_test_config()
+        layout_json = copy.deepcopy(config.layout.json)
+        for team in ("away", "home"):
+            layout_json["teams"]["background"][team]["width"] = 20
+        layout = Layout(layout_json, config.layout.width, config.layout.height)
+        canvas = FrameBuffer(layout.width, layout.height)
+
+        away = make_team("ARI", name="Diamondbacks", runs=5, hits=12, record={"wins": 40, "losses": 30})
+        home = make_team("LAD", name="Dodgers", runs=3, hits=7, record={"wins": 45, "losses": 25})
+        render_team_banner(canvas, layout, config.team_colors, home, away, show_score=True)
+
+        # nothing past the right edge of the backgrounds, where the long name and the score would be
+        self.assertFalse(canvas.pixels[:14, 21:].any())
+        # but the start of the name is still drawn, in a different color than the background
+        self.assertGreater(len(numpy.unique(canvas.pixels[:7, 4:21].reshape(-1, 3), axis=0)), 1)
@@ -0,0 +1,79 @@
+"""
+Tests for drawing scrolling text from pre-rendered strips.
+
+These draw on the emulator's canvas, and compare against its own DrawText.
+"""
+
+import unittest
+
+import numpy as np
+
+from bullpen import text
+from bullpen.util import scrolling_text
+from data.config.layout import Layout
+from driver import RGBMatrix, RGBMatrixOptions, graphics
+
+TEXT = "Pitcher McLongname: 5-3, 2.45 ERA"
+WHITE = graphics.Color(255, 255, 255)
+BLACK = graphics.Color(0, 0, 0)
+RED = graphics.Color(255, 0, 0)
+
+
+def _pixels(canvas):
+    return canvas._Canvas__pixels
+
+
+class TestScrollingText(unittest.TestCase):
+    def setUp(self):
+        options = RGBMatrixOptions()
+        options.cols = 64
+        options.rows = 32
+        self.matrix = RGBMatrix(options=options)
+
+    def test_matches_draw_text_inside_box(self):
+        for font_name in ["4x6", "5x7", "6x10", "10x20"]:
+            font = Layout({"defaults": {"font_name": font_name}}, 64, 32).font("anything")
+            for pos in [60, 30, 5, -20, -100]:
+                with self.subTest(font=font_name, pos=pos):
+                    expected = self.matrix.CreateFrameCanvas()
+                    graphics.DrawText(expected, font["font"], pos, 24, WHITE, TEXT)
+
+                    actual = self.matrix.CreateFrameCanvas()
+                    scrolling_text(actual, graphics, 10, 24, 40, font, WHITE, BLACK, TEXT, pos)
+
+                    np.testing.assert_array_equal(_pixels(actual)[:, 10:50], _pixels(expected)[:, 10:50])
+                    # and nothing outside it
+                    self.assertFalse(_pixels(actual)[:, :10].any())
+                    self.assertFalse(_pixels(actual)[:, 50:].any())
+
+    def test_draws_over_what_is_underneath(self):
+        font = Layout({"defaults": {"font_name": "5x7"}}, 64, 32).font("anything")
+        for pos in [30, 5, -20]:
+            with self.subTest(pos=pos):
+                expected = self.matrix.CreateFrameCanvas()
+                actual = self.matrix.CreateFrameCanvas()
+                for canvas in (expected, actual):
+                    canvas.Fill(0, 0, 255)
+                    for y in range(14, 20):
+                        graphics.DrawLine(canvas, 0, y, 63, y, RED)
+                graphics.DrawText(expected, font["font"], pos, 20, WHITE, TEXT)
+
+                scrolling_text(actual, graphics, 10, 20, 40, font, WHITE, BLACK, TEXT, pos)
+
+                np.testing.assert_array_equal(_pixels(actual)[:, 10:50], _pixels(expected)[:, 10:50])
+                self.assertTrue((_pixels(actual)[:14, :10] == (0, 0, 255)).all())
+                self.assertTrue((_pixels(actual)[14:20, 50:] == (255, 0, 0)).all())
+
+    def test_strips_are_reused(self):
+        font = Layout({"defaults": {"font_name": "4x6"}}, 64, 32).font("anything")
+        canvas = self.matrix.CreateFrameCanvas()
+        text.text_strip.cache_clear()
+
+        for pos in range(40, 0, -1):
+            scrolling_text(canvas, graphics, 0, 10, 32, font, WHITE, BLACK, TEXT, pos)
+
+        self.assertEqual(text.text_strip.cache_info().misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
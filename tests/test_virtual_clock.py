@@ -0,0 +1,90 @@
+"""
+Tests for bullpen.clock, which everything that depends on the time asks for it.
+
+Virtual clocks are used here, so nothing actually sleeps.
+"""
+
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+
+from bullpen import clock
+from bullpen.clock import SystemClock, VirtualClock
+from data.config import Config
+from data.schedule import Schedule
+
+
+class SimulatedConfig:
+    demo_date = None
+    end_of_day = "03:00"
+    sync_delay_seconds = 0
+    rotation_time_rules: list = []
+    rotation_game_rules: list = []
+
+    parse_today = Config.parse_today
+
+
+class TestVirtualClock(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(clock.set_clock, None)
+
+    def test_runs_faster_than_real_time(self):
+        # standing in for the real time
+        real = VirtualClock(50.0, speed=0)
+        virtual = VirtualClock(1000.0, speed=100, real_time=real.monotonic, real_sleep=real.sleep)
+        self.assertEqual(virtual.time(), 1000.0)
+
+        real.advance(1)
+        self.assertEqual(virtual.time(), 1100.0)
+
+        virtual.sleep(60)
+        self.assertAlmostEqual(real.monotonic(), 51.6)
+        self.assertAlmostEqual(virtual.time(), 1160.0)
+
+        virtual.advance(40)
+        self.assertAlmostEqual(virtual.time(), 1200.0)
+
+    def test_stopped_clock_moves_when_slept_on(self):
+        virtual = VirtualClock(datetime(2024, 6, 14, 12), speed=0)
+        start = virtual.time()
+        virtual.sleep(30)
+        self.assertEqual(virtual.time(), start + 30)
+        self.assertEqual(virtual.monotonic(), start + 30)
+
+    def test_set_clock(self):
+        clock.set_clock(VirtualClock(datetime(2024, 6, 14, 23, 59, 30), speed=0))
+        self.assertEqual(clock.today(), date(2024, 6, 14))
+        clock.sleep(30)
+        self.assertEqual(clock.now(), datetime(2024, 6, 15))
+
+        clock.set_clock(None)
+        self.assertIsInstance(clock.get_clock(), SystemClock)
+        self.assertEqual(clock.today(), date.today())
+
+    def test_end_of_day(self):
+        config = SimulatedConfig()
+        clock.set_clock(VirtualClock(datetime(2024, 6, 15, 2, 59), speed=0))
+        self.assertEqual(config.parse_today(), date(2024, 6, 14))
+        clock.sleep(60)
+        self.assertEqual(config.parse_today(), date(2024, 6, 15))
+
+    @patch("data.schedule.fetch_schedule", return_value=[])
+    def test_simulated_night(self, fetch_schedule):
+        clock.set_clock(VirtualClock(datetime(2024, 6, 14, 20), speed=0))
+        schedule = Schedule(SimulatedConfig())
+
+        # the data thread's loop, until the next morning
+        while clock.now() < datetime(2024, 6, 15, 9):
+            schedule.update()
+            clock.sleep(1)
+
+        fetched = [call.args[0] for call in fetch_schedule.call_args_list]
+        self.assertEqual(schedule.date, date(2024, 6, 15))
+        # with no games, the schedule is fetched every 10 minutes until it rolls over at the end of the day
+        self.assertEqual(fetched.count("2024-06-14"), 7 * 6)
+        self.assertEqual(fetched.index("2024-06-15"), 7 * 6)
+        self.assertEqual(fetched.count("2024-06-15"), 6 * 6)
+
+
+if __name__ == "__main__":
+    unittest.main()